@@ -38,6 +38,7 @@ router = APIRouter(prefix="/diff")
 
 @router.get("/data")
 async def get_diff_data(
+    request: Request,
     db: InfrahubDatabase = Depends(get_db),
     branch: Branch = Depends(get_branch_dep),
     time_from: Optional[str] = None,
@@ -46,6 +47,7 @@ async def get_diff_data(
     _: str = Depends(get_current_user),
 ) -> BranchDiff:
     query = DiffQueryValidated(branch=branch, time_from=time_from, time_to=time_to, branch_only=branch_only)
+    service: InfrahubServices = request.app.state.service
 
     diff = await BranchDiffer.init(
         db=db,
@@ -54,6 +56,7 @@ async def get_diff_data(
         diff_to=query.time_to,
         branch_only=query.branch_only,
         namespaces_exclude=["Schema"],
+        service=service,
     )
     schema = registry.schema.get_full(branch=branch)
     diff_payload_builder = DiffPayloadBuilder(db=db, diff=diff, kinds_to_include=list(schema.keys()))
@@ -62,6 +65,7 @@ async def get_diff_data(
 
 @router.get("/schema")
 async def get_diff_schema(
+    request: Request,
     db: InfrahubDatabase = Depends(get_db),
     branch: Branch = Depends(get_branch_dep),
     time_from: Optional[str] = None,
@@ -70,6 +74,8 @@ async def get_diff_schema(
     _: str = Depends(get_current_user),
 ) -> BranchDiff:
     query = DiffQueryValidated(branch=branch, time_from=time_from, time_to=time_to, branch_only=branch_only)
+    service: InfrahubServices = request.app.state.service
+
     diff = await BranchDiffer.init(
         db=db,
         branch=branch,
@@ -77,6 +83,7 @@ async def get_diff_schema(
         diff_to=query.time_to,
         branch_only=query.branch_only,
         kinds_include=INTERNAL_SCHEMA_NODE_KINDS,
+        service=service,
     )
     diff_payload_builder = DiffPayloadBuilder(db=db, diff=diff, kinds_to_include=INTERNAL_SCHEMA_NODE_KINDS)
     return await diff_payload_builder.get_branch_diff()
@@ -120,6 +127,7 @@ async def get_diff_files(
 # pylint: disable=too-many-branches
 @router.get("/artifacts")
 async def get_diff_artifacts(
+    request: Request,
     db: InfrahubDatabase = Depends(get_db),
     branch: Branch = Depends(get_branch_dep),
     time_from: Optional[str] = None,
@@ -128,6 +136,7 @@ async def get_diff_artifacts(
     _: str = Depends(get_current_user),
 ) -> Dict[str, BranchDiffArtifact]:
     response = {}
+    service: InfrahubServices = request.app.state.service
 
     default_branch_name = registry.default_branch
     # Query the Diff for all artifacts
@@ -139,6 +148,7 @@ async def get_diff_artifacts(
         branch_only=branch_only,
         kinds_include=[InfrahubKind.ARTIFACT],
         branch_support=[BranchSupportType.AWARE, BranchSupportType.LOCAL],
+        service=service,
     )
     diff_payload_builder = DiffPayloadBuilder(db=db, diff=diff, kinds_to_include=[InfrahubKind.ARTIFACT])
     payload = await diff_payload_builder.get_node_diffs_by_branch()
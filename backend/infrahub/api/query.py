@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict, List
 
 from fastapi import APIRouter, Body, Depends, Path, Query, Request
-from graphql import graphql
 from pydantic import BaseModel, Field
 
 from infrahub.api.dependencies import (
@@ -70,13 +69,7 @@ async def execute_query(
     }
 
     with GRAPHQL_DURATION_METRICS.labels(**labels).time():
-        result = await graphql(
-            schema=gql_params.schema,
-            source=gql_query.query.value,  # type: ignore[attr-defined]
-            context_value=gql_params.context,
-            root_value=None,
-            variable_values=params,
-        )
+        result = await analyzed_query.execute(context_value=gql_params.context, variable_values=params)
 
     data = extract_data(query_name=gql_query.name.value, result=result)  # type: ignore[attr-defined]
 
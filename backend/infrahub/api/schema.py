@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request
@@ -10,7 +11,7 @@ from pydantic import (
     create_model,
     model_validator,
 )
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 from infrahub import config, lock
 from infrahub.api.dependencies import get_branch_dep, get_current_user, get_db
@@ -81,6 +82,70 @@ class SchemaReadAPI(BaseModel):
     namespaces: List[SchemaNamespace] = Field(default_factory=list)
 
 
+class SchemaReadAPICache:
+    """Serialized responses of the schema read endpoint, per hash of the schema and namespaces filter.
+
+    The schema of a branch only changes with its hash, the response is generated once per hash and filter
+    and then served as is until it's evicted.
+    """
+
+    def __init__(self, max_size: int = 32) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[Tuple[str, Optional[Tuple[str, ...]]], bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, schema_branch: SchemaBranch, namespaces: Optional[List[str]] = None) -> bytes:
+        key = (schema_branch.get_hash(), tuple(sorted(namespaces)) if namespaces else None)
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        all_schemas = schema_branch.get_schemas_for_namespaces(namespaces=namespaces)
+        payload = SchemaReadAPI(
+            main=key[0],
+            nodes=[
+                APINodeSchema.from_schema(value)
+                for value in all_schemas
+                if isinstance(value, NodeSchema) and value.namespace != "Internal"
+            ],
+            generics=[
+                APIGenericSchema.from_schema(value)
+                for value in all_schemas
+                if isinstance(value, GenericSchema) and value.namespace != "Internal"
+            ],
+            profiles=[
+                APIProfileSchema.from_schema(value)
+                for value in all_schemas
+                if isinstance(value, ProfileSchema) and value.namespace != "Internal"
+            ],
+            namespaces=schema_branch.get_namespaces(),
+        )
+        self._entries[key] = payload.model_dump_json(by_alias=True).encode()
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        return self._entries[key]
+
+
+schema_read_cache = SchemaReadAPICache()
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Indicate if an ETag is part of the value of an If-None-Match header."""
+    if not if_none_match:
+        return False
+
+    for value in if_none_match.split(","):
+        candidate = value.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 class SchemaLoadAPI(SchemaRoot):
     version: str
 
@@ -134,34 +199,25 @@ def evaluate_candidate_schemas(
     return candidate_schema, result
 
 
-@router.get("")
-@router.get("/")
+@router.get("", response_model=SchemaReadAPI)
+@router.get("/", response_model=SchemaReadAPI)
 async def get_schema(
+    request: Request,
     branch: Branch = Depends(get_branch_dep),
     namespaces: Union[List[str], None] = Query(default=None),
-) -> SchemaReadAPI:
+) -> Response:
     log.debug("schema_request", branch=branch.name)
     schema_branch = registry.schema.get_schema_branch(name=branch.name)
-    all_schemas = schema_branch.get_schemas_for_namespaces(namespaces=namespaces)
-
-    return SchemaReadAPI(
-        main=registry.schema.get_schema_branch(name=branch.name).get_hash(),
-        nodes=[
-            APINodeSchema.from_schema(value)
-            for value in all_schemas
-            if isinstance(value, NodeSchema) and value.namespace != "Internal"
-        ],
-        generics=[
-            APIGenericSchema.from_schema(value)
-            for value in all_schemas
-            if isinstance(value, GenericSchema) and value.namespace != "Internal"
-        ],
-        profiles=[
-            APIProfileSchema.from_schema(value)
-            for value in all_schemas
-            if isinstance(value, ProfileSchema) and value.namespace != "Internal"
-        ],
-        namespaces=schema_branch.get_namespaces(),
+
+    # The hash of the schema is used as a strong ETag, clients can send back the hash they already have
+    etag = f'"{schema_branch.get_hash()}"'
+    if etag_matches(etag=etag, if_none_match=request.headers.get("if-none-match")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(
+        content=schema_read_cache.get(schema_branch=schema_branch, namespaces=namespaces),
+        media_type="application/json",
+        headers={"ETag": etag},
     )
 
 
@@ -230,6 +230,8 @@ def validate_mutation_permissions(operation: str, account_session: AccountSessio
         f"{InfrahubKind.ACCOUNT}Create": _validate_is_admin,
         f"{InfrahubKind.ACCOUNT}Delete": _validate_is_admin,
         f"{InfrahubKind.ACCOUNT}Upsert": _validate_is_admin,
+        f"{InfrahubKind.ACCOUNT}CreateMany": _validate_is_admin,
+        f"{InfrahubKind.ACCOUNT}UpsertMany": _validate_is_admin,
     }
     if validator := validation_map.get(operation):
         validator(account_session)
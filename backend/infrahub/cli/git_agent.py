@@ -16,6 +16,7 @@ from infrahub.core.initialization import initialization
 from infrahub.dependencies.registry import build_component_registry
 from infrahub.git import initialize_repositories_directory
 from infrahub.git.actions import sync_remote_repositories
+from infrahub.git.executor import python_execution_pool
 from infrahub.lock import initialize_lock
 from infrahub.log import get_logger
 from infrahub.services import InfrahubServices
@@ -24,6 +25,7 @@ from infrahub.services.adapters.cache.redis import RedisCache
 from infrahub.services.adapters.message_bus.nats import NATSMessageBus
 from infrahub.services.adapters.message_bus.rabbitmq import RabbitMQMessageBus
 from infrahub.trace import configure_trace
+from infrahub.webhook import webhook_dispatcher
 
 if TYPE_CHECKING:
     from infrahub.cli.context import CliContext
@@ -145,5 +147,9 @@ async def start(
 
     log.info("Shutdown of Git agent requested")
 
+    # The pending batches of webhook events are sent before the message bus is closed
+    await webhook_dispatcher.close()
+    # The worker processes still executing a transform or a check are stopped instead of being left behind
+    python_execution_pool.shutdown(terminate=True)
     await service.shutdown()
     log.info("All services stopped")
@@ -62,6 +62,11 @@ class CacheDriver(str, Enum):
     NATS = "nats"
 
 
+class PythonExecutionMode(str, Enum):
+    INLINE = "inline"
+    PROCESS_POOL = "process_pool"
+
+
 class MainSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="INFRAHUB_")
     docs_index_path: str = Field(
@@ -149,7 +154,12 @@ class DatabaseSettings(BaseSettings):
         default=5000,
         ge=1,
         le=20000,
-        description="The max number of records to fetch in a single query before performing internal pagination.",
+        description="The max number of records to fetch from the database in a single batch while reading the result of a query.",
+    )
+    write_batch_size: int = Field(
+        default=1000,
+        ge=1,
+        description="The max number of elements to write in a single query when changes are applied in bulk.",
     )
     max_depth_search_hierarchy: int = Field(
         default=5,
@@ -207,6 +217,16 @@ class CacheSettings(BaseSettings):
     tls_enabled: bool = Field(default=False, description="Indicates if TLS is enabled for the connection")
     tls_insecure: bool = Field(default=False, description="Indicates if TLS certificates are verified")
     tls_ca_file: Optional[str] = Field(default=None, description="File path to CA cert or bundle in PEM format")
+    diff_grace_period: int = Field(
+        default=300,
+        ge=0,
+        description="Number of seconds before the end of a cached diff that are recalculated when the diff is extended",
+    )
+    diff_max_size: int = Field(
+        default=900_000,
+        ge=0,
+        description="Maximum size in bytes of a diff stored in the cache, larger diffs are not cached",
+    )
 
     @property
     def service_port(self) -> int:
@@ -232,6 +252,21 @@ class ApiSettings(BaseSettings):
     cors_allow_credentials: bool = Field(
         default=True, description="If True, cookies will be allowed to be included in cross-site HTTP requests"
     )
+    graphql_schema_cache_size: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum number of generated GraphQL schemas shared between the branches with an identical schema",
+    )
+    graphql_document_cache_size: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum number of parsed and validated GraphQL queries kept in memory",
+    )
+    schema_history_cache_size: int = Field(
+        default=16,
+        ge=1,
+        description="Maximum number of past versions of the schema kept in memory for the queries with a time in the past",
+    )
 
 
 class GitSettings(BaseSettings):
@@ -240,6 +275,48 @@ class GitSettings(BaseSettings):
     sync_interval: int = Field(
         default=10, ge=0, description="Time (in seconds) between git repositories synchronizations"
     )
+    jinja2_template_cache_size: int = Field(
+        default=256, ge=1, description="Maximum number of compiled Jinja2 templates kept in memory by each git agent"
+    )
+    python_transform_cache_size: int = Field(
+        default=128,
+        ge=1,
+        description="Maximum number of loaded Python transform classes kept in memory by each git agent",
+    )
+    python_execution_mode: PythonExecutionMode = Field(
+        default=PythonExecutionMode.INLINE,
+        description="Execute the Python transforms and checks in the event loop of the git agent or in a pool of worker processes",
+    )
+    python_execution_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of worker processes in process_pool mode, defaults to the number of CPUs",
+    )
+    python_execution_timeout: int = Field(
+        default=300, ge=1, description="Time (in seconds) allowed for a Python transform or check in process_pool mode"
+    )
+
+
+class WebhookSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="INFRAHUB_WEBHOOK_")
+    max_concurrent_deliveries: int = Field(
+        default=10, ge=1, description="Maximum number of webhooks delivered at the same time by each git agent"
+    )
+    timeout: int = Field(default=10, ge=1, description="Time (in seconds) allowed to deliver a webhook")
+    max_retries: int = Field(
+        default=3, ge=0, description="Number of retries for a webhook delivery failing with a transient error"
+    )
+    retry_backoff: float = Field(
+        default=0.5, ge=0, description="Time (in seconds) before the first retry, doubled after each retry"
+    )
+    batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of events coalesced in a single delivery of a webhook (transform webhooks excepted), 1 disables the batching",
+    )
+    batch_interval: float = Field(
+        default=1.0, gt=0, description="Maximum time (in seconds) an event waits to be coalesced with other events"
+    )
 
 
 class InitialSettings(BaseSettings):
@@ -379,6 +456,10 @@ class ConfiguredSettings:
     def git(self) -> GitSettings:
         return self.active_settings.git
 
+    @property
+    def webhook(self) -> WebhookSettings:
+        return self.active_settings.webhook
+
     @property
     def database(self) -> DatabaseSettings:
         return self.active_settings.database
@@ -430,6 +511,7 @@ class Settings(BaseSettings):
     main: MainSettings = MainSettings()
     api: ApiSettings = ApiSettings()
     git: GitSettings = GitSettings()
+    webhook: WebhookSettings = WebhookSettings()
     database: DatabaseSettings = DatabaseSettings()
     broker: BrokerSettings = BrokerSettings()
     cache: CacheSettings = CacheSettings()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import ipaddress
 import re
 from enum import Enum
@@ -19,12 +20,7 @@ from infrahub.core.property import (
     NodePropertyMixin,
     ValuePropertyData,
 )
-from infrahub.core.query.attribute import (
-    AttributeGetQuery,
-    AttributeUpdateFlagQuery,
-    AttributeUpdateNodePropertyQuery,
-    AttributeUpdateValueQuery,
-)
+from infrahub.core.query.attribute import AttributeGetQuery, AttributeUpdateQuery
 from infrahub.core.query.node import AttributeFromDB, NodeListGetAttributeQuery
 from infrahub.core.timestamp import Timestamp
 from infrahub.core.utils import add_relationship, convert_ip_to_binary_str, update_relationships_to
@@ -36,6 +32,7 @@ from .constants.relationship_label import RELATIONSHIP_TO_NODE_LABEL, RELATIONSH
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.node import Node
+    from infrahub.core.query import QueryResult
     from infrahub.core.schema import AttributeSchema
     from infrahub.database import InfrahubDatabase
 
@@ -59,6 +56,21 @@ class AttributeCreateData(BaseModel):
     node_type: AttributeDBNodeType = AttributeDBNodeType.DEFAULT
 
 
+class AttributeUpdateData(BaseModel):
+    uuid: str
+    branch: str
+    branch_level: int
+    labels: List[str] = Field(default_factory=list)
+    content: Optional[Dict[str, Any]] = None
+    flag_properties: Dict[str, bool] = Field(default_factory=dict)
+    node_properties: Dict[str, str] = Field(default_factory=dict)
+    rel_ids_to_close: List[str] = Field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return self.content is not None or bool(self.flag_properties) or bool(self.node_properties)
+
+
 class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
     type: Optional[Union[Type, Tuple[Type]]] = None
 
@@ -97,6 +109,9 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
 
         self.value = None
 
+        # State of the attribute as it was last loaded from or saved to the database, None if it's unknown
+        self._db_state: Optional[Dict[str, Any]] = None
+
         if isinstance(data, AttributeFromDB):
             self.load_from_db(data=data)
 
@@ -269,6 +284,33 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         if not self.updated_at and data.updated_at:
             self.updated_at = Timestamp(data.updated_at)
 
+        self._set_db_state()
+
+    def _get_state(self) -> Dict[str, Any]:
+        value = self.value
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, (dict, list)):
+            value = copy.deepcopy(value)
+
+        state: Dict[str, Any] = {"value": value, "is_default": self.is_default}
+        for prop_name in self._flag_properties:
+            state[prop_name] = getattr(self, prop_name)
+        for prop_name in self._node_properties:
+            state[f"{prop_name}_id"] = getattr(self, f"{prop_name}_id")
+
+        return state
+
+    def _set_db_state(self) -> None:
+        self._db_state = self._get_state()
+
+    @property
+    def has_been_modified(self) -> bool:
+        """Indicate if the attribute has been modified since it was last loaded from or saved to the database."""
+        if self._db_state is None:
+            return True
+        return self._get_state() != self._db_state
+
     def value_from_db(self, data: AttributeFromDB) -> Any:
         if data.value == NULL_VALUE:
             return None
@@ -358,17 +400,6 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
 
         update_at = Timestamp(at)
 
-        # Validate if the value is still correct, will raise a ValidationError if not
-        self.validate(value=self.value, name=self.name, schema=self.schema)
-
-        # Check if the current value is still the default one
-        if (
-            self.is_default
-            and (self.schema.default_value is not None and self.schema.default_value != self.value)
-            or (self.schema.default_value is None and self.value is not None)
-        ):
-            self.is_default = False
-
         query = await NodeListGetAttributeQuery.init(
             db=db,
             ids=[self.node.id],
@@ -381,33 +412,62 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         await query.execute(db=db)
         current_attr_data, current_attr_result = query.get_result_by_id_and_name(self.node.id, self.name)
 
+        update_data = self.get_update_data(current_attr_data=current_attr_data, current_attr_result=current_attr_result)
+        if update_data.has_changes:
+            query = await AttributeUpdateQuery.init(db=db, attributes=[update_data], at=update_at)
+            await query.execute(db=db)
+
+        self._set_db_state()
+
+        return True
+
+    def get_update_data(
+        self, current_attr_data: AttributeFromDB, current_attr_result: QueryResult
+    ) -> AttributeUpdateData:
+        """Compare the attribute with its current version in the database and return the changes to apply."""
+
+        # Validate if the value is still correct, will raise a ValidationError if not
+        self.validate(value=self.value, name=self.name, schema=self.schema)
+
+        # Check if the current value is still the default one
+        if (
+            self.is_default
+            and (self.schema.default_value is not None and self.schema.default_value != self.value)
+            or (self.schema.default_value is None and self.value is not None)
+        ):
+            self.is_default = False
+
         branch = self.get_branch_based_on_support_type()
+        update_data = AttributeUpdateData(uuid=self.id, branch=branch.name, branch_level=branch.hierarchy_level)
 
         # ---------- Update the Value ----------
-        if current_attr_data.content != self.to_db():
-            # Create the new AttributeValue and update the existing relationship
-            query = await AttributeUpdateValueQuery.init(db=db, attr=self, at=update_at)
-            await query.execute(db=db)
+        content = self.to_db()
+        if current_attr_data.content != content:
+            update_data.content = content
+            update_data.labels = ["AttributeValue"]
+            node_type = self.get_db_node_type()
+            if node_type == AttributeDBNodeType.IPHOST:
+                update_data.labels.append("AttributeIPHost")
+            elif node_type == AttributeDBNodeType.IPNETWORK:
+                update_data.labels.append("AttributeIPNetwork")
 
-            # TODO check that everything went well
             rel = current_attr_result.get_rel("r2")
             if rel.get("branch") == branch.name:
-                await update_relationships_to([rel.element_id], to=update_at, db=db)
+                update_data.rel_ids_to_close.append(rel.element_id)
 
         # ---------- Update the Flags ----------
         SUPPORTED_FLAGS = (
-            ("is_visible", "isv", "rel_isv"),
-            ("is_protected", "isp", "rel_isp"),
+            ("is_visible", "rel_isv"),
+            ("is_protected", "rel_isp"),
         )
 
-        for flag_name, _, rel_name in SUPPORTED_FLAGS:
+        for flag_name, rel_name in SUPPORTED_FLAGS:
             if current_attr_data.flag_properties[flag_name] != getattr(self, flag_name):
-                query = await AttributeUpdateFlagQuery.init(db=db, attr=self, at=update_at, flag_name=flag_name)
-                await query.execute(db=db)
+                update_data.flag_properties[flag_name] = getattr(self, flag_name)
 
                 rel = current_attr_result.get(rel_name)
                 if rel.get("branch") == branch.name:
-                    await update_relationships_to([rel.element_id], to=update_at, db=db)
+                    update_data.rel_ids_to_close.append(rel.element_id)
 
         # ---------- Update the Node Properties ----------
         for prop_name in self._node_properties:
@@ -415,16 +475,13 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
                 prop_name in current_attr_data.node_properties
                 and current_attr_data.node_properties[prop_name].uuid == getattr(self, f"{prop_name}_id")
             ):
-                query = await AttributeUpdateNodePropertyQuery.init(
-                    db=db, attr=self, at=update_at, prop_name=prop_name, prop_id=getattr(self, f"{prop_name}_id")
-                )
-                await query.execute(db=db)
+                update_data.node_properties[prop_name] = getattr(self, f"{prop_name}_id")
 
                 rel = current_attr_result.get(f"rel_{prop_name}")
                 if rel and rel.get("branch") == branch.name:
-                    await update_relationships_to([rel.element_id], to=update_at, db=db)
+                    update_data.rel_ids_to_close.append(rel.element_id)
 
-        return True
+        return update_data
 
     async def to_graphql(
         self,
@@ -3,16 +3,18 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 
+from infrahub import config
 from infrahub.core.constants import (
     GLOBAL_BRANCH_NAME,
 )
+from infrahub.core.graph.schema import GRAPH_SCHEMA
 from infrahub.core.models import SchemaBranchHash  # noqa: TCH001
 from infrahub.core.node.standard import StandardNode
 from infrahub.core.query.branch import (
     DeleteBranchRelationshipsQuery,
-    GetAllBranchInternalRelationshipQuery,
+    GetBranchRelationshipsToRebaseQuery,
     RebaseBranchDeleteRelationshipQuery,
     RebaseBranchUpdateRelationshipQuery,
 )
@@ -21,6 +23,7 @@ from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import BranchNotFoundError, InitializationError, ValidationError
 
 if TYPE_CHECKING:
+    from infrahub.core.task.user_task import UserTask
     from infrahub.database import InfrahubDatabase
 
 
@@ -43,9 +46,13 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
     )
     is_isolated: bool = True
     schema_changed_at: Optional[str] = None
+    # Time of a rebase that has started but didn't complete, the edges of the branch can be partially rebased
+    rebase_started_at: Optional[str] = None
     schema_hash: Optional[SchemaBranchHash] = None
 
     _exclude_attrs: List[str] = ["id", "uuid", "owner"]
+    _query_filter_cache: Dict[Tuple[Any, ...], Any] = PrivateAttr(default_factory=dict)
+    _query_filter_cache_key: Optional[Tuple[Any, ...]] = PrivateAttr(default=None)
 
     @field_validator("name", mode="before")
     @classmethod
@@ -159,6 +166,49 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
 
         return [default_branch, self.name]
 
+    def _get_query_filter_cache(self) -> Dict[Tuple[Any, ...], Any]:
+        """Return the cache of the query filters of this branch.
+
+        The cache is reset as soon as one of the attributes used to generate the filters changes,
+        like branched_from when the branch is rebased.
+        """
+        cache_key = (self.name, self.origin_branch, self.branched_from, self.is_default, self.is_isolated)
+        if self._query_filter_cache_key != cache_key:
+            self._query_filter_cache = {}
+            self._query_filter_cache_key = cache_key
+        return self._query_filter_cache
+
+    def _get_branched_from(self) -> Timestamp:
+        cache = self._get_query_filter_cache()
+        if "branched_from" not in cache:
+            cache["branched_from"] = Timestamp(self.branched_from)
+        return cache["branched_from"]
+
+    def _get_branches_to_query_global(self) -> List[List[str]]:
+        if self.is_default:
+            return [[GLOBAL_BRANCH_NAME, self.name]]
+        return [[GLOBAL_BRANCH_NAME, self.origin_branch], [GLOBAL_BRANCH_NAME, self.name]]
+
+    def _get_times_to_query_global(self, at: Timestamp, is_isolated: bool = True) -> List[str]:
+        """Return the time to query for each branch returned by _get_branches_to_query_global, in the same order."""
+        at_str = at.to_string()
+        if self.is_default:
+            return [at_str]
+
+        # If the branch is isolated, and if the time requested is after the creation of the branch
+        if self.is_isolated and is_isolated and at > self._get_branched_from():
+            return [self._get_branched_from().to_string(), at_str]
+
+        return [at_str, at_str]
+
+    def _bind_query_filter_params(self, at: Timestamp, is_isolated: bool = True) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        times = self._get_times_to_query_global(at=at, is_isolated=is_isolated)
+        for idx, (branches, time_to_query) in enumerate(zip(self._get_branches_to_query_global(), times)):
+            params[f"branch{idx}"] = branches
+            params[f"time{idx}"] = time_to_query
+        return params
+
     def get_branches_and_times_to_query(self, at: Optional[Union[Timestamp, str]] = None) -> Dict[frozenset, str]:
         """Return all the names of the branches that are constituing this branch with the associated times excluding the global branch"""
 
@@ -170,8 +220,8 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
         time_default_branch = at
 
         # If the branch is isolated, and if the time requested is after the creation of the branch
-        if self.is_isolated and at > Timestamp(self.branched_from):
-            time_default_branch = Timestamp(self.branched_from)
+        if self.is_isolated and at > self._get_branched_from():
+            time_default_branch = self._get_branched_from()
 
         return {
             frozenset([self.origin_branch]): time_default_branch.to_string(),
@@ -185,20 +235,10 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
     ) -> Dict[frozenset, str]:
         """Return all the names of the branches that are constituting this branch with the associated times."""
 
-        at = Timestamp(at)
-
-        if self.is_default:
-            return {frozenset((GLOBAL_BRANCH_NAME, self.name)): at.to_string()}
-
-        time_default_branch = at
-
-        # If the branch is isolated, and if the time requested is after the creation of the branch
-        if self.is_isolated and is_isolated and at > Timestamp(self.branched_from):
-            time_default_branch = Timestamp(self.branched_from)
-
+        times = self._get_times_to_query_global(at=Timestamp(at), is_isolated=is_isolated)
         return {
-            frozenset((GLOBAL_BRANCH_NAME, self.origin_branch)): time_default_branch.to_string(),
-            frozenset((GLOBAL_BRANCH_NAME, self.name)): at.to_string(),
+            frozenset(branches): time_to_query
+            for branches, time_to_query in zip(self._get_branches_to_query_global(), times)
         }
 
     def get_branches_and_times_for_range(
@@ -246,37 +286,35 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
     ) -> Tuple[List, Dict]:
         """
         Generate a CYPHER Query filter based on a list of relationships to query a part of the graph at a specific time and on a specific branch.
-        """
 
-        filters = []
-        params: dict[str, Any] = {}
+        The filters only depend on the branch and are cached, only the time parameters are generated for each call.
+        """
 
         if not isinstance(rel_labels, list):
             raise TypeError(f"rel_labels must be a list, not a {type(rel_labels)}")
 
-        at = Timestamp(at)
-        branches_times = self.get_branches_and_times_to_query_global(at=at)
-
-        for idx, (branch_name, time_to_query) in enumerate(branches_times.items()):
-            params[f"branch{idx}"] = list(branch_name)
-            params[f"time{idx}"] = time_to_query
-
-        for rel in rel_labels:
-            filters_per_rel = []
-            for idx, (branch_name, time_to_query) in enumerate(branches_times.items()):
-                filters_per_rel.append(
-                    f"({rel}.branch IN $branch{idx} AND {rel}.from <= $time{idx} AND {rel}.to IS NULL)"
-                )
-                filters_per_rel.append(
-                    f"({rel}.branch IN $branch{idx} AND {rel}.from <= $time{idx} AND {rel}.to >= $time{idx})"
-                )
-
-            if not include_outside_parentheses:
-                filters.append("\n OR ".join(filters_per_rel))
-
-            filters.append("(" + "\n OR ".join(filters_per_rel) + ")")
-
-        return filters, params
+        cache = self._get_query_filter_cache()
+        cache_key = ("relationships", tuple(rel_labels), include_outside_parentheses)
+        if cache_key not in cache:
+            nbr_branches = len(self._get_branches_to_query_global())
+            filters = []
+            for rel in rel_labels:
+                filters_per_rel = []
+                for idx in range(nbr_branches):
+                    filters_per_rel.append(
+                        f"({rel}.branch IN $branch{idx} AND {rel}.from <= $time{idx} AND {rel}.to IS NULL)"
+                    )
+                    filters_per_rel.append(
+                        f"({rel}.branch IN $branch{idx} AND {rel}.from <= $time{idx} AND {rel}.to >= $time{idx})"
+                    )
+
+                if not include_outside_parentheses:
+                    filters.append("\n OR ".join(filters_per_rel))
+
+                filters.append("(" + "\n OR ".join(filters_per_rel) + ")")
+            cache[cache_key] = filters
+
+        return list(cache[cache_key]), self._bind_query_filter_params(at=Timestamp(at))
 
     def get_query_filter_path(
         self, at: Optional[Union[Timestamp, str]] = None, is_isolated: bool = True, branch_agnostic: bool = False
@@ -292,28 +330,20 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
             There is a currently an assumption that the relationship in the path will be named 'r'
         """
 
-        params: dict[str, Any] = {}
         at = Timestamp(at)
-        at_str = at.to_string()
         if branch_agnostic:
             filter_str = "r.from <= $time1 AND (r.to IS NULL or r.to >= $time1)"
-            params["time1"] = at_str
-            return filter_str, params
+            return filter_str, {"time1": at.to_string()}
 
-        branches_times = self.get_branches_and_times_to_query_global(at=at_str, is_isolated=is_isolated)
+        cache = self._get_query_filter_cache()
+        if "path" not in cache:
+            filters = []
+            for idx in range(len(self._get_branches_to_query_global())):
+                filters.append(f"(r.branch IN $branch{idx} AND r.from <= $time{idx} AND r.to IS NULL)")
+                filters.append(f"(r.branch IN $branch{idx} AND r.from <= $time{idx} AND r.to >= $time{idx})")
+            cache["path"] = "(" + "\n OR ".join(filters) + ")"
 
-        for idx, (branch_name, time_to_query) in enumerate(branches_times.items()):
-            params[f"branch{idx}"] = list(branch_name)
-            params[f"time{idx}"] = time_to_query
-
-        filters = []
-        for idx, (branch_name, time_to_query) in enumerate(branches_times.items()):
-            filters.append(f"(r.branch IN $branch{idx} AND r.from <= $time{idx} AND r.to IS NULL)")
-            filters.append(f"(r.branch IN $branch{idx} AND r.from <= $time{idx} AND r.to >= $time{idx})")
-
-        filter_str = "(" + "\n OR ".join(filters) + ")"
-
-        return filter_str, params
+        return cache["path"], self._bind_query_filter_params(at=at, is_isolated=is_isolated)
 
     def get_query_filter_relationships_range(
         self,
@@ -433,66 +463,84 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
 
         return filters, params
 
-    async def rebase(self, db: InfrahubDatabase, at: Optional[Union[str, Timestamp]] = None) -> None:
-        """Rebase the current Branch with its origin branch"""
+    async def rebase(
+        self, db: InfrahubDatabase, at: Optional[Union[str, Timestamp]] = None, task: Optional[UserTask] = None
+    ) -> None:
+        """Rebase the current Branch with its origin branch
+
+        The edges are rebased in chunks committed one by one, so `rebase_started_at` is saved before touching them
+        and only cleared once all the edges have been rebased and `branched_from` has been updated.
+        If a rebase fails halfway, the next rebase converges to the same result as a complete rebase,
+        as long as it's not done at an earlier time than the failed one; an earlier time is moved forward to it.
+        """
 
         at = Timestamp(at)
+        if self.rebase_started_at and at < Timestamp(self.rebase_started_at):
+            at = Timestamp(self.rebase_started_at)
+
+        self.rebase_started_at = at.to_string()
+        await self.save(db=db)
 
         # Find all relationships with the name of the branch
         # Delete all relationship that have a to date defined in the past
         # Update the from time on all other relationships
         # If conflict is set, ignore the one with Drop
 
-        await self.rebase_graph(db=db, at=at)
+        await self.rebase_graph(db=db, at=at, task=task)
 
         # FIXME, we must ensure that there is no conflict before rebasing a branch
         #   Otherwise we could endup with a complicated situation
         self.branched_from = at.to_string()
+        self.rebase_started_at = None
         await self.save(db=db)
 
         # Update the branch in the registry after the rebase
         registry.branch[self.name] = self
 
-    async def rebase_graph(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> None:
-        at = Timestamp(at)
-
-        query = await GetAllBranchInternalRelationshipQuery.init(db=db, branch=self)
-        await query.execute(db=db)
-
-        rels_to_delete = []
-        rels_to_update = []
-        for result in query.get_results():
-            element_id = result.get("r").element_id
-
-            conflict_status = result.get("r").get("conflict", None)
-            if conflict_status and conflict_status == "drop":
-                rels_to_delete.append(element_id)
-                continue
-
-            time_to_str = result.get("r").get("to", None)
-            time_from_str = result.get("r").get("from")
-            time_from = Timestamp(time_from_str)
-
-            if not time_to_str and time_from_str and time_from <= at:
-                rels_to_update.append(element_id)
-                continue
+    async def rebase_graph(
+        self, db: InfrahubDatabase, at: Optional[Timestamp] = None, task: Optional[UserTask] = None
+    ) -> None:
+        """Classify the edges of the branch in the database and update them in chunks.
 
-            if not time_to_str and time_from_str and time_from > at:
-                rels_to_delete.append(element_id)
-                continue
-
-            time_to = Timestamp(time_to_str)
-            if time_to < at:
-                rels_to_delete.append(element_id)
-                continue
-
-            rels_to_update.append(element_id)
-
-        update_query = await RebaseBranchUpdateRelationshipQuery.init(db=db, ids=rels_to_update, at=at)
-        await update_query.execute(db=db)
+        The ids of the edges are collected once, one edge type at a time to use the index on `branch`.
+        Only the ids are kept in memory, as a list of integers, and not the edges themselves.
+        The edges to drop are then deleted and the remaining ones are moved to `at`,
+        each chunk of `database.write_batch_size` edges is written in its own transaction
+        and the progress is reported in the task after each chunk.
+        """
+        at = Timestamp(at)
+        batch_size = config.SETTINGS.database.write_batch_size
+
+        rels_to_delete: List[int] = []
+        rels_to_update: List[int] = []
+        for edge_type in ["IS_PART_OF", *GRAPH_SCHEMA["relationships"].keys()]:
+            query = await GetBranchRelationshipsToRebaseQuery.init(db=db, branch=self, at=at, edge_type=edge_type)
+            await query.execute(db=db)
+            to_delete, to_update = query.get_rel_ids()
+            rels_to_delete.extend(to_delete)
+            rels_to_update.extend(to_update)
+
+        for idx in range(0, len(rels_to_delete), batch_size):
+            chunk = rels_to_delete[idx : idx + batch_size]
+            async with db.start_transaction() as dbt:
+                delete_query = await RebaseBranchDeleteRelationshipQuery.init(db=dbt, branch=self, at=at, ids=chunk)
+                await delete_query.execute(db=dbt)
+            if task:
+                await task.info(
+                    message=f"Rebase {self.name}: {idx + len(chunk)}/{len(rels_to_delete)} relationships deleted",
+                    db=db,
+                )
 
-        delete_query = await RebaseBranchDeleteRelationshipQuery.init(db=db, ids=rels_to_delete, at=at)
-        await delete_query.execute(db=db)
+        for idx in range(0, len(rels_to_update), batch_size):
+            chunk = rels_to_update[idx : idx + batch_size]
+            async with db.start_transaction() as dbt:
+                update_query = await RebaseBranchUpdateRelationshipQuery.init(db=dbt, branch=self, at=at, ids=chunk)
+                await update_query.execute(db=dbt)
+            if task:
+                await task.info(
+                    message=f"Rebase {self.name}: {idx + len(chunk)}/{len(rels_to_update)} relationships updated",
+                    db=db,
+                )
 
 
 registry.branch_object = Branch
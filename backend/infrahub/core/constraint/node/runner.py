@@ -35,3 +35,18 @@ class NodeConstraintRunner:
             relationship_manager: RelationshipManager = getattr(node, relationship_name)
             for relationship_constraint in self.relationship_manager_constraints:
                 await relationship_constraint.check(relm=relationship_manager)
+
+    async def check_many(self, nodes: List[Node], field_filters: Optional[List[str]] = None) -> None:
+        """Validate multiple new nodes of the same kind, the node constraints are evaluated for all the nodes together."""
+        await Node.resolve_relationships_many(db=self.db, nodes=nodes)
+
+        for node_constraint in self.node_constraints:
+            await node_constraint.check_many(nodes, filters=field_filters)
+
+        for node in nodes:
+            for relationship_name in node.get_schema().relationship_names:
+                if field_filters and relationship_name not in field_filters:
+                    continue
+                relationship_manager: RelationshipManager = getattr(node, relationship_name)
+                for relationship_constraint in self.relationship_manager_constraints:
+                    await relationship_constraint.check(relm=relationship_manager)
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional, Set, Union
 
 from typing_extensions import Self
 
+from infrahub import config
 from infrahub.core.constants import (
     BranchSupportType,
     DiffAction,
@@ -17,6 +18,8 @@ from infrahub.core.constants import (
 from infrahub.core.manager import NodeManager
 from infrahub.core.query.diff import (
     DiffAttributeQuery,
+    DiffChangedNodesQuery,
+    DiffChangedRelationshipsQuery,
     DiffNodePropertiesByIDSQuery,
     DiffNodeQuery,
     DiffRelationshipPropertiesByIDSRangeQuery,
@@ -30,6 +33,7 @@ from infrahub.exceptions import (
 )
 from infrahub.message_bus.messages import GitDiffNamesOnly, GitDiffNamesOnlyResponse
 
+from .cache import DiffCacheEntry, get_cached_diff, get_diff_cache_key, set_cached_diff
 from .model import (
     BranchChanges,
     DataConflict,
@@ -447,11 +451,95 @@ class BranchDiffer:
             if not self.branch_only or branch_name == self.branch.name
         }
 
+    def _get_cache_key(self, element: str) -> Optional[str]:
+        """Return the key of the cached diff for this branch, time range and filters.
+
+        The cache is only used when a service is available and outside of a transaction,
+        to avoid persisting changes that could still be rolled back.
+        The key includes branched_from so that a rebased branch never reuses a diff calculated before the rebase.
+        """
+        if not self._service or self.db.is_transaction:
+            return None
+
+        return get_diff_cache_key(
+            branch_name=self.branch.name,
+            identifiers=[
+                self.branch.branched_from,
+                self.diff_from.to_string(),
+                self.namespaces_include,
+                self.namespaces_exclude,
+                self.kinds_include,
+                self.kinds_exclude,
+                [item.value for item in self.branch_support],
+            ],
+            element=element,
+        )
+
+    async def _get_cached_diff(self, key: Optional[str]) -> Optional[DiffCacheEntry]:
+        """Return the cached diff if it can be extended up to diff_to."""
+        if not key:
+            return None
+
+        cached_diff = await get_cached_diff(service=self.service, key=key)
+        if cached_diff and Timestamp(cached_diff.diff_to) <= self.diff_to:
+            return cached_diff
+
+        return None
+
+    def _get_cache_reuse_limit(self, cached_diff: DiffCacheEntry) -> Timestamp:
+        """Return the time up to which a cached diff can be reused as is.
+
+        Some changes can be written with a time before the diff_to of the cached diff after it has been calculated,
+        like the transactions still in progress at the time. The changes in the grace period before
+        the end of the cached diff are always recalculated to include them.
+        """
+        reuse_limit = Timestamp(
+            Timestamp(cached_diff.diff_to).add_delta(seconds=-config.SETTINGS.cache.diff_grace_period)
+        )
+        if reuse_limit < self.diff_from:
+            return self.diff_from
+        return reuse_limit
+
     async def _calculate_diff_nodes(self) -> None:
         """Calculate the diff for all the nodes and attributes.
 
+        If a diff has already been calculated for an earlier diff_to, only the nodes modified since then are calculated.
         The results will be stored in self._results organized by branch.
         """
+        cache_key = self._get_cache_key(element="nodes")
+        cached_diff = await self._get_cached_diff(key=cache_key)
+
+        if not cached_diff:
+            await self._calculate_diff_nodes_elements()
+        else:
+            node_ids: Set[str] = set()
+            reuse_limit = self._get_cache_reuse_limit(cached_diff=cached_diff)
+            if reuse_limit < self.diff_to:
+                query_changed = await DiffChangedNodesQuery.init(
+                    db=self.db, branch=self.branch, diff_from=reuse_limit, diff_to=self.diff_to
+                )
+                await query_changed.execute(db=self.db)
+                node_ids = set(query_changed.get_node_ids())
+
+            for branch_name, nodes in cached_diff.nodes.items():
+                self._results[branch_name]["nodes"] = {
+                    node_id: node for node_id, node in nodes.items() if node_id not in node_ids
+                }
+
+            if node_ids:
+                await self._calculate_diff_nodes_elements(node_ids=list(node_ids))
+
+        if cache_key:
+            entry = DiffCacheEntry(
+                diff_to=self.diff_to.to_string(),
+                nodes={branch_name: data["nodes"] for branch_name, data in self._results.items()},
+            )
+            await set_cached_diff(service=self.service, key=cache_key, entry=entry)
+
+        self._calculated_diff_nodes_at = Timestamp()
+
+    async def _calculate_diff_nodes_elements(self, node_ids: Optional[List[str]] = None) -> None:
+        """Calculate the diff for the nodes and attributes, limited to node_ids if provided."""
         # ------------------------------------------------------------
         # Process nodes that have been Added or Removed first
         # ------------------------------------------------------------
@@ -465,10 +553,10 @@ class BranchDiffer:
             kinds_include=self.kinds_include,
             kinds_exclude=self.kinds_exclude,
             branch_support=self.branch_support,
+            node_ids=node_ids,
         )
-        await query_nodes.execute(db=self.db)
 
-        for result in query_nodes.get_results():
+        async for result in query_nodes.execute_stream(db=self.db):
             node_id = result.get("n").get("uuid")
 
             node_to = None
@@ -520,6 +608,7 @@ class BranchDiffer:
             kinds_include=self.kinds_include,
             kinds_exclude=self.kinds_exclude,
             branch_support=self.branch_support,
+            node_ids=node_ids,
         )
         await query_attrs.execute(db=self.db)
 
@@ -661,8 +750,6 @@ class BranchDiffer:
                 PropertyDiffElement(**item)
             )
 
-        self._calculated_diff_nodes_at = Timestamp()
-
     async def get_relationships(self) -> Dict[str, Dict[str, Dict[str, RelationshipDiffElement]]]:
         if not self._calculated_diff_rels_at:
             await self._calculated_diff_rels()
@@ -713,8 +800,44 @@ class BranchDiffer:
     async def _calculated_diff_rels(self) -> None:
         """Calculate the diff for all the relationships between Nodes.
 
+        If a diff has already been calculated for an earlier diff_to, only the relationships modified since then are calculated.
         The results will be stored in self._results organized by branch.
         """
+        cache_key = self._get_cache_key(element="rels")
+        cached_diff = await self._get_cached_diff(key=cache_key)
+
+        if not cached_diff:
+            await self._calculate_diff_rels_elements()
+        else:
+            rel_ids: Set[str] = set()
+            reuse_limit = self._get_cache_reuse_limit(cached_diff=cached_diff)
+            if reuse_limit < self.diff_to:
+                query_changed = await DiffChangedRelationshipsQuery.init(
+                    db=self.db, branch=self.branch, diff_from=reuse_limit, diff_to=self.diff_to
+                )
+                await query_changed.execute(db=self.db)
+                rel_ids = set(query_changed.get_rel_ids())
+
+            for branch_name, rels in cached_diff.rels.items():
+                for rel_name, rel_items in rels.items():
+                    self._results[branch_name]["rels"][rel_name] = {
+                        rel_id: rel for rel_id, rel in rel_items.items() if rel_id not in rel_ids
+                    }
+
+            if rel_ids:
+                await self._calculate_diff_rels_elements(rel_ids=list(rel_ids))
+
+        if cache_key:
+            entry = DiffCacheEntry(
+                diff_to=self.diff_to.to_string(),
+                rels={branch_name: data["rels"] for branch_name, data in self._results.items()},
+            )
+            await set_cached_diff(service=self.service, key=cache_key, entry=entry)
+
+        self._calculated_diff_rels_at = Timestamp()
+
+    async def _calculate_diff_rels_elements(self, rel_ids: Optional[List[str]] = None) -> None:
+        """Calculate the diff for the relationships between Nodes, limited to rel_ids if provided."""
 
         rel_ids_to_query = []
 
@@ -732,6 +855,7 @@ class BranchDiffer:
             kinds_include=self.kinds_include,
             kinds_exclude=self.kinds_exclude,
             branch_support=self.branch_support,
+            rel_ids=rel_ids,
         )
         await query_rels.execute(db=self.db)
 
@@ -796,7 +920,7 @@ class BranchDiffer:
         #  Then we can process the properties themselves
         # ------------------------------------------------------------
         query_props = await DiffRelationshipPropertyQuery.init(
-            db=self.db, branch=self.branch, diff_from=self.diff_from, diff_to=self.diff_to
+            db=self.db, branch=self.branch, diff_from=self.diff_from, diff_to=self.diff_to, rel_ids=rel_ids
         )
         await query_props.execute(db=self.db)
 
@@ -899,8 +1023,6 @@ class BranchDiffer:
 
             self._results[branch_name]["rels"][rel_name][rel_id].properties[prop_type] = PropertyDiffElement(**prop)
 
-        self._calculated_diff_rels_at = Timestamp()
-
     def parse_relationship_paths(
         self, nodes: Dict[str, RelationshipEdgeNodeDiffElement], branch_name: str, relationship_name: str
     ) -> RelationshipPath:
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import ujson
+from pydantic import BaseModel, Field
+
+from infrahub import config
+from infrahub.core.timestamp import Timestamp
+from infrahub.log import get_logger
+from infrahub.message_bus.types import KVTTL
+
+from .model import NodeDiffElement, RelationshipDiffElement  # noqa: TCH001
+
+if TYPE_CHECKING:
+    from infrahub.services import InfrahubServices
+
+log = get_logger()
+
+DIFF_CACHE_PREFIX = "diff"
+
+
+class DiffCacheEntry(BaseModel):
+    """Node or relationship elements of a diff, as calculated up to diff_to."""
+
+    diff_to: str
+    nodes: Dict[str, Dict[str, NodeDiffElement]] = Field(default_factory=dict)
+    rels: Dict[str, Dict[str, Dict[str, RelationshipDiffElement]]] = Field(default_factory=dict)
+
+    def to_cache(self) -> str:
+        return ujson.dumps(_export(self))
+
+    @classmethod
+    def from_cache(cls, value: str) -> DiffCacheEntry:
+        return cls(**ujson.loads(value))
+
+
+def _export(value: Any) -> Any:
+    """Export a diff element to a JSON compatible structure.
+
+    model_dump can't be used here because it always drops the fields flagged with exclude=True,
+    like the database ids, which are required to merge a branch.
+    """
+    if isinstance(value, BaseModel):
+        return {key: _export(item) for key, item in value.__dict__.items()}
+    if isinstance(value, dict):
+        return {key: _export(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_export(item) for item in value]
+    if isinstance(value, Timestamp):
+        return value.to_string()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def get_diff_cache_branch_prefix(branch_name: str) -> str:
+    # The name of the branch is hashed because it can contain characters that are not supported in a key by all the cache backends
+    return f"{DIFF_CACHE_PREFIX}:{hashlib.md5(branch_name.encode(), usedforsecurity=False).hexdigest()}"
+
+
+def get_diff_cache_key(branch_name: str, identifiers: List[Any], element: str) -> str:
+    identifier = hashlib.md5(ujson.dumps(identifiers).encode(), usedforsecurity=False).hexdigest()
+    return f"{get_diff_cache_branch_prefix(branch_name=branch_name)}:{identifier}:{element}"
+
+
+async def get_cached_diff(service: InfrahubServices, key: str) -> Optional[DiffCacheEntry]:
+    try:
+        value = await service.cache.get(key=key)
+    except NotImplementedError:
+        return None
+    if not value:
+        return None
+    return DiffCacheEntry.from_cache(value=value)
+
+
+async def set_cached_diff(service: InfrahubServices, key: str, entry: DiffCacheEntry) -> None:
+    value = entry.to_cache()
+    if len(value.encode()) > config.SETTINGS.cache.diff_max_size:
+        # Some cache backends reject large values, NATS KV is limited to 1MB per value
+        log.debug("Diff too large to be cached", key=key, size=len(value))
+        return
+
+    try:
+        await service.cache.set(key=key, value=value, expires=KVTTL.TWO_HOURS)
+    except NotImplementedError:
+        return
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        # The diff is still valid without the cache, a diff too large for the cache backend shouldn't fail the request
+        log.warning("Unable to store the diff in the cache", key=key, error=str(exc))
+
+
+async def invalidate_diff_cache(service: InfrahubServices, branch_name: str) -> None:
+    """Delete all the cached diffs of a branch."""
+    try:
+        keys = await service.cache.list_keys(
+            filter_pattern=f"{get_diff_cache_branch_prefix(branch_name=branch_name)}:*"
+        )
+    except NotImplementedError:
+        return
+    for key in keys:
+        await service.cache.delete(key=key)
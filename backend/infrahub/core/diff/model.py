@@ -3,7 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Union
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
 
 from infrahub.core.constants import (
     DiffAction,
@@ -21,6 +21,13 @@ class BaseDiffElement(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
+    @field_validator("changed_at", mode="before", check_fields=False)
+    @classmethod
+    def convert_changed_at(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return Timestamp(value)
+        return value
+
     def to_graphql(self) -> Dict[str, Any]:
         """Recursively Export the model to a dict for GraphQL.
         The main rules of convertion are:
@@ -42,4 +42,40 @@ rel_indexes: List[IndexItem] = [
         properties=["branch"],
         type=IndexType.RANGE,
     ),
+    IndexItem(
+        name="part_of_branch",
+        label="IS_PART_OF",
+        properties=["branch"],
+        type=IndexType.RANGE,
+    ),
+    IndexItem(
+        name="rel_branch",
+        label="IS_RELATED",
+        properties=["branch"],
+        type=IndexType.RANGE,
+    ),
+    IndexItem(
+        name="source_branch",
+        label="HAS_SOURCE",
+        properties=["branch"],
+        type=IndexType.RANGE,
+    ),
+    IndexItem(
+        name="owner_branch",
+        label="HAS_OWNER",
+        properties=["branch"],
+        type=IndexType.RANGE,
+    ),
+    IndexItem(
+        name="visible_branch",
+        label="IS_VISIBLE",
+        properties=["branch"],
+        type=IndexType.RANGE,
+    ),
+    IndexItem(
+        name="protected_branch",
+        label="IS_PROTECTED",
+        properties=["branch"],
+        type=IndexType.RANGE,
+    ),
 ]
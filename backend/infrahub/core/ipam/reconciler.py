@@ -6,9 +6,11 @@ from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
 from infrahub.core.query.ipam import IPPrefixReconcileQuery
+from infrahub.core.registry import registry
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import NodeNotFoundError
+from infrahub.pools.address import address_free_ranges_index
 
 from .constants import AllIPTypes
 
@@ -149,6 +151,14 @@ class IpamReconciler:
             except KeyError:
                 return None
 
+        # Keep the free ranges of the IP address pools of this worker in sync with the address
+        if isinstance(ip_value, (ipaddress.IPv6Interface, ipaddress.IPv4Interface)):
+            namespace_id = namespace.id if isinstance(namespace, Node) else namespace or registry.default_ipnamespace
+            if is_delete:
+                address_free_ranges_index.invalidate(address=ip_value.ip, namespace_id=namespace_id)
+            else:
+                address_free_ranges_index.reserve(namespace_id=namespace_id, address=ip_value.ip)
+
         return reconcile_nodes.node
 
     async def _update_node_parent(self, node: Node, new_parent_uuid: Optional[str]) -> None:
@@ -5,12 +5,14 @@ from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Type, Unio
 
 from infrahub_sdk.utils import deep_merge_dict, is_valid_uuid
 
+from infrahub import config
 from infrahub.core.node import Node
 from infrahub.core.node.delete_validator import NodeDeleteValidator
 from infrahub.core.query.node import (
     AttributeFromDB,
     AttributeNodePropertyFromDB,
     NodeAttributesFromDB,
+    NodeCreateManyQuery,
     NodeGetHierarchyQuery,
     NodeGetListQuery,
     NodeListGetAttributeQuery,
@@ -557,6 +559,113 @@ class NodeManager:
 
         return items[0] if items else None
 
+    @classmethod
+    async def get_many_by_default_filter(
+        cls,
+        db: InfrahubDatabase,
+        ids: list[str],
+        kind: str,
+        fields: Optional[dict] = None,
+        at: Optional[Union[Timestamp, str]] = None,
+        branch: Optional[Union[Branch, str]] = None,
+    ) -> dict[str, Node]:
+        """Return the nodes matching a list of values of the default filter of a kind with a single query.
+
+        The nodes are returned indexed by the value of their default filter, the values without a match are not present
+        in the response and a NodeNotFoundError is raised if more than one node is matching the same value.
+        """
+        branch = await registry.get_branch(branch=branch, db=db)
+        at = Timestamp(at)
+
+        node_schema = db.schema.get(name=kind, branch=branch)
+        if not node_schema.default_filter:
+            raise NodeNotFoundError(branch_name=branch.name, node_type=kind, identifier=ids[0])
+
+        filter_field = node_schema.default_filter.rsplit("__", maxsplit=1)[0]
+        fields = deep_merge_dict(
+            dicta=dict(fields or {}), dictb=node_schema.convert_path_to_graphql_fields(path=node_schema.default_filter)
+        )
+
+        items = await NodeManager.query(
+            db=db,
+            schema=node_schema,
+            fields=fields,
+            filters={f"{filter_field}__values": list(set(ids))},
+            branch=branch,
+            at=at,
+        )
+
+        nodes: dict[str, Node] = {}
+        for item in items:
+            value = str(await item.get_path_value(db=db, path=node_schema.default_filter))
+            if value in nodes:
+                raise NodeNotFoundError(
+                    branch_name=branch.name,
+                    node_type=kind,
+                    identifier=value,
+                    message=f"Unable to find node {value!r}, more than one node returned, expected 1",
+                )
+            nodes[value] = item
+
+        return nodes
+
+    @classmethod
+    async def get_many_by_hfid(
+        cls,
+        db: InfrahubDatabase,
+        hfids: list[list[str]],
+        kind: str,
+        fields: Optional[dict] = None,
+        at: Optional[Union[Timestamp, str]] = None,
+        branch: Optional[Union[Branch, str]] = None,
+    ) -> dict[tuple[str, ...], Node]:
+        """Return the nodes matching a list of HFID of a kind with a single query.
+
+        The values of each element of the HFID are queried together, the nodes returned are then matched with the
+        requested HFID. The nodes are returned indexed by their HFID, the HFID without a match are not present
+        in the response and a NodeNotFoundError is raised if more than one node is matching the same HFID.
+        """
+        branch = await registry.get_branch(branch=branch, db=db)
+        at = Timestamp(at)
+
+        node_schema = db.schema.get(name=kind, branch=branch)
+        for hfid in hfids:
+            if not node_schema.human_friendly_id or len(node_schema.human_friendly_id) != len(hfid):
+                raise NodeNotFoundError(branch_name=branch.name, node_type=kind, identifier=" :: ".join(hfid))
+
+        filters = {
+            f"{path.rsplit('__', maxsplit=1)[0]}__values": list({hfid[idx] for hfid in hfids})
+            for idx, path in enumerate(node_schema.human_friendly_id)
+        }
+        fields = deep_merge_dict(dicta=dict(fields or {}), dictb=node_schema.generate_fields_for_hfid() or {})
+
+        items = await NodeManager.query(
+            db=db,
+            schema=node_schema,
+            fields=fields,
+            filters=filters,
+            branch=branch,
+            at=at,
+        )
+
+        requested = {tuple(hfid) for hfid in hfids}
+        nodes: dict[tuple[str, ...], Node] = {}
+        for item in items:
+            item_hfid = tuple(str(value) for value in await item.get_hfid(db=db) or [])
+            if item_hfid not in requested:
+                continue
+            if item_hfid in nodes:
+                hfid_str = " :: ".join(item_hfid)
+                raise NodeNotFoundError(
+                    branch_name=branch.name,
+                    node_type=kind,
+                    identifier=hfid_str,
+                    message=f"Unable to find node {hfid_str!r}, more than one node returned, expected 1",
+                )
+            nodes[item_hfid] = item
+
+        return nodes
+
     @classmethod
     async def get_one_by_id_or_default_filter(
         cls,
@@ -706,8 +815,7 @@ class NodeManager:
             at=at,
             branch_agnostic=branch_agnostic,
         )
-        await query.execute(db=db)
-        all_node_attributes = query.get_attributes_group_by_node()
+        all_node_attributes = await query.stream_attributes_group_by_node(db=db)
         profile_attributes: Dict[str, Dict[str, AttributeFromDB]] = {}
         node_attributes: Dict[str, Dict[str, AttributeFromDB]] = {}
         for node_id, attribute_dict in all_node_attributes.items():
@@ -819,5 +927,31 @@ class NodeManager:
 
         return deleted_nodes
 
+    @classmethod
+    async def create_many(
+        cls,
+        db: InfrahubDatabase,
+        nodes: List[Node],
+        at: Optional[Union[Timestamp, str]] = None,
+    ) -> List[Node]:
+        """Create multiple new nodes of the same kind, with one query per batch of nodes.
+
+        The nodes must have been initialized and validated beforehand, like before calling Node.save.
+        """
+        create_at = Timestamp(at)
+        batch_size = config.SETTINGS.database.write_batch_size
+
+        for idx in range(0, len(nodes), batch_size):
+            batch = nodes[idx : idx + batch_size]
+            query = await NodeCreateManyQuery.init(db=db, nodes=batch, at=create_at)
+            await query.execute(db=db)
+
+            db_ids = query.get_self_ids()
+            new_ids = query.get_ids()
+            for node in batch:
+                node._set_created(db_id=db_ids[node.id], new_ids=new_ids[node.id], at=create_at)
+
+        return nodes
+
 
 registry.manager = NodeManager
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
+from infrahub import config
 from infrahub.core.constants import (
     DiffAction,
     InfrahubKind,
@@ -9,19 +11,18 @@ from infrahub.core.constants import (
 )
 from infrahub.core.manager import NodeManager
 from infrahub.core.models import SchemaBranchDiff
-from infrahub.core.query.branch import (
-    AddNodeToBranch,
-)
-from infrahub.core.query.node import NodeDeleteQuery, NodeListGetInfoQuery
+from infrahub.core.query.branch import AddNodesToBranch, AddRelationshipsToBranch, DeleteNodesFromBranch
+from infrahub.core.query.node import NodeListGetInfoQuery
 from infrahub.core.registry import registry
 from infrahub.core.schema import GenericSchema, NodeSchema
 from infrahub.core.schema_manager import SchemaUpdateValidationResult
 from infrahub.core.timestamp import Timestamp
-from infrahub.core.utils import add_relationship, update_relationships_to
+from infrahub.core.utils import update_relationships_to
 from infrahub.exceptions import (
     ValidationError,
 )
 from infrahub.message_bus import messages
+from infrahub.utils import chunks
 
 from .diff.branch_differ import BranchDiffer
 
@@ -35,6 +36,62 @@ if TYPE_CHECKING:
     from .diff.model import DataConflict
 
 
+class GraphMergeChanges:
+    """Collect all the changes required to merge a branch into another one and apply them in bulk.
+
+    The changes are grouped by type and written with a single UNWIND query per type of change,
+    in chunks of `write_batch_size` elements.
+    """
+
+    def __init__(self, branch: Branch, at: Timestamp) -> None:
+        self.branch = branch
+        self.at = at
+        self.nodes_to_add: List[str] = []
+        self.nodes_to_delete: List[str] = []
+        self.edges_to_add: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.rel_ids_to_update: List[str] = []
+
+    def add_node(self, node_id: str) -> None:
+        self.nodes_to_add.append(node_id)
+
+    def delete_node(self, node_uuid: str) -> None:
+        self.nodes_to_delete.append(node_uuid)
+
+    def add_edge(
+        self,
+        src_node_id: str,
+        dst_node_id: str,
+        rel_type: str,
+        status: RelationshipStatus = RelationshipStatus.ACTIVE,
+    ) -> None:
+        self.edges_to_add[str(rel_type).upper()].append(
+            {"src_node_id": src_node_id, "dst_node_id": dst_node_id, "status": status.value}
+        )
+
+    async def apply(self, db: InfrahubDatabase, batch_size: Optional[int] = None) -> None:
+        batch_size = batch_size or config.SETTINGS.database.write_batch_size
+
+        for node_ids in chunks(self.nodes_to_add, batch_size):
+            add_nodes_query = await AddNodesToBranch.init(db=db, node_ids=node_ids, branch=self.branch)
+            await add_nodes_query.execute(db=db)
+
+        for node_uuids in chunks(self.nodes_to_delete, batch_size):
+            delete_nodes_query = await DeleteNodesFromBranch.init(
+                db=db, node_uuids=node_uuids, branch=self.branch, at=self.at
+            )
+            await delete_nodes_query.execute(db=db)
+
+        for rel_type, edges in self.edges_to_add.items():
+            for edges_chunk in chunks(edges, batch_size):
+                add_edges_query = await AddRelationshipsToBranch.init(
+                    db=db, rel_type=rel_type, edges=edges_chunk, branch=self.branch, at=self.at
+                )
+                await add_edges_query.execute(db=db)
+
+        for rel_ids in chunks(self.rel_ids_to_update, batch_size):
+            await update_relationships_to(ids=rel_ids, to=self.at, db=db)
+
+
 class BranchMerger:
     def __init__(
         self,
@@ -85,7 +142,7 @@ class BranchMerger:
 
     async def get_graph_diff(self) -> BranchDiffer:
         if not self._graph_diff:
-            self._graph_diff = await BranchDiffer.init(db=self.db, branch=self.source_branch)
+            self._graph_diff = await BranchDiffer.init(db=self.db, branch=self.source_branch, service=self._service)
 
         return self._graph_diff
 
@@ -265,17 +322,17 @@ class BranchMerger:
         if self.source_branch.sync_with_git:
             await self.merge_repositories()
 
-    async def merge_graph(  # pylint: disable=too-many-branches,too-many-statements
+    async def merge_graph(  # pylint: disable=too-many-branches
         self,
         at: Optional[Union[str, Timestamp]] = None,
         conflict_resolution: Optional[Dict[str, bool]] = None,
     ) -> None:
-        rel_ids_to_update: List[str] = []
         conflict_resolution = conflict_resolution or {}
 
         default_branch: Branch = registry.branch[registry.default_branch]
 
         at = Timestamp(at)
+        changes = GraphMergeChanges(branch=default_branch, at=at)
 
         diff = await self.get_graph_diff()
         nodes = await diff.get_nodes()
@@ -294,85 +351,51 @@ class BranchMerger:
             # ---------------------------------------------
             for node_id, node in nodes[self.source_branch.name].items():
                 if node.action == DiffAction.ADDED:
-                    query1 = await AddNodeToBranch.init(db=self.db, node_id=node.db_id, branch=default_branch)
-                    await query1.execute(db=self.db)
+                    changes.add_node(node_id=node.db_id)
                     if node.rel_id:
-                        rel_ids_to_update.append(node.rel_id)
+                        changes.rel_ids_to_update.append(node.rel_id)
 
                 elif node.action == DiffAction.REMOVED:
                     if node_id in origin_nodes:
-                        query2 = await NodeDeleteQuery.init(db=self.db, branch=default_branch, node_id=node_id, at=at)
-                        await query2.execute(db=self.db)
+                        changes.delete_node(node_uuid=node_id)
                         if node.rel_id:
-                            rel_ids_to_update.extend([node.rel_id, origin_nodes[node_id].get("rb").element_id])
+                            changes.rel_ids_to_update.extend([node.rel_id, origin_nodes[node_id].get("rb").element_id])
 
                 for _, attr in node.attributes.items():
                     if attr.action == DiffAction.ADDED:
-                        await add_relationship(
-                            src_node_id=node.db_id,
-                            dst_node_id=attr.db_id,
-                            rel_type="HAS_ATTRIBUTE",
-                            at=at,
-                            branch_name=default_branch.name,
-                            branch_level=default_branch.hierarchy_level,
-                            db=self.db,
-                        )
-                        rel_ids_to_update.append(attr.rel_id)
+                        changes.add_edge(src_node_id=node.db_id, dst_node_id=attr.db_id, rel_type="HAS_ATTRIBUTE")
+                        changes.rel_ids_to_update.append(attr.rel_id)
 
                     elif attr.action == DiffAction.REMOVED and attr.origin_rel_id:
-                        await add_relationship(
+                        changes.add_edge(
                             src_node_id=node.db_id,
                             dst_node_id=attr.db_id,
                             rel_type="HAS_ATTRIBUTE",
-                            branch_name=default_branch.name,
-                            branch_level=default_branch.hierarchy_level,
-                            at=at,
                             status=RelationshipStatus.DELETED,
-                            db=self.db,
                         )
-                        rel_ids_to_update.extend([attr.rel_id, attr.origin_rel_id])
+                        changes.rel_ids_to_update.extend([attr.rel_id, attr.origin_rel_id])
 
                     for prop_type, prop in attr.properties.items():
                         if prop.action == DiffAction.ADDED:
-                            await add_relationship(
-                                src_node_id=attr.db_id,
-                                dst_node_id=prop.db_id,
-                                rel_type=prop_type,
-                                at=at,
-                                branch_name=default_branch.name,
-                                branch_level=default_branch.hierarchy_level,
-                                db=self.db,
-                            )
-                            rel_ids_to_update.append(prop.rel_id)
+                            changes.add_edge(src_node_id=attr.db_id, dst_node_id=prop.db_id, rel_type=prop_type)
+                            changes.rel_ids_to_update.append(prop.rel_id)
 
                         elif (
                             prop.action == DiffAction.UPDATED
                             and (prop.path not in conflict_resolution or conflict_resolution[prop.path])
                             and prop.origin_rel_id
                         ):
-                            await add_relationship(
-                                src_node_id=attr.db_id,
-                                dst_node_id=prop.db_id,
-                                rel_type=prop_type,
-                                at=at,
-                                branch_name=default_branch.name,
-                                branch_level=default_branch.hierarchy_level,
-                                db=self.db,
-                            )
-                            rel_ids_to_update.extend([prop.rel_id, prop.origin_rel_id])
+                            changes.add_edge(src_node_id=attr.db_id, dst_node_id=prop.db_id, rel_type=prop_type)
+                            changes.rel_ids_to_update.extend([prop.rel_id, prop.origin_rel_id])
 
                         elif prop.action == DiffAction.REMOVED and prop.origin_rel_id:
-                            await add_relationship(
+                            changes.add_edge(
                                 src_node_id=attr.db_id,
                                 dst_node_id=prop.db_id,
                                 rel_type=prop_type,
-                                at=at,
-                                branch_name=default_branch.name,
-                                branch_level=default_branch.hierarchy_level,
                                 status=RelationshipStatus.DELETED,
-                                db=self.db,
                             )
-                            rel_ids_to_update.extend([prop.rel_id, prop.origin_rel_id])
+                            changes.rel_ids_to_update.extend([prop.rel_id, prop.origin_rel_id])
 
         # ---------------------------------------------
         # RELATIONSHIPS
@@ -398,40 +421,24 @@ class BranchMerger:
                         if not rel_node.rel_id or not rel_node.db_id or not rel_element.db_id:
                             raise ValueError("node.rel_id, rel_node.db_id and rel_element.db_id must be defined")
 
-                        await add_relationship(
+                        changes.add_edge(
                             src_node_id=rel_node.db_id,
                             dst_node_id=rel_element.db_id,
                             rel_type="IS_RELATED",
-                            at=at,
-                            branch_name=default_branch.name,
-                            branch_level=default_branch.hierarchy_level,
                             status=rel_status,
-                            db=self.db,
                         )
-                        rel_ids_to_update.append(rel_node.rel_id)
+                        changes.rel_ids_to_update.append(rel_node.rel_id)
 
                 for prop_type, prop in rel_element.properties.items():
-                    rel_status = RelationshipStatus.ACTIVE
-                    if prop.action == DiffAction.REMOVED:
-                        rel_status = RelationshipStatus.DELETED
-
-                    await add_relationship(
-                        src_node_id=rel_element.db_id,
-                        dst_node_id=prop.db_id,
-                        rel_type=prop.type,
-                        at=at,
-                        branch_name=default_branch.name,
-                        branch_level=default_branch.hierarchy_level,
-                        db=self.db,
-                    )
-                    rel_ids_to_update.append(prop.rel_id)
+                    changes.add_edge(src_node_id=rel_element.db_id, dst_node_id=prop.db_id, rel_type=prop.type)
+                    changes.rel_ids_to_update.append(prop.rel_id)
 
                     if rel_element.action in [DiffAction.UPDATED, DiffAction.REMOVED] and prop.origin_rel_id:
-                        rel_ids_to_update.append(prop.origin_rel_id)
+                        changes.rel_ids_to_update.append(prop.origin_rel_id)
 
-        if rel_ids_to_update:
-            await update_relationships_to(ids=rel_ids_to_update, to=at, db=self.db)
+        await changes.apply(db=self.db)
 
+        if changes.rel_ids_to_update:
             # Update the branched_from time and update the registry
             # provided that an update is needed
             self.source_branch.branched_from = Timestamp().to_string()
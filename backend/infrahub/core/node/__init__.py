@@ -1,24 +1,26 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from infrahub_sdk import UUIDT
 from infrahub_sdk.utils import is_valid_uuid
 
 from infrahub.core import registry
 from infrahub.core.constants import BranchSupportType, InfrahubKind, RelationshipCardinality
+from infrahub.core.query.attribute import AttributeUpdateQuery
 from infrahub.core.query.node import (
     NodeCheckIDQuery,
     NodeCreateAllQuery,
     NodeDeleteQuery,
     NodeGetListQuery,
+    NodeListGetAttributeQuery,
 )
 from infrahub.core.schema import AttributeSchema, NodeSchema, ProfileSchema, RelationshipSchema
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import InitializationError, ValidationError
 from infrahub.types import ATTRIBUTE_TYPES
 
-from ..relationship import RelationshipManager
+from ..relationship import Relationship, RelationshipManager
 from ..utils import update_relationships_to
 from .base import BaseNode, BaseNodeMeta, BaseNodeOptions
 
@@ -351,9 +353,18 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         return self
 
     async def resolve_relationships(self, db: InfrahubDatabase) -> None:
-        for name in self._relationships:
-            relm: RelationshipManager = getattr(self, name)
-            await relm.resolve(db=db)
+        await self.resolve_relationships_many(db=db, nodes=[self])
+
+    @staticmethod
+    async def resolve_relationships_many(db: InfrahubDatabase, nodes: List[Node]) -> None:
+        """Resolve the peers of all the relationships of multiple nodes together, with one query per kind of peer."""
+        relationships = []
+        for node in nodes:
+            for name in node._relationships:
+                relm: RelationshipManager = getattr(node, name)
+                relationships.extend(relm._relationships)
+
+        await Relationship.resolve_many(db=db, relationships=relationships)
 
     async def load(
         self,
@@ -379,18 +390,24 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         query = await NodeCreateAllQuery.init(db=db, node=self, at=create_at)
         await query.execute(db=db)
 
-        _, self.db_id = query.get_self_ids()
-        self._at = create_at
-        self._updated_at = create_at
-        self._existing = True
+        _, db_id = query.get_self_ids()
+        self._set_created(db_id=db_id, new_ids=query.get_ids(), at=create_at)
 
-        new_ids = query.get_ids()
+        return True
+
+    def _set_created(self, db_id: str, new_ids: Dict[str, Tuple[str, str]], at: Timestamp) -> None:
+        """Assign the ids returned by the database to the node, its attributes and its relationships once created."""
+        self.db_id = db_id
+        self._at = at
+        self._updated_at = at
+        self._existing = True
 
         # Go over the list of Attribute and assign the new IDs one by one
         for name in self._attributes:
             attr: BaseAttribute = getattr(self, name)
             attr.id, attr.db_id = new_ids[name]
-            attr.at = create_at
+            attr.at = at
+            attr._set_db_state()
 
         # Go over the list of relationships and assign the new IDs one by one
         for name in self._relationships:
@@ -398,27 +415,62 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
             for rel in relm._relationships:
                 identifier = f"{rel.schema.identifier}::{rel.peer_id}"
                 rel.id, rel.db_id = new_ids[identifier]
-
-        return True
+            if relm.has_fetched_relationships:
+                relm._set_db_state()
 
     async def _update(
         self,
         db: InfrahubDatabase,
         at: Optional[Timestamp] = None,
     ):
-        """Update the node in the database if needed."""
+        """Update the node in the database if needed.
+
+        Only the attributes and the relationships that have been modified since the node was loaded are saved,
+        the current version of all the modified attributes is retrieved and updated with a single query each.
+        """
 
         update_at = Timestamp(at)
 
-        # Go over the list of Attribute and update them one by one
-        for name in self._attributes:
-            attr: BaseAttribute = getattr(self, name)
-            await attr.save(at=update_at, db=db)
+        attributes: List[BaseAttribute] = [
+            getattr(self, name)
+            for name in self._attributes
+            if getattr(self, name).id and not getattr(self, name).is_from_profile
+        ]
+        modified_attributes = [attr for attr in attributes if attr.has_been_modified]
+
+        if modified_attributes:
+            query = await NodeListGetAttributeQuery.init(
+                db=db,
+                ids=[self.id],
+                fields={attr.name: True for attr in modified_attributes},
+                branch=self._branch,
+                at=update_at,
+                include_source=True,
+                include_owner=True,
+            )
+            await query.execute(db=db)
 
-        # Go over the list of relationships and update them one by one
+            attributes_update_data = []
+            for attr in modified_attributes:
+                current_attr_data, current_attr_result = query.get_result_by_id_and_name(self.id, attr.name)
+                update_data = attr.get_update_data(
+                    current_attr_data=current_attr_data, current_attr_result=current_attr_result
+                )
+                if update_data.has_changes:
+                    attributes_update_data.append(update_data)
+
+            if attributes_update_data:
+                query = await AttributeUpdateQuery.init(db=db, attributes=attributes_update_data, at=update_at)
+                await query.execute(db=db)
+
+            for attr in modified_attributes:
+                attr._set_db_state()
+
+        # Go over the list of relationships and update the ones that have been modified
         for name in self._relationships:
             rel: RelationshipManager = getattr(self, name)
-            await rel.save(at=update_at, db=db)
+            if rel.has_been_modified:
+                await rel.save(at=update_at, db=db)
 
     async def save(
         self,
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, List, Optional
+from collections import defaultdict
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 from infrahub.core import registry
 from infrahub.core.branch import Branch
@@ -10,7 +12,7 @@ from infrahub.exceptions import ValidationError
 from .interface import NodeConstraintInterface
 
 if TYPE_CHECKING:
-    from infrahub.core.schema import MainSchemaTypes
+    from infrahub.core.schema import AttributeSchema, MainSchemaTypes
 
 
 class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
@@ -18,6 +20,21 @@ class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
         self.db = db
         self.branch = branch
 
+    def _get_comparison_schema(
+        self, node_schema: "MainSchemaTypes", unique_attr: "AttributeSchema"
+    ) -> "MainSchemaTypes":
+        comparison_schema: MainSchemaTypes = node_schema
+        if unique_attr.inherited:
+            for generic_parent_schema_name in node_schema.inherit_from:
+                generic_parent_schema = self.db.schema.get(generic_parent_schema_name, branch=self.branch)
+                parent_attr = generic_parent_schema.get_attribute_or_none(unique_attr.name)
+                if parent_attr is None:
+                    continue
+                if parent_attr.unique is True:
+                    comparison_schema = generic_parent_schema
+                    break
+        return comparison_schema
+
     async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[List[str]] = None) -> None:
         at = Timestamp(at)
         node_schema = node.get_schema()
@@ -25,17 +42,8 @@ class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
             if filters and unique_attr.name not in filters:
                 continue
 
-            comparison_schema: MainSchemaTypes = node_schema
+            comparison_schema = self._get_comparison_schema(node_schema=node_schema, unique_attr=unique_attr)
             attr = getattr(node, unique_attr.name)
-            if unique_attr.inherited:
-                for generic_parent_schema_name in node_schema.inherit_from:
-                    generic_parent_schema = self.db.schema.get(generic_parent_schema_name, branch=self.branch)
-                    parent_attr = generic_parent_schema.get_attribute_or_none(unique_attr.name)
-                    if parent_attr is None:
-                        continue
-                    if parent_attr.unique is True:
-                        comparison_schema = generic_parent_schema
-                        break
             nodes = await registry.manager.query(
                 schema=comparison_schema,
                 filters={f"{unique_attr.name}__value": attr.value},
@@ -49,3 +57,53 @@ class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
                 raise ValidationError(
                     {unique_attr.name: f"An object already exist with this value: {unique_attr.name}: {attr.value}"}
                 )
+
+    async def check_many(
+        self, nodes: List[Node], at: Optional[Timestamp] = None, filters: Optional[List[str]] = None
+    ) -> None:
+        """Validate the unique attributes of multiple nodes with a single query per attribute."""
+        if not nodes:
+            return
+
+        at = Timestamp(at)
+        node_schema = nodes[0].get_schema()
+        for unique_attr in node_schema.unique_attributes:
+            if filters and unique_attr.name not in filters:
+                continue
+
+            nodes_per_value: Dict[Any, List[Node]] = defaultdict(list)
+            for node in nodes:
+                value = getattr(node, unique_attr.name).value
+                if isinstance(value, Enum):
+                    value = value.value
+                if not isinstance(value, (str, bool, int)):
+                    # Values that can't be used in a list filter are checked individually
+                    await self.check(node=node, at=at, filters=[unique_attr.name])
+                    continue
+                nodes_per_value[value].append(node)
+
+            if not nodes_per_value:
+                continue
+
+            existing_nodes = await registry.manager.query(
+                schema=self._get_comparison_schema(node_schema=node_schema, unique_attr=unique_attr),
+                filters={f"{unique_attr.name}__values": list(nodes_per_value.keys())},
+                fields={unique_attr.name: None},
+                db=self.db,
+                branch=self.branch,
+                at=at,
+            )
+            existing_ids_per_value: Dict[Any, Set[str]] = defaultdict(set)
+            for existing_node in existing_nodes:
+                existing_value = getattr(existing_node, unique_attr.name).value
+                if isinstance(existing_value, Enum):
+                    existing_value = existing_value.value
+                existing_ids_per_value[existing_value].add(existing_node.get_id())
+
+            for value, value_nodes in nodes_per_value.items():
+                node_ids = {node.id for node in value_nodes}
+                # The value must be unique in the database and within the nodes being validated
+                if len(value_nodes) > 1 or existing_ids_per_value[value] - node_ids:
+                    raise ValidationError(
+                        {unique_attr.name: f"An object already exist with this value: {unique_attr.name}: {value}"}
+                    )
@@ -8,3 +8,13 @@ from infrahub.core.timestamp import Timestamp
 class NodeConstraintInterface(ABC):
     @abstractmethod
     async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[List[str]] = None) -> None: ...
+
+    async def check_many(
+        self, nodes: List[Node], at: Optional[Timestamp] = None, filters: Optional[List[str]] = None
+    ) -> None:
+        """Validate multiple nodes of the same kind, together and against each other.
+
+        The nodes are validated one by one by default.
+        """
+        for node in nodes:
+            await self.check(node, at=at, filters=filters)
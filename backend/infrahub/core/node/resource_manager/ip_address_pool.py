@@ -5,13 +5,13 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from infrahub.core import registry
 from infrahub.core.ipam.reconciler import IpamReconciler
-from infrahub.core.query.ipam import get_ip_addresses
+from infrahub.core.query.ipam import get_ip_addresses, is_ip_address_used
 from infrahub.core.query.resource_manager import (
     IPAddressPoolGetReserved,
     IPAddressPoolSetReserved,
 )
 from infrahub.exceptions import PoolExhaustedError, ValidationError
-from infrahub.pools.address import get_available
+from infrahub.pools.address import AddressFreeRanges, address_free_ranges_index
 
 from .. import Node
 
@@ -78,7 +78,13 @@ class CoreIPAddressPool(Node):
         return node
 
     async def get_next(self, db: InfrahubDatabase, prefixlen: Optional[int] = None) -> IPAddressType:
-        # Measure utilization of all prefixes identified as resources
+        """Return the first free address of the pool, going through the resources in order.
+
+        The free ranges of each resource are kept between the calls in `address_free_ranges_index` and only built
+        from the addresses in the database the first time or after they have been invalidated.
+        The ranges can miss the addresses created by other workers, the first free address is checked in the database
+        and reserved in the ranges if it's already used.
+        """
         resources = await self.resources.get_peers(db=db)  # type: ignore[attr-defined]
         ip_namespace = await self.ip_namespace.get_peer(db=db)  # type: ignore[attr-defined]
 
@@ -89,18 +95,24 @@ class CoreIPAddressPool(Node):
             if not ip_prefix.prefixlen <= prefix_length <= ip_prefix.max_prefixlen:
                 raise ValidationError(input_value="Invalid prefix length for current selected prefix")
 
-            addresses = await get_ip_addresses(
-                db=db, ip_prefix=ip_prefix, namespace=ip_namespace, branch=self._branch, branch_agnostic=True
-            )
-
-            available = get_available(
-                network=ip_prefix,
-                addresses=[ip.address for ip in addresses],
-                is_pool=resource.is_pool.value,  # type: ignore[attr-defined]
+            is_pool = resource.is_pool.value  # type: ignore[attr-defined]
+            free_ranges = address_free_ranges_index.get(
+                namespace_id=ip_namespace.id, network=ip_prefix, is_pool=is_pool
             )
-
-            if available:
-                next_address = available.iter_cidrs()[0]
-                return ipaddress.ip_interface(f"{next_address.ip}/{prefix_length}")
+            if free_ranges is None:
+                addresses = await get_ip_addresses(
+                    db=db, ip_prefix=ip_prefix, namespace=ip_namespace, branch=self._branch, branch_agnostic=True
+                )
+                free_ranges = AddressFreeRanges(
+                    network=ip_prefix, addresses=[ip.address for ip in addresses], is_pool=is_pool
+                )
+                address_free_ranges_index.set(namespace_id=ip_namespace.id, free_ranges=free_ranges, is_pool=is_pool)
+
+            while (next_address := free_ranges.first()) is not None:
+                if not await is_ip_address_used(
+                    db=db, address=next_address, namespace=ip_namespace, branch=self._branch, branch_agnostic=True
+                ):
+                    return ipaddress.ip_interface(f"{next_address}/{prefix_length}")
+                free_ranges.reserve(address=next_address)
 
         raise PoolExhaustedError("There are no more addresses available in this pool.")
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Generator, List, Optional, Sequence, Tuple, Union
 
 import ujson
 from neo4j.graph import Node as Neo4jNode
@@ -154,64 +154,86 @@ def cleanup_return_labels(labels):
     return clean_labels
 
 
-class QueryResult:
-    def __init__(self, data: List[Union[Neo4jNode, Neo4jRelationship, List[Neo4jNode]]], labels: List[str]):
-        self.data = data
+class QueryResultLabels:
+    """Return labels of a query, with the position of each label in the records.
+
+    The labels are identical for all the records returned by a query so they are processed once per query
+    and shared between all the results.
+    """
+
+    __slots__ = ("labels", "positions")
+
+    def __init__(self, labels: List[str]):
         self.labels = cleanup_return_labels(labels)
-        self.branch_score: int = 0
-        self.time_score: int = 0
+        self.positions = {label: idx for idx, label in reversed(list(enumerate(self.labels)))}
+
+
+class QueryResult:
+    __slots__ = ("data", "_labels", "permission_score", "_scores")
+
+    def __init__(
+        self,
+        data: Sequence[Union[Neo4jNode, Neo4jRelationship, List[Neo4jNode]]],
+        labels: Union[List[str], QueryResultLabels],
+    ):
+        self.data = tuple(data)
+        self._labels = labels if isinstance(labels, QueryResultLabels) else QueryResultLabels(labels=labels)
         self.permission_score = PermissionLevel.DEFAULT
-        self.has_deleted_rels: bool = False
+        self._scores: Optional[Tuple[int, int, bool]] = None
 
-        self.calculate_branch_score()
-        self.calculate_time_score()
-        self.check_rels_status()
+    @property
+    def labels(self) -> List[str]:
+        return self._labels.labels
 
-    def calculate_branch_score(self):
+    @property
+    def branch_score(self) -> int:
         """The branch score is a simple way to order and classify multiple responses for the same branch.
         If the branch name is not the default branch it will get a higher score
         """
-        self.branch_score = 0
-
-        for rel in self.get_rels():
-            branch_level = rel.get("branch_level", None)
+        return self._get_scores()[0]
 
-            if not branch_level:
-                continue
-
-            self.branch_score += branch_level
-
-    def calculate_time_score(self):
+    @property
+    def time_score(self) -> int:
         """The time score look into the to and from time all relationships
         if the 'to' field is not defined
         """
-        self.time_score = 0
+        return self._get_scores()[1]
 
-        for rel in self.get_rels():
-            branch_name = rel.get("branch", None)
-
-            if not branch_name:
-                continue
+    @property
+    def has_deleted_rels(self) -> bool:
+        """Indicate if some relationships have the status deleted."""
+        return self._get_scores()[2]
 
-            to_time = rel.get("to", None)
+    def _get_scores(self) -> Tuple[int, int, bool]:
+        """Calculate the branch score, the time score and the status of the relationships in a single pass.
 
-            if to_time:
-                self.time_score += 1
-            else:
-                self.time_score += 2
+        The scores are only calculated the first time they are accessed, most results are never compared.
+        """
+        if self._scores is not None:
+            return self._scores
 
-    def check_rels_status(self):
-        """Check if some relationships have the status deleted and update the flag `has_deleted_rels`"""
+        branch_score = 0
+        time_score = 0
+        has_deleted_rels = False
         for rel in self.get_rels():
+            branch_level = rel.get("branch_level", None)
+            if branch_level:
+                branch_score += branch_level
+
+            if rel.get("branch", None):
+                time_score += 1 if rel.get("to", None) else 2
+
             if rel.get("status", None) == "deleted":
-                self.has_deleted_rels = True
-                return
+                has_deleted_rels = True
+
+        self._scores = (branch_score, time_score, has_deleted_rels)
+        return self._scores
 
     def _get(self, label: str) -> Union[Neo4jNode, Neo4jRelationship, List[Neo4jNode]]:
-        if label not in self.labels:
+        return_id = self._labels.positions.get(label)
+        if return_id is None:
             raise ValueError(f"{label} is not a valid value for this query, must be one of {self.labels}")
 
-        return_id = self.labels.index(label)
         return self.data[return_id]
 
     def get(self, label: str) -> Union[Neo4jNode, Neo4jRelationship]:
@@ -468,12 +490,9 @@ class Query(ABC):
 
         return ":params { " + ", ".join(params) + " }"
 
-    async def execute(
+    def _get_query_for_execution(
         self, db: InfrahubDatabase, profile: bool = False, runtime: Neo4jRuntime = Neo4jRuntime.DEFAULT
-    ) -> Self:
-        # Ensure all mandatory params have been provided
-        # Ensure at least 1 return obj has been defined
-
+    ) -> str:
         if config.SETTINGS.miscellaneous.print_query_details:
             self.print(include_var=True)
 
@@ -485,49 +504,74 @@ class Query(ABC):
         if runtime != Neo4jRuntime.DEFAULT and db.db_type == DatabaseType.NEO4J:
             query_str = f"CYPHER runtime={runtime.value}\n" + query_str
 
+        return query_str
+
+    async def execute(
+        self, db: InfrahubDatabase, profile: bool = False, runtime: Neo4jRuntime = Neo4jRuntime.DEFAULT
+    ) -> Self:
+        # Ensure all mandatory params have been provided
+        # Ensure at least 1 return obj has been defined
+
         if self.type == QueryType.READ:
-            if self.limit or self.offset:
-                results = await db.execute_query(query=query_str, params=self.params, name=self.name)
-            else:
-                results = await self.query_with_size_limit(db=db)
+            self.results = [result async for result in self.execute_stream(db=db, profile=profile, runtime=runtime)]
+            return self
 
-        elif self.type == QueryType.WRITE:
-            results, metadata = await db.execute_query_with_metadata(
-                query=query_str, params=self.params, name=self.name
-            )
-            if "stats" in metadata:
-                self.stats.add(metadata.get("stats"))
-        else:
+        if self.type != QueryType.WRITE:
             raise ValueError(f"unknown value for {self.type}")
 
+        query_str = self._get_query_for_execution(db=db, profile=profile, runtime=runtime)
+        results, metadata = await db.execute_query_with_metadata(query=query_str, params=self.params, name=self.name)
+        if "stats" in metadata:
+            self.stats.add(metadata.get("stats"))
+
         if not results and self.raise_error_if_empty:
             raise QueryError(query_str, self.params)
 
-        self.results = [QueryResult(data=result, labels=self.return_labels) for result in results]
+        labels = QueryResultLabels(labels=self.return_labels)
+        self.results = [QueryResult(data=result, labels=labels) for result in results]
         self.has_been_executed = True
 
         return self
 
-    async def query_with_size_limit(self, db: InfrahubDatabase):
-        query_limit = config.SETTINGS.database.query_size_limit
-        offset = 0
-        results = []
-        remaining = True
-        while remaining:
-            offset_results, metadata = await db.execute_query_with_metadata(
-                query=self.get_query(limit=query_limit, offset=offset),
-                params=self.params,
-                name=self.name,
-            )
-            if "stats" in metadata:
-                self.stats.add(metadata.get("stats"))
-            results.extend(offset_results)
-            offset += query_limit
+    async def execute_stream(
+        self, db: InfrahubDatabase, profile: bool = False, runtime: Neo4jRuntime = Neo4jRuntime.DEFAULT
+    ) -> AsyncIterator[QueryResult]:
+        """Execute a READ query and yield the results one by one as they are pulled from the database cursor.
 
-            if len(offset_results) < query_limit:
-                remaining = False
+        The records are fetched from the database in batches of `query_size_limit` and the results
+        are not stored on the query, so the memory usage doesn't grow with the number of records returned.
+        """
+        if self.type != QueryType.READ:
+            raise TypeError("Only a Read query can be streamed.")
 
-        return results
+        query_str = self._get_query_for_execution(db=db, profile=profile, runtime=runtime)
+
+        has_results = False
+        labels = QueryResultLabels(labels=self.return_labels)
+        async for record in db.execute_query_stream(query=query_str, params=self.params, name=self.name):
+            has_results = True
+            yield QueryResult(data=record, labels=labels)
+
+        if not has_results and self.raise_error_if_empty:
+            raise QueryError(query_str, self.params)
+
+        self.has_been_executed = True
+
+    async def execute_stream_group_by(self, db: InfrahubDatabase, *args: Tuple[str, str]) -> List[QueryResult]:
+        """Execute a READ query and return the results grouped by the labels and attributes provided, filtered by score.
+
+        This is the streaming equivalent of `execute` followed by `get_results_group_by`,
+        only the best result for each group is kept in memory while the records are being read.
+        """
+        best_results: Dict[Tuple[Any, ...], Tuple[Tuple[int, int, bool], QueryResult]] = {}
+
+        async for result in self.execute_stream(db=db):
+            identifier = self._get_group_by_identifier(result, *args)
+            score = (result.branch_score, result.time_score, result.has_deleted_rels)
+            if identifier not in best_results or score > best_results[identifier][0]:
+                best_results[identifier] = (score, result)
+
+        return [result for _, result in best_results.values() if not result.has_deleted_rels]
 
     async def count(self, db: InfrahubDatabase) -> int:
         """Count the number of results matching a READ query.
@@ -587,13 +631,7 @@ class Query(ABC):
 
         # Extract all attrname and relationships on all branches
         for idx, result in enumerate(self.results):
-            identifier = []
-            for label, attribute in args:
-                node = result.get(label)
-                if hasattr(node, attribute):
-                    identifier.append(getattr(node, attribute))
-                else:
-                    identifier.append(node.get(attribute, None))
+            identifier = self._get_group_by_identifier(result, *args)
 
             info = {
                 "idx": idx,
@@ -601,7 +639,7 @@ class Query(ABC):
                 "time_score": result.time_score,
                 "deleted": result.has_deleted_rels,
             }
-            attrs_info[tuple(identifier)].append(info)
+            attrs_info[identifier].append(info)
 
         for values in attrs_info.values():
             attr_info = sorted(values, key=lambda i: (i["branch_score"], i["time_score"], i["deleted"]), reverse=True)[
@@ -612,6 +650,18 @@ class Query(ABC):
 
             yield self.results[attr_info["idx"]]
 
+    @staticmethod
+    def _get_group_by_identifier(result: QueryResult, *args: Tuple[str, str]) -> Tuple[Any, ...]:
+        identifier = []
+        for label, attribute in args:
+            node = result.get(label)
+            if hasattr(node, attribute):
+                identifier.append(getattr(node, attribute))
+            else:
+                identifier.append(node.get(attribute, None))
+
+        return tuple(identifier)
+
     @property
     def num_of_results(self) -> int:
         if not self.has_been_executed:
@@ -2,14 +2,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-from infrahub.core.constants import AttributeDBNodeType
 from infrahub.core.constants.relationship_label import RELATIONSHIP_TO_NODE_LABEL, RELATIONSHIP_TO_VALUE_LABEL
 from infrahub.core.constants.schema import FlagProperty, NodeProperty
 from infrahub.core.query import Query, QueryNode, QueryRel, QueryType
 from infrahub.core.timestamp import Timestamp
+from infrahub.core.utils import element_id_to_id
+from infrahub.exceptions import QueryError
 
 if TYPE_CHECKING:
-    from infrahub.core.attribute import BaseAttribute
+    from typing_extensions import Self
+
+    from infrahub.core.attribute import AttributeUpdateData, BaseAttribute
     from infrahub.core.branch import Branch
     from infrahub.core.query import QueryElement
     from infrahub.database import InfrahubDatabase
@@ -41,123 +44,139 @@ class AttributeQuery(Query):
         super().__init__(*args, **kwargs)
 
 
-class AttributeUpdateValueQuery(AttributeQuery):
-    name = "attribute_update_value"
-    type: QueryType = QueryType.WRITE
-
-    raise_error_if_empty: bool = True
-
-    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
-        at = self.at or self.attr.at
-
-        self.params["attr_uuid"] = self.attr.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
-        content = self.attr.to_db()
-        self.params.update(self.attr.to_db())
-
-        prop_list = [f"{key}: ${key}" for key in content.keys()]
-
-        labels = ["AttributeValue"]
-        node_type = self.attr.get_db_node_type()
-        if node_type == AttributeDBNodeType.IPHOST:
-            labels.append("AttributeIPHost")
-        elif node_type == AttributeDBNodeType.IPNETWORK:
-            labels.append("AttributeIPNetwork")
-
-        query = """
-        MATCH (a:Attribute { uuid: $attr_uuid })
-        MERGE (av:%(labels)s { %(props)s } )
-        CREATE (a)-[r:%(rel_label)s { branch: $branch, branch_level: $branch_level, status: "active", from: $at, to: null }]->(av)
-        """ % {"rel_label": self.attr._rel_to_value_label, "labels": ":".join(labels), "props": ", ".join(prop_list)}
+class AttributeUpdateQuery(Query):
+    """Update the value, the flags and the node properties of one or multiple attributes with a single query.
 
-        self.add_to_query(query)
-        self.return_labels = ["a", "av", "r"]
+    The relationships that must be closed are provided for each attribute by the caller,
+    a new relationship is created for each property that changed.
+    The attributes and the nodes used as source or owner are matched first and nothing is written if one of them
+    is missing, the relationships to close are only closed once all the new relationships have been created.
+    """
 
+    name = "attribute_update"
 
-class AttributeUpdateFlagQuery(AttributeQuery):
-    name = "attribute_update_flag"
     type: QueryType = QueryType.WRITE
 
     raise_error_if_empty: bool = True
 
-    def __init__(
-        self,
-        flag_name: str,
-        *args,
-        **kwargs,
-    ):
-        SUPPORTED_FLAGS = ["is_visible", "is_protected"]
-
-        if flag_name not in SUPPORTED_FLAGS:
-            raise ValueError(f"Only {SUPPORTED_FLAGS} are supported for now.")
-
-        self.flag_name = flag_name
-
+    def __init__(self, attributes: List[AttributeUpdateData], *args: Any, **kwargs: Any):
+        self.attributes = attributes
+        self.nbr_rels_to_create = 0
         super().__init__(*args, **kwargs)
 
-    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
-        at = self.at or self.attr.at
-
-        self.params["attr_uuid"] = self.attr.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
-        self.params["flag_value"] = getattr(self.attr, self.flag_name)
-        self.params["flag_type"] = self.attr.get_kind()
+    async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
+        self.params["at"] = self.at.to_string()
+        self.params["rel_ids_to_close"] = [
+            element_id_to_id(rel_id) for attr in self.attributes for rel_id in attr.rel_ids_to_close
+        ]
+        self.params["attribute_uuids"] = list({attr.uuid for attr in self.attributes})
+        self.params["node_property_ids"] = list(
+            {prop_id for attr in self.attributes for prop_id in attr.node_properties.values()}
+        )
 
         query = """
-        MATCH (a:Attribute { uuid: $attr_uuid })
-        MERGE (flag:Boolean { value: $flag_value })
-        CREATE (a)-[r:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at, to: null }]->(flag)
-        """ % self.flag_name.upper()
-
+        OPTIONAL MATCH (attr:Attribute)
+        WHERE attr.uuid IN $attribute_uuids
+        WITH count(DISTINCT attr) AS nbr_attributes
+        OPTIONAL MATCH (prop:Node)
+        WHERE prop.uuid IN $node_property_ids
+        WITH nbr_attributes, count(DISTINCT prop) AS nbr_node_properties
+        WHERE nbr_attributes = size($attribute_uuids) AND nbr_node_properties = size($node_property_ids)
+        WITH 0 AS nbr_created_rels
+        """
         self.add_to_query(query)
-        self.return_labels = ["a", "flag", "r"]
-
-
-class AttributeUpdateNodePropertyQuery(AttributeQuery):
-    name = "attribute_update_node_property"
-    type: QueryType = QueryType.WRITE
-
-    raise_error_if_empty: bool = True
 
-    def __init__(
-        self,
-        prop_name: str,
-        prop_id: str,
-        *args,
-        **kwargs,
-    ):
-        self.prop_name = prop_name
-        self.prop_id = prop_id
-
-        super().__init__(*args, **kwargs)
+        for idx, attr in enumerate(self.attributes):
+            self._add_attribute_to_query(idx=idx, attr=attr)
 
-    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
-        at = self.at or self.attr.at
+        query = """
+        OPTIONAL MATCH ()-[rel_to_close]->()
+        WHERE ID(rel_to_close) IN $rel_ids_to_close
+        SET rel_to_close.to = $at
+        WITH nbr_created_rels, count(rel_to_close) AS nbr_closed_rels
+        """
+        self.add_to_query(query)
+        self.return_labels = ["nbr_created_rels", "nbr_closed_rels"]
 
-        self.params["attr_uuid"] = self.attr.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
-        self.params["prop_name"] = self.prop_name
-        self.params["prop_id"] = self.prop_id
+    def _add_attribute_to_query(self, idx: int, attr: AttributeUpdateData) -> None:
+        prefix = f"attr{idx}"
+        self.params[f"{prefix}_uuid"] = attr.uuid
+        self.params[f"{prefix}_branch"] = attr.branch
+        self.params[f"{prefix}_branch_level"] = attr.branch_level
 
-        rel_name = f"HAS_{self.prop_name.upper()}"
+        rel_props = (
+            '{ branch: $%(prefix)s_branch, branch_level: $%(prefix)s_branch_level, status: "active", from: $at, to: null }'
+            % {"prefix": prefix}
+        )
 
-        query = (
-            """
-        MATCH (a:Attribute { uuid: $attr_uuid })
-        MATCH (np:Node { uuid: $prop_id })
-        CREATE (a)-[r:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at, to: null }]->(np)
-        """
-            % rel_name
+        self.add_to_query("MATCH (%(prefix)s:Attribute { uuid: $%(prefix)s_uuid })" % {"prefix": prefix})
+        rel_names = []
+
+        if attr.content is not None:
+            prop_list = []
+            for key, value in attr.content.items():
+                self.params[f"{prefix}_value_{key}"] = value
+                prop_list.append(f"{key}: ${prefix}_value_{key}")
+
+            query = """
+            MERGE (%(prefix)s_av:%(labels)s { %(props)s })
+            CREATE (%(prefix)s)-[%(prefix)s_rel_value:%(rel_label)s %(rel_props)s]->(%(prefix)s_av)
+            """ % {
+                "prefix": prefix,
+                "labels": ":".join(attr.labels),
+                "props": ", ".join(prop_list),
+                "rel_label": RELATIONSHIP_TO_VALUE_LABEL,
+                "rel_props": rel_props,
+            }
+            self.add_to_query(query)
+            rel_names.append(f"{prefix}_rel_value")
+
+        for flag_name, flag_value in attr.flag_properties.items():
+            self.params[f"{prefix}_{flag_name}"] = flag_value
+            query = """
+            MERGE (%(prefix)s_%(flag_name)s:Boolean { value: $%(prefix)s_%(flag_name)s })
+            CREATE (%(prefix)s)-[%(prefix)s_rel_%(flag_name)s:%(rel_label)s %(rel_props)s]->(%(prefix)s_%(flag_name)s)
+            """ % {"prefix": prefix, "flag_name": flag_name, "rel_label": flag_name.upper(), "rel_props": rel_props}
+            self.add_to_query(query)
+            rel_names.append(f"{prefix}_rel_{flag_name}")
+
+        for prop_name, prop_id in attr.node_properties.items():
+            self.params[f"{prefix}_{prop_name}_id"] = prop_id
+            query = """
+            WITH %(variables)s
+            MATCH (%(prefix)s_%(prop_name)s:Node { uuid: $%(prefix)s_%(prop_name)s_id })
+            CREATE (%(prefix)s)-[%(prefix)s_rel_%(prop_name)s:%(rel_label)s %(rel_props)s]->(%(prefix)s_%(prop_name)s)
+            """ % {
+                "prefix": prefix,
+                "prop_name": prop_name,
+                "variables": ", ".join(["nbr_created_rels", prefix, *rel_names]),
+                "rel_label": f"HAS_{prop_name.upper()}",
+                "rel_props": rel_props,
+            }
+            self.add_to_query(query)
+            rel_names.append(f"{prefix}_rel_{prop_name}")
+
+        self.nbr_rels_to_create += len(rel_names)
+
+        # Collapse the rows of the attribute and add the number of relationships created for it
+        nbr_rels = " + ".join(f"count(DISTINCT {rel_name})" for rel_name in rel_names) or "0"
+        self.add_to_query(
+            "WITH nbr_created_rels, %(nbr_rels)s AS %(prefix)s_nbr_created_rels"
+            % {"nbr_rels": nbr_rels, "prefix": prefix}
         )
+        self.add_to_query(f"WITH nbr_created_rels + {prefix}_nbr_created_rels AS nbr_created_rels")
 
-        self.add_to_query(query)
-        self.return_labels = ["a", "np", "r"]
+    async def execute(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> Self:
+        await super().execute(db, *args, **kwargs)
+
+        nbr_created_rels = self.get_result().get("nbr_created_rels")
+        if nbr_created_rels != self.nbr_rels_to_create:
+            raise QueryError(
+                self.get_query(),
+                self.params,
+                message=f"Only {nbr_created_rels} of the {self.nbr_rels_to_create} relationships of the attributes have been created.",
+            )
+        return self
 
 
 class AttributeGetQuery(AttributeQuery):
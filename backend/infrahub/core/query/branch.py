@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 from infrahub import config
 from infrahub.core.constants import RelationshipStatus
@@ -39,6 +39,102 @@ class AddNodeToBranch(Query):
         self.add_to_query(query)
 
 
+class AddNodesToBranch(Query):
+    """Batch version of AddNodeToBranch, add multiple nodes to a branch with a single query."""
+
+    name: str = "nodes_add_to_branch"
+    insert_return: bool = False
+
+    type: QueryType = QueryType.WRITE
+
+    def __init__(self, node_ids: List[str], *args: Any, **kwargs: Any):
+        self.node_ids = node_ids
+        super().__init__(*args, **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
+        query = """
+        MATCH (root:Root)
+        UNWIND $node_ids AS node_id
+        MATCH (d) WHERE ID(d) = node_id
+        CREATE (d)-[r:IS_PART_OF { branch: $branch, branch_level: $branch_level, from: $now, to: null, status: $status }]->(root)
+        """
+
+        self.params["node_ids"] = [element_id_to_id(node_id) for node_id in self.node_ids]
+        self.params["now"] = self.at.to_string()
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+        self.params["status"] = RelationshipStatus.ACTIVE.value
+
+        self.add_to_query(query)
+
+
+class DeleteNodesFromBranch(Query):
+    """Batch version of NodeDeleteQuery, mark multiple nodes as deleted in a branch with a single query."""
+
+    name: str = "nodes_delete_from_branch"
+    insert_return: bool = False
+
+    type: QueryType = QueryType.WRITE
+
+    def __init__(self, node_uuids: List[str], *args: Any, **kwargs: Any):
+        self.node_uuids = node_uuids
+        super().__init__(*args, **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
+        query = """
+        MATCH (root:Root)
+        UNWIND $node_uuids AS node_uuid
+        MATCH (n:Node { uuid: node_uuid })
+        CREATE (n)-[r:IS_PART_OF { branch: $branch, branch_level: $branch_level, status: "deleted", from: $at }]->(root)
+        """
+
+        self.params["node_uuids"] = self.node_uuids
+        self.params["at"] = self.at.to_string()
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+
+        self.add_to_query(query)
+
+
+class AddRelationshipsToBranch(Query):
+    """Batch version of add_relationship, create multiple edges of the same type in a branch with a single query.
+
+    Each edge must be defined as a dict with the keys: src_node_id, dst_node_id and status
+    """
+
+    name: str = "relationships_add_to_branch"
+    insert_return: bool = False
+
+    type: QueryType = QueryType.WRITE
+
+    def __init__(self, rel_type: str, edges: List[Dict[str, Any]], *args: Any, **kwargs: Any):
+        self.rel_type = rel_type
+        self.edges = edges
+        super().__init__(*args, **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
+        query = """
+        UNWIND $edges AS edge
+        MATCH (s) WHERE ID(s) = edge.src_node_id
+        MATCH (d) WHERE ID(d) = edge.dst_node_id
+        CREATE (s)-[r:%(rel_type)s { branch: $branch, branch_level: $branch_level, from: $at, to: null, status: edge.status }]->(d)
+        """ % {"rel_type": str(self.rel_type).upper()}
+
+        self.params["edges"] = [
+            {
+                "src_node_id": element_id_to_id(edge["src_node_id"]),
+                "dst_node_id": element_id_to_id(edge["dst_node_id"]),
+                "status": edge["status"],
+            }
+            for edge in self.edges
+        ]
+        self.params["at"] = self.at.to_string()
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+
+        self.add_to_query(query)
+
+
 class DeleteBranchRelationshipsQuery(Query):
     name: str = "delete_branch_relationships"
     insert_return: bool = False
@@ -88,59 +184,103 @@ class GetAllBranchInternalRelationshipQuery(Query):
         self.return_labels = ["r"]
 
 
-class RebaseBranchUpdateRelationshipQuery(Query):
-    name: str = "rebase_branch_update"
+class GetBranchRelationshipsToRebaseQuery(Query):
+    """Return the ids of the edges of a given type in a branch and whether they must be dropped by a rebase at `at`.
 
-    type: QueryType = QueryType.WRITE
+    An edge is dropped if its conflict has been resolved as `drop`, if it was created after `at` and is still active
+    or if it was already deleted before `at`. The lookup is done one edge type at a time to use the index on `branch`.
+    """
 
-    def __init__(self, ids: List[str], *args: Any, **kwargs: Any) -> None:
-        self.ids = ids
+    name: str = "get_branch_relationships_to_rebase"
+
+    type: QueryType = QueryType.READ
+
+    def __init__(self, edge_type: str, *args: Any, **kwargs: Any) -> None:
+        self.edge_type = edge_type
         super().__init__(*args, **kwargs)
 
     async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
         query = """
-        MATCH ()-[r]->()
-        WHERE ID(r) IN $ids
-        SET r.from = $at
-        SET r.conflict = NULL
-        """
+        MATCH ()-[r:%(edge_type)s]->()
+        WHERE r.branch = $branch_name
+        WITH ID(r) AS rel_id, (
+            coalesce(r.conflict = "drop", false)
+            OR (r.to IS NULL AND r.from > $at)
+            OR (r.to IS NOT NULL AND r.to < $at)
+        ) AS to_delete
+        """ % {"edge_type": self.edge_type}
 
         self.add_to_query(query=query)
 
+        self.params["branch_name"] = self.branch.name
         self.params["at"] = self.at.to_string()
-        self.params["ids"] = [element_id_to_id(id) for id in self.ids]
-        self.return_labels = ["ID(r)"]
+        self.return_labels = ["rel_id", "to_delete"]
+
+    def get_rel_ids(self) -> Tuple[List[int], List[int]]:
+        """Return the ids of the edges to delete and the ids of the edges to update."""
+        rels_to_delete = []
+        rels_to_update = []
+        for result in self.get_results():
+            if result.get("to_delete"):
+                rels_to_delete.append(result.get("rel_id"))
+            else:
+                rels_to_update.append(result.get("rel_id"))
+        return rels_to_delete, rels_to_update
 
 
 class RebaseBranchDeleteRelationshipQuery(Query):
+    """Delete a chunk of edges of a branch, the nodes left without any edge are deleted as well."""
+
     name: str = "rebase_branch_delete"
 
     type: QueryType = QueryType.WRITE
     insert_return: bool = False
 
-    def __init__(self, ids: List[str], *args: Any, **kwargs: Any) -> None:
+    def __init__(self, ids: List[int], *args: Any, **kwargs: Any) -> None:
         self.ids = ids
         super().__init__(*args, **kwargs)
 
     async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
-        if config.SETTINGS.database.db_type == config.DatabaseType.MEMGRAPH:
-            query = """
-            MATCH p = (s)-[r]-(d)
-            WHERE ID(r) IN $ids
-            DELETE r
-            """
-        else:
-            query = """
-            MATCH p = (s)-[r]-(d)
-            WHERE ID(r) IN $ids
-            DELETE r
-            WITH *
-            UNWIND nodes(p) AS n
-            MATCH (n)
+        query = """
+        MATCH (s)-[r]->(d)
+        WHERE ID(r) IN $ids
+        DELETE r
+        """
+        if config.SETTINGS.database.db_type != config.DatabaseType.MEMGRAPH:
+            query += """
+            WITH collect(s) + collect(d) AS nodes
+            UNWIND nodes AS n
+            WITH DISTINCT n
             WHERE NOT exists((n)--())
             DELETE n
             """
 
         self.add_to_query(query=query)
 
-        self.params["ids"] = [element_id_to_id(id) for id in self.ids]
+        self.params["ids"] = self.ids
+
+
+class RebaseBranchUpdateRelationshipQuery(Query):
+    """Move a chunk of edges of a branch to `at` and clear their conflict flag."""
+
+    name: str = "rebase_branch_update"
+
+    type: QueryType = QueryType.WRITE
+    insert_return: bool = False
+
+    def __init__(self, ids: List[int], *args: Any, **kwargs: Any) -> None:
+        self.ids = ids
+        super().__init__(*args, **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
+        query = """
+        MATCH ()-[r]->()
+        WHERE ID(r) IN $ids
+        SET r.from = $at
+        SET r.conflict = NULL
+        """
+
+        self.add_to_query(query=query)
+
+        self.params["at"] = self.at.to_string()
+        self.params["ids"] = self.ids
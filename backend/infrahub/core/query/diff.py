@@ -57,6 +57,7 @@ class DiffNodeQuery(DiffQuery):
         kinds_include: Optional[List[str]] = None,
         kinds_exclude: Optional[List[str]] = None,
         branch_support: Optional[List[BranchSupportType]] = None,
+        node_ids: Optional[List[str]] = None,
         *args,
         **kwargs,
     ):
@@ -65,6 +66,7 @@ class DiffNodeQuery(DiffQuery):
         self.kinds_include = kinds_include
         self.kinds_exclude = kinds_exclude
         self.branch_support = branch_support or [BranchSupportType.AWARE]
+        self.node_ids = node_ids
 
         super().__init__(*args, **kwargs)
 
@@ -98,6 +100,10 @@ class DiffNodeQuery(DiffQuery):
             where_clause += "NOT(n.kind IN $kinds_exclude) AND "
             self.params["kinds_exclude"] = self.kinds_exclude
 
+        if self.node_ids is not None:
+            where_clause += "n.uuid IN $node_ids AND "
+            self.params["node_ids"] = self.node_ids
+
         where_clause += "n.branch_support IN $branch_support AND %s" % "\n AND ".join(br_filter)
 
         query = (
@@ -124,6 +130,7 @@ class DiffAttributeQuery(DiffQuery):
         kinds_include: Optional[List[str]] = None,
         kinds_exclude: Optional[List[str]] = None,
         branch_support: Optional[List[BranchSupportType]] = None,
+        node_ids: Optional[List[str]] = None,
         *args,
         **kwargs,
     ):
@@ -132,6 +139,7 @@ class DiffAttributeQuery(DiffQuery):
         self.kinds_include = kinds_include
         self.kinds_exclude = kinds_exclude
         self.branch_support = branch_support or [BranchSupportType.AWARE]
+        self.node_ids = node_ids
 
         super().__init__(*args, **kwargs)
 
@@ -162,6 +170,10 @@ class DiffAttributeQuery(DiffQuery):
             where_clause += "NOT(n.kind IN $kinds_exclude) AND "
             self.params["kinds_exclude"] = self.kinds_exclude
 
+        if self.node_ids is not None:
+            where_clause += "n.uuid IN $node_ids AND "
+            self.params["node_ids"] = self.node_ids
+
         where_clause += "a.branch_support IN $branch_support AND %s" % "\n AND ".join(rels_filters)
 
         query = (
@@ -188,6 +200,7 @@ class DiffRelationshipQuery(DiffQuery):
         kinds_include: Optional[List[str]] = None,
         kinds_exclude: Optional[List[str]] = None,
         branch_support: Optional[List[BranchSupportType]] = None,
+        rel_ids: Optional[List[str]] = None,
         *args,
         **kwargs,
     ):
@@ -196,6 +209,7 @@ class DiffRelationshipQuery(DiffQuery):
         self.kinds_include = kinds_include
         self.kinds_exclude = kinds_exclude
         self.branch_support = branch_support or [BranchSupportType.AWARE]
+        self.rel_ids = rel_ids
 
         super().__init__(*args, **kwargs)
 
@@ -217,6 +231,10 @@ class DiffRelationshipQuery(DiffQuery):
             where_clause += "NOT(src.kind IN $kinds_exclude OR dst.kind IN $kinds_exclude) AND "
             self.params["kinds_exclude"] = self.kinds_exclude
 
+        if self.rel_ids is not None:
+            where_clause += "rel.uuid IN $rel_ids AND "
+            self.params["rel_ids"] = self.rel_ids
+
         query = (
             """
         CALL {
@@ -261,16 +279,26 @@ class DiffRelationshipPropertyQuery(DiffQuery):
     name: str = "diff_relationship_property"
     type: QueryType = QueryType.READ
 
+    def __init__(self, rel_ids: Optional[List[str]] = None, *args, **kwargs):
+        self.rel_ids = rel_ids
+
+        super().__init__(*args, **kwargs)
+
     async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
         rels_filter, rels_params = self.branch.get_query_filter_relationships_range(
             rel_labels=["r"], start_time=self.diff_from, end_time=self.diff_to
         )
         self.params.update(rels_params)
 
+        rel_ids_filter = ""
+        if self.rel_ids is not None:
+            rel_ids_filter = "rel.uuid IN $rel_ids AND "
+            self.params["rel_ids"] = self.rel_ids
+
         query = """
         CALL {
             MATCH (rel:Relationship)-[r3:IS_VISIBLE|IS_PROTECTED|HAS_SOURCE|HAS_OWNER]-()
-            WHERE (r3.branch IN $branch_names AND r3.from >= $diff_from AND r3.from <= $diff_to
+            WHERE (%s r3.branch IN $branch_names AND r3.from >= $diff_from AND r3.from <= $diff_to
             AND ((r3.to >= $diff_from AND r3.to <= $diff_to ) OR r3.to is NULL))
             RETURN DISTINCT rel
         }
@@ -290,7 +318,7 @@ class DiffRelationshipPropertyQuery(DiffQuery):
             r3.branch IN $branch_names AND r3.from >= $diff_from AND r3.from <= $diff_to
             AND ((r3.to >= $diff_from AND r3.to <= $diff_to) OR r3.to is NULL)
         )
-        """ % "\n AND ".join(rels_filter)
+        """ % (rel_ids_filter, "\n AND ".join(rels_filter))
 
         self.add_to_query(query)
         self.params["branch_names"] = self.branch_names
@@ -300,6 +328,70 @@ class DiffRelationshipPropertyQuery(DiffQuery):
         self.return_labels = ["sn", "dn", "rel", "rp", "r3", "r1", "r2"]
 
 
+class DiffChangedNodesQuery(DiffQuery):
+    """Return the uuid of the nodes with at least one edge created or ended between diff_from (excluded) and diff_to.
+
+    Used to identify which nodes need to be recalculated when an existing diff is extended to a later diff_to.
+    """
+
+    name: str = "diff_changed_nodes"
+    insert_return: bool = False
+
+    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
+        changed_filter = """r.branch IN $branch_names AND (
+            (r.from > $diff_from AND r.from <= $diff_to) OR (r.to > $diff_from AND r.to <= $diff_to)
+        )"""
+
+        query = """
+        MATCH (n:Node)-[r:IS_PART_OF|HAS_ATTRIBUTE]-()
+        WHERE %(filter)s
+        RETURN DISTINCT n.uuid AS node_id
+        UNION
+        MATCH (n:Node)-[:HAS_ATTRIBUTE]-(:Attribute)-[r:HAS_VALUE|IS_VISIBLE|IS_PROTECTED|HAS_SOURCE|HAS_OWNER]->()
+        WHERE %(filter)s
+        RETURN DISTINCT n.uuid AS node_id
+        """ % {"filter": changed_filter}
+
+        self.add_to_query(query)
+        self.params["branch_names"] = self.branch_names
+        self.params["diff_from"] = self.diff_from.to_string()
+        self.params["diff_to"] = self.diff_to.to_string()
+
+        self.return_labels = ["node_id"]
+
+    def get_node_ids(self) -> List[str]:
+        return [result.get("node_id") for result in self.get_results()]
+
+
+class DiffChangedRelationshipsQuery(DiffQuery):
+    """Return the uuid of the relationships with at least one edge created or ended between diff_from (excluded) and diff_to.
+
+    Used to identify which relationships need to be recalculated when an existing diff is extended to a later diff_to.
+    """
+
+    name: str = "diff_changed_relationships"
+    insert_return: bool = False
+
+    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
+        query = """
+        MATCH (rel:Relationship)-[r:IS_RELATED|IS_VISIBLE|IS_PROTECTED|HAS_SOURCE|HAS_OWNER]-()
+        WHERE r.branch IN $branch_names AND (
+            (r.from > $diff_from AND r.from <= $diff_to) OR (r.to > $diff_from AND r.to <= $diff_to)
+        )
+        RETURN DISTINCT rel.uuid AS rel_id
+        """
+
+        self.add_to_query(query)
+        self.params["branch_names"] = self.branch_names
+        self.params["diff_from"] = self.diff_from.to_string()
+        self.params["diff_to"] = self.diff_to.to_string()
+
+        self.return_labels = ["rel_id"]
+
+    def get_rel_ids(self) -> List[str]:
+        return [result.get("rel_id") for result in self.get_results()]
+
+
 class DiffNodePropertiesByIDSRangeQuery(Query):
     name: str = "diff_node_properties_range_ids"
 
@@ -212,6 +212,64 @@ class IPPrefixIPAddressFetch(Query):
         return addresses
 
 
+class IPAddressValueFetch(Query):
+    """Find the IP addresses of a namespace with a given value, whatever the length of their prefix."""
+
+    name: str = "ipaddress_value_fetch"
+
+    def __init__(
+        self,
+        address: Union[ipaddress.IPv4Address, ipaddress.IPv6Address],
+        namespace: Optional[Union[Node, str]] = None,
+        *args,
+        **kwargs,
+    ):
+        self.address = address
+        self.namespace_id = _get_namespace_id(namespace)
+
+        super().__init__(*args, **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
+        self.params["ns_id"] = self.namespace_id
+        self.params["binary_address"] = bin(int(self.address))[2:].zfill(self.address.max_prefixlen)
+        self.params["ip_version"] = self.address.version
+
+        branch_filter, branch_params = self.branch.get_query_filter_path(
+            at=self.at.to_string(), branch_agnostic=self.branch_agnostic
+        )
+        self.params.update(branch_params)
+
+        # ruff: noqa: E501
+        query = """
+        MATCH (ns:%(ns_label)s)
+        WHERE ns.uuid = $ns_id
+        CALL {
+            WITH ns
+            MATCH (ns)-[r:IS_PART_OF]-(root:Root)
+            WHERE %(branch_filter)s
+            RETURN ns as ns1, r as r1
+            ORDER BY r.branch_level DESC, r.from DESC
+            LIMIT 1
+        }
+        WITH ns, r1 as r
+        WHERE r.status = "active"
+        WITH ns
+        MATCH path2 = (ns)-[:IS_RELATED]-(ns_rel:Relationship)-[:IS_RELATED]-(addr:%(node_label)s)-[:HAS_ATTRIBUTE]-(an:Attribute {name: "address"})-[:HAS_VALUE]-(av:AttributeIPHost)
+        WHERE ns_rel.name = "ip_namespace__ip_address"
+            AND av.binary_address = $binary_address
+            AND av.version = $ip_version
+            AND all(r IN relationships(path2) WHERE (%(branch_filter)s))
+        """ % {
+            "ns_label": InfrahubKind.IPNAMESPACE,
+            "node_label": InfrahubKind.IPADDRESS,
+            "branch_filter": branch_filter,
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["addr", "av"]
+        self.limit = 1
+
+
 async def get_subnets(
     db: InfrahubDatabase,
     ip_prefix: IPNetworkType,
@@ -244,6 +302,21 @@ async def get_ip_addresses(
     return query.get_addresses()
 
 
+async def is_ip_address_used(
+    db: InfrahubDatabase,
+    address: Union[ipaddress.IPv4Address, ipaddress.IPv6Address],
+    namespace: Optional[Union[Node, str]] = None,
+    branch: Optional[Union[Branch, str]] = None,
+    branch_agnostic: bool = False,
+) -> bool:
+    branch = await registry.get_branch(db=db, branch=branch)
+    query = await IPAddressValueFetch.init(
+        db=db, branch=branch, address=address, namespace=namespace, branch_agnostic=branch_agnostic
+    )
+    await query.execute(db=db)
+    return bool(query.results)
+
+
 class IPPrefixUtilization(Query):
     name: str = "ipprefix_utilization_prefix"
 
@@ -4,7 +4,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Generator, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Generator, Iterable, List, Optional, Tuple, Union
 
 from infrahub import config
 from infrahub.core.constants import AttributeDBNodeType, RelationshipDirection, RelationshipHierarchyDirection
@@ -110,27 +110,17 @@ class NodeQuery(Query):
         super().__init__(*args, **kwargs)
 
 
-class NodeCreateAllQuery(NodeQuery):
-    name = "node_create_all"
-
-    type: QueryType = QueryType.WRITE
-
-    raise_error_if_empty: bool = True
-
-    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
-        at = self.at or self.node._at
-        self.params["uuid"] = self.node.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["kind"] = self.node.get_kind()
-        self.params["branch_support"] = self.node._schema.branch
+class NodeCreateQueryMixin:
+    """Generate the data and the query to create the attributes and the relationships of new nodes."""
 
+    @staticmethod
+    async def _get_node_create_data(db: InfrahubDatabase, node: Node) -> Dict[str, Any]:
         attributes: List[AttributeCreateData] = []
         attributes_iphost: List[AttributeCreateData] = []
         attributes_ipnetwork: List[AttributeCreateData] = []
 
-        for attr_name in self.node._attributes:
-            attr: BaseAttribute = getattr(self.node, attr_name)
+        for attr_name in node._attributes:
+            attr: BaseAttribute = getattr(node, attr_name)
             attr_data = attr.get_create_data()
 
             if attr_data.node_type == AttributeDBNodeType.IPHOST:
@@ -141,37 +131,32 @@ class NodeCreateAllQuery(NodeQuery):
                 attributes.append(attr_data)
 
         relationships: List[RelationshipCreateData] = []
-        for rel_name in self.node._relationships:
-            rel_manager: RelationshipManager = getattr(self.node, rel_name)
+        for rel_name in node._relationships:
+            rel_manager: RelationshipManager = getattr(node, rel_name)
             for rel in rel_manager._relationships:
                 relationships.append(await rel.get_create_data(db=db))
 
-        self.params["attrs"] = [attr.dict() for attr in attributes]
-        self.params["attrs_iphost"] = [attr.dict() for attr in attributes_iphost]
-        self.params["attrs_ipnetwork"] = [attr.dict() for attr in attributes_ipnetwork]
-        self.params["rels_bidir"] = [
-            rel.dict() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value
-        ]
-        self.params["rels_out"] = [
-            rel.dict() for rel in relationships if rel.direction == RelationshipDirection.OUTBOUND.value
-        ]
-        self.params["rels_in"] = [
-            rel.dict() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value
-        ]
-
-        self.params["node_prop"] = {
-            "uuid": self.node.id,
-            "kind": self.node.get_kind(),
-            "namespace": self.node._schema.namespace,
-            "branch_support": self.node._schema.branch,
-        }
-        self.params["node_branch_prop"] = {
-            "branch": self.branch.name,
-            "branch_level": self.branch.hierarchy_level,
-            "status": "active",
-            "from": at.to_string(),
+        return {
+            "node_prop": {
+                "uuid": node.id,
+                "kind": node.get_kind(),
+                "namespace": node._schema.namespace,
+                "branch_support": node._schema.branch,
+            },
+            "attrs": [attr.dict() for attr in attributes],
+            "attrs_iphost": [attr.dict() for attr in attributes_iphost],
+            "attrs_ipnetwork": [attr.dict() for attr in attributes_ipnetwork],
+            "rels_bidir": [rel.dict() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value],
+            "rels_out": [rel.dict() for rel in relationships if rel.direction == RelationshipDirection.OUTBOUND.value],
+            "rels_in": [rel.dict() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value],
         }
 
+    @staticmethod
+    def _get_attributes_and_relationships_query(data: str) -> str:
+        """Return the query to create the attributes and the relationships of the node n.
+
+        data is the prefix to access the output of _get_node_create_data, either a parameter or a variable.
+        """
         rel_prop_str = "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical, from: $at, to: null }"
 
         iphost_prop = {
@@ -193,12 +178,8 @@ class NodeCreateAllQuery(NodeQuery):
         }
         ipnetwork_prop_list = [f"{key}: {value}" for key, value in ipnetwork_prop.items()]
 
-        query = """
-        MATCH (root:Root)
-        CREATE (n:Node:%(labels)s $node_prop )
-        CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
-        WITH distinct n
-        FOREACH ( attr IN $attrs |
+        return """
+        FOREACH ( attr IN %(data)sattrs |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, to: null }]->(a)
             MERGE (av:AttributeValue { value: attr.content.value, is_default: attr.content.is_default })
@@ -216,7 +197,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, to: null }]->(peer)
             )
         )
-        FOREACH ( attr IN $attrs_iphost |
+        FOREACH ( attr IN %(data)sattrs_iphost |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, to: null }]->(a)
             MERGE (av:AttributeValue:AttributeIPHost { %(iphost_prop)s })
@@ -234,7 +215,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, to: null }]->(peer)
             )
         )
-        FOREACH ( attr IN $attrs_ipnetwork |
+        FOREACH ( attr IN %(data)sattrs_ipnetwork |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, to: null }]->(a)
             MERGE (av:AttributeValue:AttributeIPNetwork { %(ipnetwork_prop)s })
@@ -252,7 +233,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, to: null }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_bidir |
+        FOREACH ( rel IN %(data)srels_bidir |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
@@ -270,7 +251,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, to: null }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_out |
+        FOREACH ( rel IN %(data)srels_out |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
@@ -288,7 +269,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, to: null }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_in |
+        FOREACH ( rel IN %(data)srels_in |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)<-[:IS_RELATED %(rel_prop)s ]-(rl)
@@ -306,15 +287,60 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, to: null }]->(peer)
             )
         )
-        WITH distinct n
-        MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
         """ % {
-            "labels": ":".join(self.node.get_labels()),
+            "data": data,
             "rel_prop": rel_prop_str,
             "iphost_prop": ", ".join(iphost_prop_list),
             "ipnetwork_prop": ", ".join(ipnetwork_prop_list),
         }
 
+    @staticmethod
+    def _get_element_ids(result: QueryResult) -> Tuple[str, Tuple[str, str]]:
+        node = result.get("rn")
+        if "Relationship" in node.labels:
+            peer = result.get("rv")
+            name = f"{node.get('name')}::{peer.get('uuid')}"
+        elif "Attribute" in node.labels:
+            name = node.get("name")
+        return name, (node["uuid"], node.element_id)
+
+
+class NodeCreateAllQuery(NodeCreateQueryMixin, NodeQuery):
+    name = "node_create_all"
+
+    type: QueryType = QueryType.WRITE
+
+    raise_error_if_empty: bool = True
+
+    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
+        at = self.at or self.node._at
+        self.params["uuid"] = self.node.id
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+        self.params["kind"] = self.node.get_kind()
+        self.params["branch_support"] = self.node._schema.branch
+
+        self.params.update(await self._get_node_create_data(db=db, node=self.node))
+        self.params["node_branch_prop"] = {
+            "branch": self.branch.name,
+            "branch_level": self.branch.hierarchy_level,
+            "status": "active",
+            "from": at.to_string(),
+        }
+
+        query = """
+        MATCH (root:Root)
+        CREATE (n:Node:%(labels)s $node_prop )
+        CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
+        WITH distinct n
+        %(attributes_and_relationships)s
+        WITH distinct n
+        MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
+        """ % {
+            "labels": ":".join(self.node.get_labels()),
+            "attributes_and_relationships": self._get_attributes_and_relationships_query(data="$"),
+        }
+
         self.params["at"] = at.to_string()
 
         self.add_to_query(query)
@@ -332,17 +358,70 @@ class NodeCreateAllQuery(NodeQuery):
     def get_ids(self) -> Dict[str, Tuple[str, str]]:
         data = {}
         for result in self.get_results():
-            node = result.get("rn")
-            if "Relationship" in node.labels:
-                peer = result.get("rv")
-                name = f"{node.get('name')}::{peer.get('uuid')}"
-            elif "Attribute" in node.labels:
-                name = node.get("name")
-            data[name] = (node["uuid"], node.element_id)
+            name, ids = self._get_element_ids(result=result)
+            data[name] = ids
 
         return data
 
 
+class NodeCreateManyQuery(NodeCreateQueryMixin, Query):
+    """Batch version of NodeCreateAllQuery, create multiple nodes of the same kind with a single query."""
+
+    name = "node_create_many"
+
+    type: QueryType = QueryType.WRITE
+
+    raise_error_if_empty: bool = True
+
+    def __init__(self, nodes: List[Node], branch: Optional[Branch] = None, *args: Any, **kwargs: Any):
+        if not nodes:
+            raise ValueError("At least one node must be provided")
+
+        self.nodes = nodes
+        super().__init__(*args, branch=branch or nodes[0].get_branch_based_on_support_type(), **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
+        self.params["nodes"] = [await self._get_node_create_data(db=db, node=node) for node in self.nodes]
+        self.params["node_branch_prop"] = {
+            "branch": self.branch.name,
+            "branch_level": self.branch.hierarchy_level,
+            "status": "active",
+            "from": self.at.to_string(),
+        }
+        self.params["at"] = self.at.to_string()
+
+        query = """
+        MATCH (root:Root)
+        UNWIND $nodes AS node_data
+        CREATE (n:Node:%(labels)s)
+        SET n = node_data.node_prop
+        CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
+        WITH n, node_data
+        %(attributes_and_relationships)s
+        WITH distinct n
+        MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
+        """ % {
+            "labels": ":".join(self.nodes[0].get_labels()),
+            "attributes_and_relationships": self._get_attributes_and_relationships_query(data="node_data."),
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["n", "rn", "rv"]
+
+    def get_self_ids(self) -> Dict[str, str]:
+        """Return the database id of each new node, indexed by its uuid."""
+        return {result.get("n")["uuid"]: result.get("n").element_id for result in self.get_results()}
+
+    def get_ids(self) -> Dict[str, Dict[str, Tuple[str, str]]]:
+        """Return the ids of the attributes and the relationships of each new node, indexed by its uuid."""
+        data: Dict[str, Dict[str, Tuple[str, str]]] = defaultdict(dict)
+        for result in self.get_results():
+            name, ids = self._get_element_ids(result=result)
+            data[result.get("n")["uuid"]][name] = ids
+
+        return dict(data)
+
+
 class NodeDeleteQuery(NodeQuery):
     name = "node_delete"
 
@@ -495,9 +574,17 @@ class NodeListGetAttributeQuery(Query):
             self.return_labels.extend(["owner", "rel_owner"])
 
     def get_attributes_group_by_node(self) -> Dict[str, NodeAttributesFromDB]:
+        return self._group_attributes_by_node(results=self.get_results_group_by(("n", "uuid"), ("a", "name")))
+
+    async def stream_attributes_group_by_node(self, db: InfrahubDatabase) -> Dict[str, NodeAttributesFromDB]:
+        """Execute the query and group the attributes by node without keeping all the records in memory."""
+        results = await self.execute_stream_group_by(db, ("n", "uuid"), ("a", "name"))
+        return self._group_attributes_by_node(results=results)
+
+    def _group_attributes_by_node(self, results: Iterable[QueryResult]) -> Dict[str, NodeAttributesFromDB]:
         attrs_by_node: Dict[str, NodeAttributesFromDB] = {}
 
-        for result in self.get_results_group_by(("n", "uuid"), ("a", "name")):
+        for result in results:
             node_id: str = result.get_node("n").get("uuid")
             attr_name: str = result.get_node("a").get("name")
 
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from infrahub.core.query import Query
+
+if TYPE_CHECKING:
+    from infrahub.database import InfrahubDatabase
+
+SCHEMA_KINDS = ["SchemaNode", "SchemaGeneric", "SchemaAttribute", "SchemaRelationship"]
+
+
+class SchemaLastChangeQuery(Query):
+    """Return the time of the last change of the schema of a branch before a given time.
+
+    Two points in time with the same last change share the exact same schema, the value can be used to identify
+    the version of the schema in effect at a given time without loading it.
+    """
+
+    name: str = "schema_last_change"
+
+    async def query_init(self, db: InfrahubDatabase, *args: Any, **kwargs: Any) -> None:
+        filters = []
+        for idx, (branches, time_to_query) in enumerate(
+            self.branch.get_branches_and_times_to_query_global(at=self.at).items()
+        ):
+            filters.append(f"(r.branch IN $branch{idx} AND r.from <= $time{idx})")
+            self.params[f"branch{idx}"] = list(branches)
+            self.params[f"time{idx}"] = time_to_query
+
+        self.params["schema_kinds"] = SCHEMA_KINDS
+        self.params["at"] = self.at.to_string()
+
+        query = """
+        MATCH (n:Node)-[r1]-(peer)
+        WHERE n.kind IN $schema_kinds
+        OPTIONAL MATCH (peer:Attribute)-[r2:HAS_VALUE]->(:AttributeValue)
+        UNWIND [r1, r2] AS r
+        WITH r
+        WHERE r IS NOT NULL AND (%(filters)s)
+        UNWIND [r.from, r.to] AS change_time
+        WITH change_time
+        WHERE change_time IS NOT NULL AND change_time <= $at
+        """ % {"filters": "\n OR ".join(filters)}
+
+        self.add_to_query(query)
+        self.return_labels = ["max(change_time) AS last_change"]
+
+    def get_last_change(self) -> Optional[str]:
+        result = self.get_result()
+        if not result:
+            return None
+        return result.get_as_str(label="last_change")
@@ -375,24 +375,62 @@ class Relationship(FlagPropertyMixin, NodePropertyMixin):
 
     async def resolve(self, db: InfrahubDatabase) -> None:
         """Resolve the peer of the relationship."""
+        await self.resolve_many(db=db, relationships=[self])
 
-        if self._peer is not None:
-            return
+    @classmethod
+    async def resolve_many(cls, db: InfrahubDatabase, relationships: Iterable[Relationship]) -> None:
+        """Resolve the peers of multiple relationships.
 
-        if self.peer_id and not is_valid_uuid(self.peer_id):
-            peer = await registry.manager.get_one_by_default_filter(
-                db=db, id=self.peer_id, branch=self.branch, kind=self.schema.peer, fields={"display_label": None}
+        The peers identified by their default filter or their HFID are grouped by branch and by kind
+        to be resolved with one query per group instead of one query per relationship.
+        """
+        relationships = [rel for rel in relationships if rel._peer is None]
+
+        by_default_filter: dict[tuple[str, str], list[Relationship]] = {}
+        by_hfid: dict[tuple[str, str], list[Relationship]] = {}
+        for rel in relationships:
+            if rel.peer_id and not is_valid_uuid(rel.peer_id):
+                by_default_filter.setdefault((rel.branch.name, rel.schema.peer), []).append(rel)
+            elif not rel.peer_id and rel.peer_hfid:
+                by_hfid.setdefault((rel.branch.name, rel.schema.peer), []).append(rel)
+
+        for (_, kind), rels in by_default_filter.items():
+            peers_by_default_filter = await registry.manager.get_many_by_default_filter(
+                db=db,
+                ids=[rel.get_peer_id() for rel in rels],
+                branch=rels[0].branch,
+                kind=kind,
+                fields={"display_label": None},
             )
-            if peer:
-                await self.set_peer(value=peer)
+            for rel in rels:
+                if peer := peers_by_default_filter.get(rel.get_peer_id()):
+                    await rel.set_peer(value=peer)
 
-        if not self.peer_id and self.peer_hfid:
-            peer = await registry.manager.get_one_by_hfid(
-                db=db, hfid=self.peer_hfid, branch=self.branch, kind=self.schema.peer, fields={"display_label": None}
+        for (_, kind), rels in by_hfid.items():
+            peers_by_hfid = await registry.manager.get_many_by_hfid(
+                db=db,
+                hfids=[rel.peer_hfid for rel in rels if rel.peer_hfid],
+                branch=rels[0].branch,
+                kind=kind,
+                fields={"display_label": None},
             )
-            if peer:
-                await self.set_peer(value=peer)
+            for rel in rels:
+                if not rel.peer_hfid:
+                    continue
+                peer = peers_by_hfid.get(tuple(rel.peer_hfid))
+                if not peer:
+                    raise NodeNotFoundError(
+                        branch_name=rel.branch.name,
+                        node_type=kind,
+                        identifier=" :: ".join(rel.peer_hfid),
+                        message=f"Unable to find the peer {rel.peer_hfid!r} of the relationship {rel.name!r} on {rel.node_id!r}",
+                    )
+                await rel.set_peer(value=peer)
+
+        for rel in relationships:
+            await rel._resolve_from_pool(db=db)
 
+    async def _resolve_from_pool(self, db: InfrahubDatabase) -> None:
         if not self.peer_id and self.from_pool and "id" in self.from_pool:
             pool_id = str(self.from_pool.get("id"))
             pool = await registry.manager.get_one(db=db, id=pool_id, branch=self.branch)
@@ -678,6 +716,9 @@ class RelationshipManager:
         self._relationship_id_details: Optional[RelationshipUpdateDetails] = None
         self.has_fetched_relationships: bool = False
 
+        # Hashes of the relationships as they were last fetched from or saved to the database, None if it's unknown
+        self._db_state: Optional[List[int]] = None
+
     @classmethod
     async def init(
         cls,
@@ -718,6 +759,24 @@ class RelationshipManager:
     def get_kind(self) -> str:
         return self.schema.kind
 
+    def _get_state(self) -> List[int]:
+        return sorted(hash(rel) for rel in self._relationships)
+
+    def _set_db_state(self) -> None:
+        self._db_state = self._get_state()
+
+    @property
+    def has_been_modified(self) -> bool:
+        """Indicate if the relationships have been modified since they were last fetched from or saved to the database.
+
+        The relationships that have never been fetched can't have been modified.
+        """
+        if not self.has_fetched_relationships:
+            return False
+        if self._db_state is None:
+            return True
+        return self._get_state() != self._db_state
+
     def __iter__(self) -> Iterator[Relationship]:
         if self.schema.cardinality == "one":
             raise TypeError("relationship with single cardinality are not iterable")
@@ -816,6 +875,7 @@ class RelationshipManager:
         details = await self.fetch_relationship_ids(
             at=at, db=db, branch_agnostic=branch_agnostic, force_refresh=force_refresh
         )
+        first_fetch = not self.has_fetched_relationships
 
         for peer_id in details.peer_ids_present_database_only:
             self._relationships.append(
@@ -832,6 +892,10 @@ class RelationshipManager:
         for peer_id in details.peer_ids_present_local_only:
             await self.remove(peer_id=peer_id, db=db)
 
+        # On a later refresh, the local relationships might have been modified already
+        if first_fetch:
+            self._set_db_state()
+
     async def get(self, db: InfrahubDatabase) -> Union[Relationship, List[Relationship]]:
         rels = await self.get_relationships(db=db)
 
@@ -933,8 +997,7 @@ class RelationshipManager:
         return True
 
     async def resolve(self, db: InfrahubDatabase) -> None:
-        for rel in self._relationships:
-            await rel.resolve(db=db)
+        await self.rel_class.resolve_many(db=db, relationships=self._relationships)
 
     async def remove(
         self,
@@ -1015,6 +1078,8 @@ class RelationshipManager:
                         db=db,
                     )
 
+        self._set_db_state()
+
         return self
 
     async def delete(
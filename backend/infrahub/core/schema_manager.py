@@ -2,15 +2,15 @@ from __future__ import annotations
 
 import copy
 import hashlib
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from itertools import chain
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from infrahub_sdk.topological_sort import DependencyCycleExistsError, topological_sort
 from infrahub_sdk.utils import compare_lists, deep_merge_dict, duplicates, intersection
 from pydantic import BaseModel
 
-from infrahub import lock
+from infrahub import config, lock
 from infrahub.core.constants import (
     RESERVED_ATTR_GEN_NAMES,
     RESERVED_ATTR_REL_NAMES,
@@ -36,6 +36,7 @@ from infrahub.core.models import (
 )
 from infrahub.core.node import Node
 from infrahub.core.property import FlagPropertyMixin, NodePropertyMixin
+from infrahub.core.query.schema import SchemaLastChangeQuery
 from infrahub.core.registry import registry
 from infrahub.core.schema import (
     AttributePathParsingError,
@@ -55,6 +56,7 @@ from infrahub.core.schema.definitions.core import core_profile_schema_definition
 from infrahub.core.utils import parse_node_kind
 from infrahub.core.validators import CONSTRAINT_VALIDATOR_MAP
 from infrahub.exceptions import SchemaNotFoundError
+from infrahub.graphql.cache import graphql_schema_cache
 from infrahub.graphql.manager import GraphQLSchemaManager
 from infrahub.log import get_logger
 from infrahub.utils import format_label
@@ -179,12 +181,15 @@ class SchemaBranch:
         include_types: bool = True,
     ) -> GraphQLSchema:
         if not self._graphql_schema:
-            self._graphql_schema = self.get_graphql_manager().generate(
+            cache_entry = graphql_schema_cache.get(
+                schema_branch=self,
                 include_query=include_query,
                 include_mutation=include_mutation,
                 include_subscription=include_subscription,
                 include_types=include_types,
             )
+            self._graphql_manager = cache_entry.manager
+            self._graphql_schema = cache_entry.schema
         return self._graphql_schema
 
     def diff(self, other: SchemaBranch) -> SchemaDiff:
@@ -1564,6 +1569,7 @@ class SchemaManager(NodeManager):
     def __init__(self):
         self._cache: Dict[int, Any] = {}
         self._branches: Dict[str, SchemaBranch] = {}
+        self._historical_branches: OrderedDict[Tuple[str, Optional[str], Optional[str]], SchemaBranch] = OrderedDict()
 
     def _get_from_cache(self, key):
         return self._cache[key]
@@ -2062,6 +2068,29 @@ class SchemaManager(NodeManager):
         self.set_schema_branch(name=branch.name, schema=branch_schema)
         return branch_schema
 
+    async def load_schema_at(self, db: InfrahubDatabase, branch: Branch, at: Timestamp) -> SchemaBranch:
+        """Return the schema of a branch as it was at a given time.
+
+        The processed schemas are cached per version of the schema in effect at the requested time,
+        identified by the time of the last change of the schema, so all the requests within the same version
+        of the schema share the same SchemaBranch and the same GraphQL schema.
+        """
+        query = await SchemaLastChangeQuery.init(db=db, branch=branch, at=at)
+        await query.execute(db=db)
+        key = (branch.name, branch.branched_from, query.get_last_change())
+
+        if key in self._historical_branches:
+            self._historical_branches.move_to_end(key)
+            return self._historical_branches[key]
+
+        schema = await self.load_schema_from_db(db=db, branch=branch, at=at)
+        self._historical_branches[key] = schema
+
+        while len(self._historical_branches) > config.SETTINGS.api.schema_history_cache_size:
+            self._historical_branches.popitem(last=False)
+
+        return schema
+
     async def load_schema_from_db(
         self,
         db: InfrahubDatabase,
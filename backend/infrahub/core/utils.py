@@ -69,18 +69,16 @@ async def update_relationships_to(
     if not ids:
         return None
 
-    list_matches = [f"id(r) = {element_id_to_id(id)}" for id in ids]
-
     to = Timestamp(to)
 
-    query = f"""
+    query = """
     MATCH ()-[r]->()
-    WHERE {' or '.join(list_matches)}
+    WHERE ID(r) IN $ids
     SET r.to = $to
     RETURN ID(r)
     """
 
-    params = {"to": to.to_string()}
+    params = {"to": to.to_string(), "ids": [element_id_to_id(id) for id in ids]}
 
     return await db.execute_query(query=query, params=params, name="update_relationships_to")
 
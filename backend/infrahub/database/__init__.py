@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import random
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple, Type, Union
 
 from neo4j import (
     READ_ACCESS,
@@ -204,11 +204,15 @@ class InfrahubDatabase:
 
         if self._session_mode == InfrahubDatabaseSessionMode.READ:
             self._session = self._driver.session(
-                database=config.SETTINGS.database.database_name, default_access_mode=READ_ACCESS
+                database=config.SETTINGS.database.database_name,
+                default_access_mode=READ_ACCESS,
+                fetch_size=config.SETTINGS.database.query_size_limit,
             )
         else:
             self._session = self._driver.session(
-                database=config.SETTINGS.database.database_name, default_access_mode=WRITE_ACCESS
+                database=config.SETTINGS.database.database_name,
+                default_access_mode=WRITE_ACCESS,
+                fetch_size=config.SETTINGS.database.query_size_limit,
             )
 
         self._is_session_local = True
@@ -226,11 +230,15 @@ class InfrahubDatabase:
         if self._mode == InfrahubDatabaseMode.SESSION:
             if self._session_mode == InfrahubDatabaseSessionMode.READ:
                 self._session = self._driver.session(
-                    database=config.SETTINGS.database.database_name, default_access_mode=READ_ACCESS
+                    database=config.SETTINGS.database.database_name,
+                    default_access_mode=READ_ACCESS,
+                    fetch_size=config.SETTINGS.database.query_size_limit,
                 )
             else:
                 self._session = self._driver.session(
-                    database=config.SETTINGS.database.database_name, default_access_mode=WRITE_ACCESS
+                    database=config.SETTINGS.database.database_name,
+                    default_access_mode=WRITE_ACCESS,
+                    fetch_size=config.SETTINGS.database.query_size_limit,
                 )
 
         elif self._mode == InfrahubDatabaseMode.TRANSACTION:
@@ -286,6 +294,22 @@ class InfrahubDatabase:
                 results = [item async for item in response]
                 return results, response._metadata or {}
 
+    async def execute_query_stream(
+        self, query: str, params: Optional[Dict[str, Any]] = None, name: Optional[str] = "undefined"
+    ) -> AsyncIterator[Record]:
+        """Execute a query and yield the records while they are being pulled from the result cursor.
+
+        The driver fetches the records in batches of `query_size_limit`, the full result is never buffered.
+        """
+        with trace.get_tracer(__name__).start_as_current_span("execute_db_query_stream") as span:
+            span.set_attribute("query", query)
+
+            with QUERY_EXECUTION_METRICS.labels(self._session_mode.value, name).time():
+                response = await self.run_query(query=query, params=params)
+
+        async for item in response:
+            yield item
+
     async def run_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> AsyncResult:
         if self.is_transaction:
             execution_method = await self.transaction()
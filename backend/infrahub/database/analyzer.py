@@ -2,7 +2,7 @@ import time
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -205,3 +205,21 @@ class InfrahubDatabaseAnalyzer(InfrahubDatabase):
             )
 
         return response, metadata
+
+    async def execute_query_stream(
+        self, query: str, params: config.Dict[str, Any] | None = None, name: str | None = "undefined"
+    ) -> AsyncIterator[Record]:
+        time_start = time.time()
+        if name and query_stats.sample_memory(name=name):
+            response, _ = await self.execute_query_with_metadata(query, params, name)
+            for item in response:
+                yield item
+            return
+
+        async for item in super().execute_query_stream(query, params, name):
+            yield item
+
+        duration_time = time.time() - time_start
+        query_stats.add_measurement(
+            QueryMeasurement(duration=duration_time, profile=False, query_name=str(name), start_time=time_start)
+        )
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple, Type
+
+import jinja2
+
+from infrahub import config
+
+if TYPE_CHECKING:
+    from infrahub_sdk.transforms import InfrahubTransform
+
+
+class Jinja2TemplateCache:
+    """Worker wide cache of the compiled Jinja2 templates.
+
+    The content of a commit worktree never changes, a template identified by its repository, commit and location
+    only needs to be parsed and compiled once and can be rendered for as many targets as needed.
+    The least recently used templates are evicted once the cache is full.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[Tuple[str, str, str], jinja2.Template] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size or config.SETTINGS.git.jinja2_template_cache_size
+
+    def get(self, repository: str, commit: str, location: str, directory: str) -> jinja2.Template:
+        """Return the compiled template, the template is loaded from the worktree directory only if it's not already present."""
+        key = (repository, commit, location)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        # The worktree of a commit is immutable so there is no need to check if the templates are up to date on each render
+        template_loader = jinja2.FileSystemLoader(searchpath=directory)
+        template_env = jinja2.Environment(
+            loader=template_loader, trim_blocks=True, lstrip_blocks=True, auto_reload=False
+        )
+        template = template_env.get_template(location)
+
+        self._entries[key] = template
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        return template
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class PythonTransformCache:
+    """Worker wide cache of the loaded Python transform classes.
+
+    A transform class loaded from the worktree of a commit can be instantiated again for each execution without
+    importing its module again, every execution gets its own instance and client. When a transform is loaded from
+    a new commit, the class loaded for the same repository, branch and location from another commit is discarded.
+    The least recently used transforms are evicted once the cache is full.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[Tuple[str, str, str, str], Type[InfrahubTransform]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size or config.SETTINGS.git.python_transform_cache_size
+
+    def get(self, repository: str, commit: str, location: str, branch: str) -> Optional[Type[InfrahubTransform]]:
+        key = (repository, commit, location, branch)
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def set(
+        self, repository: str, commit: str, location: str, branch: str, transform_class: Type[InfrahubTransform]
+    ) -> None:
+        for key in [
+            key
+            for key in self._entries
+            if key[0] == repository and key[2] == location and key[3] == branch and key[1] != commit
+        ]:
+            del self._entries[key]
+
+        self._entries[(repository, commit, location, branch)] = transform_class
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+jinja2_template_cache = Jinja2TemplateCache()
+python_transform_cache = PythonTransformCache()
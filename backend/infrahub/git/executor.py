@@ -0,0 +1,293 @@
+"""Execution of the Python transforms and checks of a repository in a pool of worker processes.
+
+The user code is imported and executed in the worker processes instead of the event loop of the git agent,
+only the request and the result of each execution cross the process boundary and both must be picklable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from uuid import uuid4
+
+from infrahub import config
+from infrahub.log import get_logger
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+
+log = get_logger("infrahub.git")
+
+# Queue used by a worker process to report the id of the execution it has started along with its pid
+_started_queue: Optional[Queue] = None
+
+
+class PythonTaskType(str, Enum):
+    TRANSFORM = "transform"
+    CHECK = "check"
+
+
+class PythonTaskError(str, Enum):
+    MODULE_NOT_FOUND = "module_not_found"
+    CLASS_NOT_FOUND = "class_not_found"
+    EXECUTION = "execution"
+    TIMEOUT = "timeout"
+
+
+@dataclass
+class PythonTaskRequest:
+    task_type: PythonTaskType
+    directory_root: str
+    worktree_directory: str
+    module_name: str
+    class_name: str
+    branch_name: str
+    client_config: Dict[str, Any]
+    data: Optional[dict] = None
+    params: Optional[dict] = None
+    execution_id: str = field(default_factory=lambda: str(uuid4()))
+
+
+@dataclass
+class PythonTaskResult:
+    value: Any = None
+    passed: bool = False
+    logs: List[Dict[str, Any]] = field(default_factory=list)
+    log_entries: str = ""
+    error: Optional[PythonTaskError] = None
+    error_message: str = ""
+
+
+def _initialize_worker(started_queue: Queue) -> None:
+    global _started_queue  # pylint: disable=global-statement
+    _started_queue = started_queue
+
+    # Pre-warm the worker with the modules shared by all the transforms and checks
+    importlib.import_module("infrahub_sdk")
+    importlib.import_module("infrahub_sdk.checks")
+    importlib.import_module("infrahub_sdk.transforms")
+
+
+def _import_module(directory_root: str, module_name: str) -> Any:
+    # The modules stay in sys.modules once imported, the module name includes the commit of the worktree
+    # so each worker only pays for the import of a given commit once.
+    if directory_root not in sys.path:
+        sys.path.append(directory_root)
+    return importlib.import_module(module_name)
+
+
+def warm_up_modules(directory_root: str, module_names: List[str]) -> None:
+    for module_name in module_names:
+        try:
+            _import_module(directory_root=directory_root, module_name=module_name)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Errors will be reported to the user when the transform or the check is executed
+            continue
+
+
+async def _execute_python_task(request: PythonTaskRequest) -> PythonTaskResult:
+    from infrahub_sdk import Config, InfrahubClient  # pylint: disable=import-outside-toplevel
+
+    try:
+        module = _import_module(directory_root=request.directory_root, module_name=request.module_name)
+    except ModuleNotFoundError as exc:
+        return PythonTaskResult(error=PythonTaskError.MODULE_NOT_FOUND, error_message=str(exc))
+
+    task_class = getattr(module, request.class_name, None)
+    if not task_class:
+        return PythonTaskResult(error=PythonTaskError.CLASS_NOT_FOUND)
+
+    client = InfrahubClient(config=Config(**request.client_config))
+    try:
+        if request.task_type == PythonTaskType.TRANSFORM:
+            transform = await task_class.init(
+                root_directory=request.worktree_directory, branch=request.branch_name, client=client
+            )
+            return PythonTaskResult(value=await transform.run(data=request.data))
+
+        check = await task_class.init(
+            root_directory=request.worktree_directory,
+            branch=request.branch_name,
+            client=client,
+            params=request.params,
+        )
+        await check.run(data=request.data)
+        return PythonTaskResult(passed=check.passed, logs=check.logs, log_entries=check.log_entries)
+
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        return PythonTaskResult(error=PythonTaskError.EXECUTION, error_message=str(exc))
+    finally:
+        await client.close()
+
+
+def execute_python_task(request: PythonTaskRequest) -> PythonTaskResult:
+    """Entrypoint of the worker processes."""
+    if _started_queue is not None:
+        _started_queue.put((request.execution_id, os.getpid()))
+    return asyncio.run(_execute_python_task(request=request))
+
+
+def _consume_result(future: asyncio.Future) -> None:
+    # The result of an execution that timed out is never awaited
+    if not future.cancelled():
+        future.exception()
+
+
+class PythonWorkerPool:
+    """Process pool executor, along with the executions submitted to it and the pid of the worker running each of them."""
+
+    def __init__(self, max_workers: Optional[int]) -> None:
+        # Forking the git agent would also copy its event loop and its connections
+        context = multiprocessing.get_context("spawn")
+        self.started_queue: Queue = context.Queue()
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=_initialize_worker,
+            initargs=(self.started_queue,),
+        )
+        self.executions: Dict[str, asyncio.Future] = {}
+        self.timed_out: Set[str] = set()
+        self._pids: Dict[str, int] = {}
+
+    def submit(self, request: PythonTaskRequest) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, execute_python_task, request)
+        future.add_done_callback(_consume_result)
+        self.executions[request.execution_id] = future
+        return future
+
+    def get_pid(self, execution_id: str) -> Optional[int]:
+        while True:
+            try:
+                started_id, pid = self.started_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._pids[started_id] = pid
+        return self._pids.get(execution_id)
+
+    def is_idle(self) -> bool:
+        """Indicate if all the executions still in progress have timed out."""
+        return all(future.done() or execution_id in self.timed_out for execution_id, future in self.executions.items())
+
+    def shutdown(self, terminate: bool = False) -> None:
+        if terminate:
+            # ProcessPoolExecutor doesn't provide a way to stop a running job, the only option is to stop the worker
+            for execution_id, future in self.executions.items():
+                pid = self.get_pid(execution_id=execution_id)
+                if pid and not future.done():
+                    try:
+                        os.kill(pid, signal.SIGTERM)
+                    except ProcessLookupError:
+                        pass
+
+        self.executor.shutdown(wait=not terminate, cancel_futures=True)
+        self.started_queue.close()
+
+
+class PythonExecutionPool:
+    """Pool of worker processes used to execute the Python transforms and checks.
+
+    The pool is created on first use. If a task exceeds its timeout, the pool is replaced by a new one for the next tasks,
+    the other tasks already submitted to the previous pool are left to complete before the worker running the task
+    that timed out is stopped.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self._max_workers = max_workers
+        self._pool: Optional[PythonWorkerPool] = None
+        self._retired_pools: Dict[PythonWorkerPool, asyncio.Task] = {}
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        return self._max_workers or config.SETTINGS.git.python_execution_workers
+
+    @property
+    def pool(self) -> PythonWorkerPool:
+        if not self._pool:
+            self._pool = PythonWorkerPool(max_workers=self.max_workers)
+        return self._pool
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        return self.pool.executor
+
+    async def warm_up(self, directory_root: str, module_names: List[str]) -> None:
+        """Import the modules of a commit worktree in the worker processes ahead of the first execution."""
+        if not module_names:
+            return
+
+        loop = asyncio.get_running_loop()
+        # There is no way to target a specific worker, submitting one job per worker spreads them across the pool
+        jobs = [
+            loop.run_in_executor(self.executor, warm_up_modules, directory_root, module_names)
+            for _ in range(self.max_workers or os.cpu_count() or 1)
+        ]
+        await asyncio.gather(*jobs, return_exceptions=True)
+
+    async def execute(self, request: PythonTaskRequest, timeout: Optional[int] = None) -> PythonTaskResult:
+        timeout = timeout or config.SETTINGS.git.python_execution_timeout
+
+        # The pool is captured at submit time, it could be replaced by another task in the meantime
+        pool = self.pool
+        future = pool.submit(request=request)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            log.warning(
+                "Python execution timed out, recycling the worker pool",
+                module=request.module_name,
+                class_name=request.class_name,
+                timeout=timeout,
+            )
+            pool.timed_out.add(request.execution_id)
+            self._retire(pool=pool)
+            return PythonTaskResult(
+                error=PythonTaskError.TIMEOUT, error_message=f"Execution timed out after {timeout} seconds"
+            )
+        except BrokenProcessPool as exc:
+            self._retire(pool=pool)
+            return PythonTaskResult(error=PythonTaskError.EXECUTION, error_message=str(exc))
+        finally:
+            if future.done():
+                pool.executions.pop(request.execution_id, None)
+
+    def _retire(self, pool: PythonWorkerPool) -> None:
+        """Stop sending new tasks to a pool and shut it down once the tasks still running on it are completed."""
+        if pool is self._pool:
+            self._pool = None
+        if pool not in self._retired_pools:
+            self._retired_pools[pool] = asyncio.create_task(self._shutdown_when_idle(pool=pool))
+
+    async def _shutdown_when_idle(self, pool: PythonWorkerPool) -> None:
+        while not pool.is_idle():
+            # Other tasks on this pool could time out in the meantime, the state of the pool is checked periodically
+            pending = [future for future in pool.executions.values() if not future.done()]
+            await asyncio.wait(pending, timeout=1)
+
+        pool.shutdown(terminate=True)
+        self._retired_pools.pop(pool, None)
+
+    def shutdown(self, terminate: bool = False) -> None:
+        for pool, task in list(self._retired_pools.items()):
+            task.cancel()
+            pool.shutdown(terminate=True)
+        self._retired_pools.clear()
+
+        if self._pool:
+            self._pool.shutdown(terminate=terminate)
+            self._pool = None
+
+
+python_execution_pool = PythonExecutionPool()
@@ -9,11 +9,10 @@ import sys
 import types
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 from uuid import UUID
 
 import git
-import jinja2
 import ujson
 import yaml
 from git import Repo
@@ -25,6 +24,7 @@ from infrahub_sdk import (
     InfrahubRepositoryConfig,
     ValidationError,
 )
+from infrahub_sdk.config import ConfigBase
 from infrahub_sdk.exceptions import ModuleImportError
 from infrahub_sdk.schema import (
     InfrahubCheckDefinitionConfig,
@@ -52,6 +52,14 @@ from infrahub.exceptions import (
     RepositoryFileNotFoundError,
     TransformError,
 )
+from infrahub.git.cache import jinja2_template_cache, python_transform_cache
+from infrahub.git.executor import (
+    PythonTaskError,
+    PythonTaskRequest,
+    PythonTaskResult,
+    PythonTaskType,
+    python_execution_pool,
+)
 from infrahub.log import get_logger
 from infrahub.services import InfrahubServices
 
@@ -1792,6 +1800,21 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         await self.import_python_transforms(branch_name=branch_name, commit=commit, config_file=config_file)
         await self.import_generator_definitions(branch_name=branch_name, commit=commit, config_file=config_file)
 
+        if config.SETTINGS.git.python_execution_mode == config.PythonExecutionMode.PROCESS_POOL:
+            commit_wt = self.get_worktree(identifier=commit)
+            file_paths = [item.file_path.as_posix() for item in config_file.check_definitions] + [
+                item.file_path.as_posix() for item in config_file.python_transforms
+            ]
+            module_names = [
+                extract_repo_file_information(
+                    full_filename=os.path.join(commit_wt.directory, file_path),
+                    repo_directory=self.directory_root,
+                    worktree_directory=commit_wt.directory,
+                ).module_name
+                for file_path in sorted(set(file_paths))
+            ]
+            await python_execution_pool.warm_up(directory_root=self.directory_root, module_names=module_names)
+
     async def find_files(
         self,
         extension: Union[str, List[str]],
@@ -1849,9 +1872,9 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
 
         try:
-            templateLoader = jinja2.FileSystemLoader(searchpath=commit_worktree.directory)
-            templateEnv = jinja2.Environment(loader=templateLoader, trim_blocks=True, lstrip_blocks=True)
-            template = templateEnv.get_template(location)
+            template = jinja2_template_cache.get(
+                repository=str(self.id), commit=commit, location=location, directory=commit_worktree.directory
+            )
             return template.render(**data)
         except Exception as exc:
             log.error(exc, exc_info=True, repository=self.name, commit=commit, location=location)
@@ -1865,13 +1888,24 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         class_name: str,
         client: InfrahubClient,
         params: Optional[Dict] = None,
-    ) -> InfrahubCheck:
+    ) -> Union[InfrahubCheck, PythonTaskResult]:
         """Execute A Python Check stored in the repository."""
 
         commit_worktree = self.get_commit_worktree(commit=commit)
 
         self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
 
+        if config.SETTINGS.git.python_execution_mode == config.PythonExecutionMode.PROCESS_POOL:
+            return await self._execute_python_check_in_pool(
+                branch_name=branch_name,
+                commit=commit,
+                commit_worktree=commit_worktree,
+                location=location,
+                class_name=class_name,
+                client=client,
+                params=params,
+            )
+
         # Ensure the path for this repository is present in sys.path
         if self.directory_root not in sys.path:
             sys.path.append(self.directory_root)
@@ -1938,6 +1972,27 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
             raise ValueError("Transformation location not valid, it must contains a double colons (::)")
 
         file_path, class_name = location.split("::")
+
+        inline_mode = config.SETTINGS.git.python_execution_mode == config.PythonExecutionMode.INLINE
+        if inline_mode and (
+            cached_class := python_transform_cache.get(
+                repository=str(self.id), commit=commit, location=location, branch=branch_name
+            )
+        ):
+            # The module has already been imported from this commit, only a new instance is needed for this execution
+            try:
+                transform = await cached_class.init(
+                    root_directory=os.path.join(self.directory_commits, commit), branch=branch_name, client=client
+                )
+                return await transform.run(data=data)
+            except Exception as exc:
+                log.critical(
+                    exc, exc_info=True, repository=self.name, branch=branch_name, commit=commit, location=location
+                )
+                raise TransformError(
+                    repository_name=self.name, commit=commit, location=location, message=str(exc)
+                ) from exc
+
         commit_worktree = self.get_commit_worktree(commit=commit)
 
         log.debug(
@@ -1950,6 +2005,16 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
 
         self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=file_path)
 
+        if not inline_mode:
+            return await self._execute_python_transform_in_pool(
+                branch_name=branch_name,
+                commit=commit,
+                commit_worktree=commit_worktree,
+                location=location,
+                client=client,
+                data=data,
+            )
+
         # Ensure the path for this repository is present in sys.path
         if self.directory_root not in sys.path:
             sys.path.append(self.directory_root)
@@ -1963,11 +2028,18 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
 
             module = importlib.import_module(file_info.module_name)
 
-            transform_class: InfrahubTransform = getattr(module, class_name)
+            transform_class: Type[InfrahubTransform] = getattr(module, class_name)
 
             transform = await transform_class.init(
                 root_directory=commit_worktree.directory, branch=branch_name, client=client
             )
+            python_transform_cache.set(
+                repository=str(self.id),
+                commit=commit,
+                location=location,
+                branch=branch_name,
+                transform_class=transform_class,
+            )
             return await transform.run(data=data)
 
         except ModuleNotFoundError as exc:
@@ -1988,6 +2060,105 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
             log.critical(exc, exc_info=True, repository=self.name, branch=branch_name, commit=commit, location=location)
             raise TransformError(repository_name=self.name, commit=commit, location=location, message=str(exc)) from exc
 
+    def _get_python_task_request(
+        self,
+        task_type: PythonTaskType,
+        branch_name: str,
+        commit_worktree: Worktree,
+        file_path: str,
+        class_name: str,
+        client: InfrahubClient,
+        data: Optional[dict] = None,
+        params: Optional[dict] = None,
+    ) -> PythonTaskRequest:
+        file_info = extract_repo_file_information(
+            full_filename=os.path.join(commit_worktree.directory, file_path),
+            repo_directory=self.directory_root,
+            worktree_directory=commit_worktree.directory,
+        )
+        return PythonTaskRequest(
+            task_type=task_type,
+            directory_root=self.directory_root,
+            worktree_directory=commit_worktree.directory,
+            module_name=file_info.module_name,
+            class_name=class_name,
+            branch_name=branch_name,
+            # The client can't cross the process boundary, the worker creates its own client from the same config
+            client_config=client.config.dict(include=set(ConfigBase.__fields__)),
+            data=data,
+            params=params,
+        )
+
+    async def _execute_python_check_in_pool(
+        self,
+        branch_name: str,
+        commit: str,
+        commit_worktree: Worktree,
+        location: str,
+        class_name: str,
+        client: InfrahubClient,
+        params: Optional[Dict] = None,
+    ) -> PythonTaskResult:
+        request = self._get_python_task_request(
+            task_type=PythonTaskType.CHECK,
+            branch_name=branch_name,
+            commit_worktree=commit_worktree,
+            file_path=location,
+            class_name=class_name,
+            client=client,
+            params=params,
+        )
+        result = await python_execution_pool.execute(request=request)
+
+        if not result.error:
+            return result
+
+        if result.error == PythonTaskError.MODULE_NOT_FOUND:
+            error_msg = "Unable to load the check file"
+        elif result.error == PythonTaskError.CLASS_NOT_FOUND:
+            error_msg = f"Unable to find the class {class_name}"
+        else:
+            error_msg = result.error_message
+
+        log.error(error_msg, repository=self.name, branch=branch_name, commit=commit, location=location)
+        raise CheckError(
+            repository_name=self.name, class_name=class_name, commit=commit, location=location, message=error_msg
+        )
+
+    async def _execute_python_transform_in_pool(
+        self,
+        branch_name: str,
+        commit: str,
+        commit_worktree: Worktree,
+        location: str,
+        client: InfrahubClient,
+        data: Optional[dict] = None,
+    ) -> Any:
+        file_path, class_name = location.split("::")
+        request = self._get_python_task_request(
+            task_type=PythonTaskType.TRANSFORM,
+            branch_name=branch_name,
+            commit_worktree=commit_worktree,
+            file_path=file_path,
+            class_name=class_name,
+            client=client,
+            data=data,
+        )
+        result = await python_execution_pool.execute(request=request)
+
+        if not result.error:
+            return result.value
+
+        if result.error == PythonTaskError.MODULE_NOT_FOUND:
+            error_msg = f"Unable to load the transform file {location}"
+        elif result.error == PythonTaskError.CLASS_NOT_FOUND:
+            error_msg = f"Unable to find the class {class_name} in {location}"
+        else:
+            error_msg = result.error_message
+
+        log.error(error_msg, repository=self.name, branch=branch_name, commit=commit, location=location)
+        raise TransformError(repository_name=self.name, commit=commit, location=location, message=error_msg)
+
     async def artifact_generate(
         self,
         branch_name: str,
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional, Union
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Optional, Union
 
 from starlette.background import BackgroundTasks
 
 from infrahub.core import registry
 from infrahub.core.timestamp import Timestamp
 
+from .loaders import PeerRelationshipsDataLoader, QueryPeerParams
 from .manager import GraphQLSchemaManager
 
 if TYPE_CHECKING:
@@ -37,6 +38,14 @@ class GraphqlContext:
     account_session: Optional[AccountSession] = None
     background: Optional[BackgroundTasks] = None
     request: Optional[HTTPConnection] = None
+    peers_loaders: Dict[str, PeerRelationshipsDataLoader] = field(default_factory=dict)
+
+    def get_peers_loader(self, query_params: QueryPeerParams) -> PeerRelationshipsDataLoader:
+        """Return the loader shared by all the resolvers requesting the same peers within this request."""
+        key = query_params.get_key()
+        if key not in self.peers_loaders:
+            self.peers_loaders[key] = PeerRelationshipsDataLoader(db=self.db, query_params=query_params)
+        return self.peers_loaders[key]
 
 
 def prepare_graphql_params(
@@ -54,13 +63,13 @@ def prepare_graphql_params(
     branch = registry.get_branch_from_registry(branch=branch)
     schema = registry.schema.get_schema_branch(name=branch.name)
 
-    gqlm = schema.get_graphql_manager()
     gql_schema = schema.get_graphql_schema(
         include_query=include_query,
         include_mutation=include_mutation,
         include_subscription=include_subscription,
         include_types=include_types,
     )
+    gqlm = schema.get_graphql_manager()
 
     if request and not service:
         service = request.app.state.service
@@ -1,20 +1,75 @@
-from typing import Any, Dict, Optional, Set
+from inspect import isawaitable
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 
 from graphql import (
+    ExecutionContext,
+    ExecutionResult,
+    GraphQLError,
     GraphQLSchema,
+    Middleware,
     OperationType,
+    execute,
 )
 from infrahub_sdk.analyzer import GraphQLQueryAnalyzer
 from infrahub_sdk.utils import extract_fields
 
 from infrahub.core.branch import Branch
+from infrahub.graphql.document_cache import GraphQLDocumentCacheEntry, graphql_document_cache
 from infrahub.graphql.utils import extract_schema_models
 
 
 class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
     def __init__(self, query: str, schema: Optional[GraphQLSchema] = None, branch: Optional[Branch] = None):
         self.branch: Optional[Branch] = branch
-        super().__init__(query=query, schema=schema)
+        self._cache_entry: Optional[GraphQLDocumentCacheEntry] = None
+        if not schema:
+            super().__init__(query=query, schema=schema)
+            return
+
+        # The document is parsed and validated once per schema and shared with the execution of the query
+        self._cache_entry = graphql_document_cache.get(schema=schema, query=query)
+        self.query = query
+        self.schema = schema
+        self.document = self._cache_entry.document
+        self._fields = None
+
+    @property
+    def is_valid(self) -> Tuple[bool, Optional[List[GraphQLError]]]:
+        if not self._cache_entry:
+            return super().is_valid
+
+        if self._cache_entry.errors:
+            return False, self._cache_entry.errors
+
+        return True, None
+
+    async def execute(
+        self,
+        context_value: Any,
+        root_value: Any = None,
+        variable_values: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        middleware: Optional[Middleware] = None,
+        execution_context_class: Optional[Type[ExecutionContext]] = None,
+    ) -> ExecutionResult:
+        """Execute the query with the document already parsed and validated by the analyzer."""
+        valid, errors = self.is_valid
+        if not valid:
+            return ExecutionResult(data=None, errors=errors)
+
+        result = execute(
+            schema=self.schema,  # type: ignore[arg-type]
+            document=self.document,
+            root_value=root_value,
+            context_value=context_value,
+            variable_values=variable_values,
+            operation_name=operation_name,
+            middleware=middleware,
+            execution_context_class=execution_context_class,
+        )
+        if isawaitable(result):
+            return await result
+        return result
 
     async def get_models_in_use(self, types: Dict[str, Any]) -> Set[str]:
         """List of Infrahub models that are referenced in the query."""
@@ -30,10 +30,7 @@ from graphql import (
     GraphQLFormattedError,
     Middleware,
     OperationType,
-    graphql,
-    parse,
     subscribe,
-    validate,
 )
 from graphql.error.graphql_error import format_error
 from graphql.utilities import (
@@ -42,7 +39,7 @@ from graphql.utilities import (
 from opentelemetry import trace
 from starlette.datastructures import UploadFile
 from starlette.requests import HTTPConnection, Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse, Response, StreamingResponse
 from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
 
 from infrahub.api.dependencies import api_key_scheme, cookie_auth_scheme, jwt_scheme
@@ -52,10 +49,12 @@ from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import BranchNotFoundError, Error
 from infrahub.graphql import prepare_graphql_params
 from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql.document_cache import graphql_document_cache
 from infrahub.log import get_logger
 
 from .metrics import (
     GRAPHQL_DURATION_METRICS,
+    GRAPHQL_PHASE_DURATION_METRICS,
     GRAPHQL_QUERY_DEPTH_METRICS,
     GRAPHQL_QUERY_ERRORS_METRICS,
     GRAPHQL_QUERY_HEIGHT_METRICS,
@@ -72,6 +71,7 @@ if TYPE_CHECKING:
         DocumentNode,
         OperationDefinitionNode,
     )
+    from starlette.background import BackgroundTasks
     from starlette.types import Receive, Scope, Send
 
     from infrahub.core.branch import Branch
@@ -92,6 +92,10 @@ GQL_ERROR = "error"
 GQL_START = "start"
 GQL_STOP = "stop"
 
+# Responses larger than the threshold are sent to the client in chunks instead of a single message
+GRAPHQL_RESPONSE_STREAM_THRESHOLD = 1024 * 1024
+GRAPHQL_RESPONSE_CHUNK_SIZE = 64 * 1024
+
 ContextValue = Union[Any, Callable[[HTTPConnection], Any]]
 RootValue = Any
 
@@ -184,7 +188,7 @@ class InfrahubGraphQLApp:
 
     async def _handle_http_request(
         self, request: Request, db: InfrahubDatabase, branch: Branch, account_session: AccountSession
-    ) -> JSONResponse:
+    ) -> Response:
         if request.app.state.response_delay:
             self.logger.info(f"Adding response delay of {request.app.state.response_delay} seconds")
             time.sleep(request.app.state.response_delay)
@@ -214,7 +218,7 @@ class InfrahubGraphQLApp:
         if analyzed_query.contains_mutation:
             graphql_params.context.at = Timestamp()
         elif at and branch.schema_changed_at and Timestamp(branch.schema_changed_at) > Timestamp(at):
-            schema_branch = await registry.schema.load_schema_from_db(db=db, branch=branch, at=Timestamp(at))
+            schema_branch = await registry.schema.load_schema_at(db=db, branch=branch, at=Timestamp(at))
             db.add_schema(name=branch.name, schema=schema_branch)
 
         if operation_name == "IntrospectionQuery":
@@ -234,10 +238,9 @@ class InfrahubGraphQLApp:
         with trace.get_tracer(__name__).start_as_current_span("execute_graphql") as span:
             span.set_attributes(labels)
 
-            with GRAPHQL_DURATION_METRICS.labels(**labels).time():
-                result = await graphql(
-                    schema=graphql_params.schema,
-                    source=query,
+            resolve_timer = GRAPHQL_PHASE_DURATION_METRICS.labels("resolve").time()
+            with GRAPHQL_DURATION_METRICS.labels(**labels).time(), resolve_timer:
+                result = await analyzed_query.execute(
                     context_value=graphql_params.context,
                     root_value=self.root_value,
                     middleware=self.middleware,
@@ -253,13 +256,10 @@ class InfrahubGraphQLApp:
                     self._log_error(error=error.original_error)
             response["errors"] = [self.error_formatter(error) for error in result.errors]
 
-        json_response = JSONResponse(
-            response,
-            status_code=200,
-            background=graphql_params.context.background,
-        )
+        with GRAPHQL_PHASE_DURATION_METRICS.labels("serialize").time():
+            body = ujson.dumps(response, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
 
-        GRAPHQL_RESPONSE_SIZE_METRICS.labels(**labels).observe(len(json_response.render(response)))
+        GRAPHQL_RESPONSE_SIZE_METRICS.labels(**labels).observe(len(body))
         GRAPHQL_QUERY_DEPTH_METRICS.labels(**labels).observe(await analyzed_query.calculate_depth())
         GRAPHQL_QUERY_HEIGHT_METRICS.labels(**labels).observe(await analyzed_query.calculate_height())
         # GRAPHQL_QUERY_VARS_METRICS.labels(**labels).observe(len(analyzed_query.variables))
@@ -272,7 +272,7 @@ class InfrahubGraphQLApp:
         if not valid:
             GRAPHQL_QUERY_ERRORS_METRICS.labels(**labels).observe(len(errors))
 
-        return json_response
+        return _build_json_response(body=body, background=graphql_params.context.background)
 
     def _log_error(self, error: Exception) -> None:
         if isinstance(error, Error):
@@ -356,9 +356,10 @@ class InfrahubGraphQLApp:
         document: Optional[DocumentNode] = None
 
         try:
-            document = parse(query)
+            cache_entry = graphql_document_cache.get(schema=graphql_params.schema, query=query)
+            document = cache_entry.document
             operation = get_operation_ast(document, operation_name)
-            errors = validate(graphql_params.schema, document)
+            errors = cache_entry.errors
         except GraphQLError as e:
             errors = [e]
 
@@ -503,3 +504,23 @@ def _inject_file_to_operations(ops_tree: Any, _file: UploadFile, path: Sequence[
             ops_tree[key] = _file
     else:
         _inject_file_to_operations(ops_tree[key], _file, path[1:])
+
+
+async def _iter_chunks(body: bytes) -> AsyncGenerator[bytes, None]:
+    view = memoryview(body)
+    for start in range(0, len(view), GRAPHQL_RESPONSE_CHUNK_SIZE):
+        yield bytes(view[start : start + GRAPHQL_RESPONSE_CHUNK_SIZE])
+
+
+def _build_json_response(body: bytes, background: Optional[BackgroundTasks] = None) -> Response:
+    """Return a response for a JSON body already serialized, large bodies are streamed in chunks."""
+    if len(body) <= GRAPHQL_RESPONSE_STREAM_THRESHOLD:
+        return Response(content=body, status_code=200, media_type="application/json", background=background)
+
+    return StreamingResponse(
+        _iter_chunks(body=body),
+        status_code=200,
+        media_type="application/json",
+        headers={"content-length": str(len(body))},
+        background=background,
+    )
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from infrahub import config
+
+from .manager import GraphQLSchemaManager
+from .metrics import SCHEMA_GRAPHQL_CACHE_METRICS
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+
+    from infrahub.core.schema_manager import SchemaBranch
+
+
+@dataclass
+class GraphQLSchemaCacheEntry:
+    manager: GraphQLSchemaManager
+    schema: GraphQLSchema
+
+
+class GraphQLSchemaCache:
+    """Process wide cache of the generated GraphQL schemas.
+
+    The GraphQL schema only depends on the content of the SchemaBranch, all the branches with the same schema hash
+    can reuse the same GraphQLSchema object instead of generating their own.
+    The least recently used schemas are evicted once the cache is full.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[str, GraphQLSchemaCacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size or config.SETTINGS.api.graphql_schema_cache_size
+
+    @staticmethod
+    def get_key(
+        schema_branch: SchemaBranch,
+        include_query: bool = True,
+        include_mutation: bool = True,
+        include_subscription: bool = True,
+        include_types: bool = True,
+    ) -> str:
+        md5hash = hashlib.md5()
+        md5hash.update(schema_branch.get_hash().encode())
+        for key, value in sorted(schema_branch.profiles.items()):
+            md5hash.update(str(key).encode())
+            md5hash.update(str(value).encode())
+        options = (
+            include_query,
+            include_mutation,
+            include_subscription,
+            include_types,
+            config.SETTINGS.experimental_features.graphql_enums,
+        )
+        md5hash.update(str(options).encode())
+
+        return md5hash.hexdigest()
+
+    def get(
+        self,
+        schema_branch: SchemaBranch,
+        include_query: bool = True,
+        include_mutation: bool = True,
+        include_subscription: bool = True,
+        include_types: bool = True,
+    ) -> GraphQLSchemaCacheEntry:
+        """Return the GraphQL schema matching this SchemaBranch, the schema is generated only if it's not already present."""
+        key = self.get_key(
+            schema_branch=schema_branch,
+            include_query=include_query,
+            include_mutation=include_mutation,
+            include_subscription=include_subscription,
+            include_types=include_types,
+        )
+
+        if key in self._entries:
+            SCHEMA_GRAPHQL_CACHE_METRICS.labels("hit").inc()
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        SCHEMA_GRAPHQL_CACHE_METRICS.labels("miss").inc()
+        manager = GraphQLSchemaManager(schema=schema_branch)
+        entry = GraphQLSchemaCacheEntry(
+            manager=manager,
+            schema=manager.generate(
+                include_query=include_query,
+                include_mutation=include_mutation,
+                include_subscription=include_subscription,
+                include_types=include_types,
+            ),
+        )
+        self._entries[key] = entry
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+graphql_schema_cache = GraphQLSchemaCache()
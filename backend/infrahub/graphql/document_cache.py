@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from graphql import parse, validate
+
+from infrahub import config
+
+from .metrics import GRAPHQL_DOCUMENT_CACHE_METRICS, GRAPHQL_PHASE_DURATION_METRICS
+
+if TYPE_CHECKING:
+    from graphql import DocumentNode, GraphQLError, GraphQLSchema
+
+
+@dataclass
+class GraphQLDocumentCacheEntry:
+    schema: GraphQLSchema
+    document: DocumentNode
+    errors: List[GraphQLError]
+
+
+class GraphQLDocumentCache:
+    """Process wide cache of the parsed and validated GraphQL queries.
+
+    The GraphQLSchema objects are already shared between all the branches with the same schema hash,
+    the identity of the GraphQLSchema is used in the key in place of the hash of the schema.
+    Each entry keeps a reference to its GraphQLSchema so its identity can't be reused while the entry exists.
+    The least recently used queries are evicted once the cache is full.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[Tuple[int, str], GraphQLDocumentCacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size or config.SETTINGS.api.graphql_document_cache_size
+
+    def get(self, schema: GraphQLSchema, query: str) -> GraphQLDocumentCacheEntry:
+        """Return the document and the validation errors of a query, the query is parsed and validated only if it's not already present.
+
+        A GraphQLSyntaxError is raised if the query can't be parsed, these queries are not cached.
+        """
+        key = (id(schema), query)
+
+        entry = self._entries.get(key)
+        if entry and entry.schema is schema:
+            GRAPHQL_DOCUMENT_CACHE_METRICS.labels("hit").inc()
+            self._entries.move_to_end(key)
+            return entry
+
+        GRAPHQL_DOCUMENT_CACHE_METRICS.labels("miss").inc()
+        with GRAPHQL_PHASE_DURATION_METRICS.labels("parse").time():
+            document = parse(query)
+        with GRAPHQL_PHASE_DURATION_METRICS.labels("validate").time():
+            errors = validate(schema=schema, document_ast=document)
+        entry = GraphQLDocumentCacheEntry(schema=schema, document=document, errors=errors)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+graphql_document_cache = GraphQLDocumentCache()
@@ -0,0 +1,3 @@
+from .peers import PeerRelationshipsDataLoader, QueryPeerParams
+
+__all__ = ["PeerRelationshipsDataLoader", "QueryPeerParams"]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import ujson
+from graphene.utils.dataloader import DataLoader
+
+from infrahub.core.manager import NodeManager
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.core.relationship.model import Relationship
+    from infrahub.core.schema import RelationshipSchema
+    from infrahub.core.timestamp import Timestamp
+    from infrahub.database import InfrahubDatabase
+
+
+@dataclass
+class QueryPeerParams:
+    branch: Branch
+    source_kind: str
+    schema: RelationshipSchema
+    filters: Dict[str, Any]
+    fields: Optional[dict] = None
+    at: Optional[Timestamp] = None
+
+    def get_key(self) -> str:
+        """Return a key identifying all the requests that can be resolved within the same query."""
+        return ujson.dumps(
+            {
+                "source_kind": self.source_kind,
+                "relationship": self.schema.name,
+                "filters": self.filters,
+                "fields": self.fields,
+            },
+            sort_keys=True,
+        )
+
+
+class PeerRelationshipsDataLoader(DataLoader):
+    """Collect the ids of all the nodes requesting the peers of the same relationship
+    with the same filters and fields and resolve them with a single call to NodeManager.query_peers.
+
+    The results are not cached between 2 dispatches to ensure the data returned
+    after a mutation within the same request is always up to date.
+    """
+
+    cache = False
+
+    def __init__(self, db: InfrahubDatabase, query_params: QueryPeerParams, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.db = db
+        self.query_params = query_params
+
+    async def batch_load_fn(self, keys: List[str]) -> List[List[Relationship]]:  # pylint: disable=method-hidden
+        async with self.db.start_session() as db:
+            peer_rels = await NodeManager.query_peers(
+                db=db,
+                ids=list(set(keys)),
+                source_kind=self.query_params.source_kind,
+                schema=self.query_params.schema,
+                filters=self.query_params.filters,
+                fields=self.query_params.fields,
+                at=self.query_params.at,
+                branch=self.query_params.branch,
+            )
+            if not peer_rels:
+                return [[] for _ in keys]
+
+            # Load all the peers at once instead of letting each relationship query its own peer
+            peers = await NodeManager.get_many(
+                db=db,
+                ids=list({rel.get_peer_id() for rel in peer_rels}),
+                at=self.query_params.at,
+                branch=self.query_params.branch,
+                include_owner=True,
+                include_source=True,
+            )
+
+        peer_rels_by_node_id: Dict[str, List[Relationship]] = defaultdict(list)
+        for rel in peer_rels:
+            peer = peers.get(rel.get_peer_id())
+            if peer:
+                await rel.set_peer(value=peer)
+            peer_rels_by_node_id[rel.node_id].append(rel)
+
+        return [peer_rels_by_node_id.get(key, []) for key in keys]
@@ -78,6 +78,8 @@ class GraphqlMutations:
     update: Type[InfrahubMutation]
     upsert: Type[InfrahubMutation]
     delete: Type[InfrahubMutation]
+    create_many: Optional[Type[InfrahubMutation]] = None
+    upsert_many: Optional[Type[InfrahubMutation]] = None
 
 
 def get_attr_kind(node_schema: MainSchemaTypes, attr_schema: AttributeSchema) -> str:
@@ -429,6 +431,9 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
             class_attrs[f"{node_schema.kind}Update"] = mutations.update.Field()
             class_attrs[f"{node_schema.kind}Upsert"] = mutations.upsert.Field()
             class_attrs[f"{node_schema.kind}Delete"] = mutations.delete.Field()
+            if mutations.create_many and mutations.upsert_many:
+                class_attrs[f"{node_schema.kind}CreateMany"] = mutations.create_many.Field()
+                class_attrs[f"{node_schema.kind}UpsertMany"] = mutations.upsert_many.Field()
 
         return type("MutationMixin", (object,), class_attrs)
 
@@ -554,7 +559,23 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
         self.set_type(name=upsert._meta.name, graphql_type=upsert)
         self.set_type(name=delete._meta.name, graphql_type=delete)
 
-        return GraphqlMutations(create=create, update=update, upsert=upsert, delete=delete)
+        mutations = GraphqlMutations(create=create, update=update, upsert=upsert, delete=delete)
+
+        # The bulk mutations are only available for the kinds without a dedicated mutation class
+        if base_class is InfrahubMutation:
+            mutations.create_many = self.generate_graphql_mutation_create_many(
+                schema=schema, base_class=base_class, input_type=graphql_mutation_create_input
+            )
+            mutations.upsert_many = self.generate_graphql_mutation_create_many(
+                schema=schema,
+                base_class=base_class,
+                input_type=graphql_mutation_upsert_input,
+                mutation_type="UpsertMany",
+            )
+            self.set_type(name=mutations.create_many._meta.name, graphql_type=mutations.create_many)
+            self.set_type(name=mutations.upsert_many._meta.name, graphql_type=mutations.upsert_many)
+
+        return mutations
 
     def generate_graphql_mutation_create_input(
         self,
@@ -714,6 +735,34 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
 
         return type(name, (base_class,), main_attrs)
 
+    def generate_graphql_mutation_create_many(
+        self,
+        schema: Union[NodeSchema, ProfileSchema],
+        input_type: Type[graphene.InputObjectType],
+        base_class: Type[InfrahubMutation] = InfrahubMutation,
+        mutation_type: str = "CreateMany",
+    ) -> Type[InfrahubMutation]:
+        """Generate a GraphQL Mutation to CREATE multiple objects based on the specified NodeSchema."""
+        name = f"{schema.kind}{mutation_type}"
+
+        object_type = self.generate_graphql_object(schema=schema)
+
+        main_attrs: Dict[str, Any] = {
+            "ok": graphene.Boolean(),
+            "count": graphene.Int(),
+            "objects": graphene.List(object_type),
+        }
+
+        meta_attrs: Dict[str, Any] = {"schema": schema, "name": name, "description": schema.description}
+        main_attrs["Meta"] = type("Meta", (object,), meta_attrs)
+
+        args_attrs = {
+            "data": graphene.List(graphene.NonNull(input_type), required=True),
+        }
+        main_attrs["Arguments"] = type("Arguments", (object,), args_attrs)
+
+        return type(name, (base_class,), main_attrs)
+
     def generate_graphql_mutation_update(
         self,
         schema: Union[NodeSchema, ProfileSchema],
@@ -1,4 +1,4 @@
-from prometheus_client import Histogram
+from prometheus_client import Counter, Histogram
 
 METRIC_PREFIX = "infrahub_graphql"
 
@@ -9,6 +9,12 @@ SCHEMA_GENERATE_GRAPHQL_METRICS = Histogram(
     buckets=[0.0005, 0.25, 0.5, 1, 5],
 )
 
+SCHEMA_GRAPHQL_CACHE_METRICS = Counter(
+    f"{METRIC_PREFIX}_schema_cache",
+    "Number of lookups in the cache of generated GraphQL Schema",
+    labelnames=["result"],
+)
+
 GRAPHQL_DURATION_METRICS = Histogram(
     f"{METRIC_PREFIX}_duration_seconds",
     "GraphQL query duration, in seconds",
@@ -57,3 +63,16 @@ GRAPHQL_TOP_LEVEL_QUERIES_METRICS = Histogram(
     labelnames=["type", "operation", "branch", "name", "query_id"],
     buckets=[1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 15, 25, 50, 100],
 )
+
+GRAPHQL_DOCUMENT_CACHE_METRICS = Counter(
+    f"{METRIC_PREFIX}_document_cache",
+    "Number of lookups in the cache of parsed and validated GraphQL queries",
+    labelnames=["result"],
+)
+
+GRAPHQL_PHASE_DURATION_METRICS = Histogram(
+    f"{METRIC_PREFIX}_phase_duration_seconds",
+    "Duration of each phase of the processing of a GraphQL query (parse, validate, resolve, serialize), in seconds",
+    labelnames=["phase"],
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1, 5, 10],
+)
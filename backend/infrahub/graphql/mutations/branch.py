@@ -208,9 +208,9 @@ class BranchRebase(Mutation):
 
             schema_in_main_before = merger.destination_schema.duplicate()
 
-            async with context.db.start_transaction() as dbt:
-                await obj.rebase(db=dbt)
-                await task.info(message="Branch successfully rebased", db=dbt)
+            # The edges of the branch are updated in chunks, each chunk is committed in its own transaction
+            await obj.rebase(db=context.db, task=task)
+            await task.info(message="Branch successfully rebased", db=context.db)
 
             if obj.has_schema_changes:
                 # NOTE there is a bit additional work in order to calculate a proper diff that will
@@ -283,7 +283,7 @@ class BranchValidate(Mutation):
             ok = True
             validation_messages = ""
 
-            diff = await BranchDiffer.init(db=context.db, branch=obj)
+            diff = await BranchDiffer.init(db=context.db, branch=obj, service=context.service)
             conflicts = await diff.get_conflicts()
 
             if conflicts:
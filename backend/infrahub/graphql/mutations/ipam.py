@@ -16,6 +16,7 @@ from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import NodeNotFoundError, ValidationError
 from infrahub.graphql.mutations.node_getter.interface import MutationNodeGetterInterface
 from infrahub.log import get_logger
+from infrahub.pools.address import address_free_ranges_index
 
 from .main import InfrahubMutationMixin, InfrahubMutationOptions
 
@@ -145,6 +146,7 @@ class InfrahubIPAddressMutation(InfrahubMutationMixin, Mutation):
         )
         namespace = await address.ip_namespace.get_peer(db)
         namespace_id = await validate_namespace(db=db, data=data, existing_namespace_id=namespace.id)
+        previous_address = ipaddress.ip_interface(address.address.value)
         try:
             async with db.start_transaction() as dbt:
                 address = await cls.mutate_update_object(db=dbt, info=info, data=data, branch=branch, obj=address)
@@ -158,6 +160,9 @@ class InfrahubIPAddressMutation(InfrahubMutationMixin, Mutation):
         except ValidationError as exc:
             raise ValueError(str(exc)) from exc
 
+        if ip_address != previous_address or namespace_id != namespace.id:
+            address_free_ranges_index.invalidate(address=previous_address.ip, namespace_id=namespace.id)
+
         return address, result
 
     @classmethod
@@ -190,7 +195,9 @@ class InfrahubIPAddressMutation(InfrahubMutationMixin, Mutation):
         branch: Branch,
         at: str,
     ):
-        return await super().mutate_delete(root=root, info=info, data=data, branch=branch, at=at)
+        address, result = await super().mutate_delete(root=root, info=info, data=data, branch=branch, at=at)
+        address_free_ranges_index.invalidate(address=ipaddress.ip_interface(address.address.value).ip)
+        return address, result
 
 
 class InfrahubIPPrefixMutation(InfrahubMutationMixin, Mutation):
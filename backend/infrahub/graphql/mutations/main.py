@@ -64,39 +64,58 @@ class InfrahubMutationMixin:
         action = MutationAction.UNDEFINED
         validate_mutation_permissions(operation=cls.__name__, account_session=context.account_session)
 
-        if "Create" in cls.__name__:
-            obj, mutation = await cls.mutate_create(
+        if cls.__name__.endswith("CreateMany"):
+            objs, mutation = await cls.mutate_create_many(
                 root=root, info=info, branch=context.branch, at=context.at, **kwargs
             )
-            action = MutationAction.ADDED
-        elif "Update" in cls.__name__:
-            obj, mutation = await cls.mutate_update(
-                root=root, info=info, branch=context.branch, at=context.at, **kwargs
+            mutated_objs = [(obj, MutationAction.ADDED) for obj in objs]
+        elif cls.__name__.endswith("UpsertMany"):
+            objs, mutation, created = await cls.mutate_upsert_many(
+                root=root,
+                info=info,
+                branch=context.branch,
+                at=context.at,
+                node_getters=cls._get_upsert_node_getters(db=context.db),
+                **kwargs,
             )
-            action = MutationAction.UPDATED
-        elif "Upsert" in cls.__name__:
-            node_manager = NodeManager()
-            node_getters = [
-                MutationNodeGetterById(db=context.db, node_manager=node_manager),
-                MutationNodeGetterByHfid(db=context.db, node_manager=node_manager),
-                MutationNodeGetterByDefaultFilter(db=context.db, node_manager=node_manager),
+            mutated_objs = [
+                (obj, MutationAction.ADDED if obj_created else MutationAction.UPDATED)
+                for obj, obj_created in zip(objs, created)
             ]
-            obj, mutation, created = await cls.mutate_upsert(
-                root=root, info=info, branch=context.branch, at=context.at, node_getters=node_getters, **kwargs
-            )
-            if created:
+        else:
+            if "Create" in cls.__name__:
+                obj, mutation = await cls.mutate_create(
+                    root=root, info=info, branch=context.branch, at=context.at, **kwargs
+                )
                 action = MutationAction.ADDED
-            else:
+            elif "Update" in cls.__name__:
+                obj, mutation = await cls.mutate_update(
+                    root=root, info=info, branch=context.branch, at=context.at, **kwargs
+                )
                 action = MutationAction.UPDATED
-        elif "Delete" in cls.__name__:
-            obj, mutation = await cls.mutate_delete(
-                root=root, info=info, branch=context.branch, at=context.at, **kwargs
-            )
-            action = MutationAction.REMOVED
-        else:
-            raise ValueError(
-                f"Unexpected class Name: {cls.__name__}, should end with Create, Update, Upsert, or Delete"
-            )
+            elif "Upsert" in cls.__name__:
+                obj, mutation, created = await cls.mutate_upsert(
+                    root=root,
+                    info=info,
+                    branch=context.branch,
+                    at=context.at,
+                    node_getters=cls._get_upsert_node_getters(db=context.db),
+                    **kwargs,
+                )
+                if created:
+                    action = MutationAction.ADDED
+                else:
+                    action = MutationAction.UPDATED
+            elif "Delete" in cls.__name__:
+                obj, mutation = await cls.mutate_delete(
+                    root=root, info=info, branch=context.branch, at=context.at, **kwargs
+                )
+                action = MutationAction.REMOVED
+            else:
+                raise ValueError(
+                    f"Unexpected class Name: {cls.__name__}, should end with Create, Update, Upsert, or Delete"
+                )
+            mutated_objs = [(obj, action)]
 
         # Reset the time of the query to guarantee that all resolvers executed after this point will account for the changes
         context.at = Timestamp()
@@ -105,20 +124,30 @@ class InfrahubMutationMixin:
             log_data = get_log_data()
             request_id = log_data.get("request_id", "")
 
-            data = await obj.to_graphql(db=context.db, filter_sensitive=True)
+            for mutated_obj, mutated_action in mutated_objs:
+                data = await mutated_obj.to_graphql(db=context.db, filter_sensitive=True)
 
-            message = messages.EventNodeMutated(
-                branch=context.branch.name,
-                kind=obj._schema.kind,
-                node_id=obj.id,
-                data=data,
-                action=action.value,
-                meta=Meta(initiator_id=WORKER_IDENTITY, request_id=request_id),
-            )
-            context.background.add_task(services.send, message)
+                message = messages.EventNodeMutated(
+                    branch=context.branch.name,
+                    kind=mutated_obj._schema.kind,
+                    node_id=mutated_obj.id,
+                    data=data,
+                    action=mutated_action.value,
+                    meta=Meta(initiator_id=WORKER_IDENTITY, request_id=request_id),
+                )
+                context.background.add_task(services.send, message)
 
         return mutation
 
+    @staticmethod
+    def _get_upsert_node_getters(db: InfrahubDatabase) -> List[MutationNodeGetterInterface]:
+        node_manager = NodeManager()
+        return [
+            MutationNodeGetterById(db=db, node_manager=node_manager),
+            MutationNodeGetterByHfid(db=db, node_manager=node_manager),
+            MutationNodeGetterByDefaultFilter(db=db, node_manager=node_manager),
+        ]
+
     @classmethod
     async def _get_profile_ids(cls, db: InfrahubDatabase, obj: Node) -> set[str]:
         if not hasattr(obj, "profiles"):
@@ -202,6 +231,73 @@ class InfrahubMutationMixin:
             result["object"] = await obj.to_graphql(db=db, fields=fields.get("object", {}))
         return cls(**result)
 
+    @classmethod
+    async def mutate_create_many(
+        cls,
+        root: dict,
+        info: GraphQLResolveInfo,
+        data: List[InputObjectType],
+        branch: Branch,
+        at: str,
+        database: Optional[InfrahubDatabase] = None,
+    ) -> Tuple[List[Node], Self]:
+        context: GraphqlContext = info.context
+        db = database or context.db
+        objs = await cls.mutate_create_many_objects(data=data, db=db, branch=branch, at=at)
+        result = await cls.mutate_many_to_graphql(info=info, db=db, objs=objs)
+        return objs, result
+
+    @classmethod
+    @retry_db_transaction(name="object_create_many")
+    async def mutate_create_many_objects(
+        cls,
+        data: List[Union[InputObjectType, dict]],
+        db: InfrahubDatabase,
+        branch: Branch,
+        at: str,
+    ) -> List[Node]:
+        """Create multiple objects of the same kind, validated together and written in batches."""
+        if not data:
+            return []
+
+        component_registry = get_component_registry()
+        node_constraint_runner = await component_registry.get_component(NodeConstraintRunner, db=db, branch=branch)
+        node_class = Node
+        if cls._meta.schema.kind in registry.node:
+            node_class = registry.node[cls._meta.schema.kind]
+
+        try:
+            objs: List[Node] = []
+            for item in data:
+                obj = await node_class.init(db=db, schema=cls._meta.schema, branch=branch, at=at)
+                await obj.new(db=db, **item)
+                objs.append(obj)
+
+            fields_to_validate = list({field_name: None for item in data for field_name in item})
+            await node_constraint_runner.check_many(nodes=objs, field_filters=fields_to_validate)
+            if db.is_transaction:
+                await NodeManager.create_many(db=db, nodes=objs, at=at)
+            else:
+                async with db.start_transaction() as dbt:
+                    await NodeManager.create_many(db=dbt, nodes=objs, at=at)
+
+        except ValidationError as exc:
+            raise ValueError(str(exc)) from exc
+
+        for idx, obj in enumerate(objs):
+            if await cls._get_profile_ids(db=db, obj=obj):
+                objs[idx] = await cls._refresh_for_profile_update(db=db, branch=branch, obj=obj)
+
+        return objs
+
+    @classmethod
+    async def mutate_many_to_graphql(cls, info: GraphQLResolveInfo, db: InfrahubDatabase, objs: List[Node]) -> Self:
+        fields = await extract_fields(info.field_nodes[0].selection_set)
+        result = {"ok": True, "count": len(objs)}
+        if "objects" in fields:
+            result["objects"] = [await obj.to_graphql(db=db, fields=fields.get("objects", {})) for obj in objs]
+        return cls(**result)
+
     @classmethod
     @retry_db_transaction(name="object_update")
     async def mutate_update(
@@ -318,6 +414,78 @@ class InfrahubMutationMixin:
         created_obj, mutation = await cls.mutate_create(root=root, info=info, data=data_dict, branch=branch, at=at)
         return created_obj, mutation, True
 
+    @classmethod
+    @retry_db_transaction(name="object_upsert_many")
+    async def mutate_upsert_many(
+        cls,
+        root: dict,
+        info: GraphQLResolveInfo,
+        data: List[InputObjectType],
+        branch: Branch,
+        at: str,
+        node_getters: List[MutationNodeGetterInterface],
+        database: Optional[InfrahubDatabase] = None,
+    ) -> Tuple[List[Node], Self, List[bool]]:
+        context: GraphqlContext = info.context
+        db = database or context.db
+
+        if db.is_transaction:
+            objs, created = await cls._upsert_many_objects(
+                info=info, db=db, data=data, branch=branch, at=at, node_getters=node_getters
+            )
+            result = await cls.mutate_many_to_graphql(info=info, db=db, objs=objs)
+        else:
+            async with db.start_transaction() as dbt:
+                objs, created = await cls._upsert_many_objects(
+                    info=info, db=dbt, data=data, branch=branch, at=at, node_getters=node_getters
+                )
+                result = await cls.mutate_many_to_graphql(info=info, db=dbt, objs=objs)
+
+        return objs, result, created
+
+    @classmethod
+    async def _upsert_many_objects(
+        cls,
+        info: GraphQLResolveInfo,
+        db: InfrahubDatabase,
+        data: List[InputObjectType],
+        branch: Branch,
+        at: str,
+        node_getters: List[MutationNodeGetterInterface],
+    ) -> Tuple[List[Node], List[bool]]:
+        """Update the existing objects one by one and create all the new ones together."""
+        node_schema = db.schema.get(name=cls._meta.schema.kind, branch=branch)
+
+        objs: List[Optional[Node]] = [None] * len(data)
+        create_indexes: List[int] = []
+        create_data: List[dict] = []
+        for idx, item in enumerate(data):
+            node = None
+            for getter in node_getters:
+                node = await getter.get_node(node_schema=node_schema, data=item, branch=branch, at=at)
+                if node:
+                    break
+
+            if not node:
+                # hfid isn't a valid input when creating the object
+                item_dict = dict(item)
+                item_dict.pop("hfid", None)
+                create_indexes.append(idx)
+                create_data.append(item_dict)
+                continue
+
+            try:
+                objs[idx] = await cls.mutate_update_object(db=db, info=info, data=item, branch=branch, obj=node)
+            except ValidationError as exc:
+                raise ValueError(str(exc)) from exc
+
+        created_objs = await cls.mutate_create_many_objects(data=create_data, db=db, branch=branch, at=at)
+        for idx, obj in zip(create_indexes, created_objs):
+            objs[idx] = obj
+
+        created_indexes = set(create_indexes)
+        return [obj for obj in objs if obj], [idx in created_indexes for idx in range(len(data))]
+
     @classmethod
     @retry_db_transaction(name="object_delete")
     async def mutate_delete(
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Dict
 from graphene import Boolean, InputField, InputObjectType, List, Mutation, String
 from infrahub_sdk.utils import compare_lists
 
+from infrahub import config
 from infrahub.core.constants import InfrahubKind, RelationshipCardinality
 from infrahub.core.manager import NodeManager
 from infrahub.core.query.relationship import (
@@ -14,6 +15,10 @@ from infrahub.core.query.relationship import (
 from infrahub.core.relationship import Relationship
 from infrahub.database import retry_db_transaction
 from infrahub.exceptions import NodeNotFoundError, ValidationError
+from infrahub.log import get_log_data
+from infrahub.message_bus import Meta, messages
+from infrahub.services import services
+from infrahub.worker import WORKER_IDENTITY
 
 from ..types import RelatedNodeInput
 
@@ -129,6 +134,16 @@ class RelationshipMixin:
                         await rel.load(db=db, data=existing_peers[node_data.get("id")])
                         await rel.delete(db=db)
 
+        if config.SETTINGS.broker.enable and context.background:
+            # The relationships are not reported with event.node.mutated, the subscriptions are refreshed directly
+            log_data = get_log_data()
+            message = messages.RefreshGraphQLQuerySubscriptions(
+                branch=context.branch.name,
+                kinds=sorted({source.get_kind()} | {node.get_kind() for node in nodes.values()}),
+                meta=Meta(initiator_id=WORKER_IDENTITY, request_id=log_data.get("request_id", "")),
+            )
+            context.background.add_task(services.send, message)
+
         return cls(ok=True)
 
 
@@ -98,7 +98,12 @@ class DiffSummaryEntry(ObjectType):
     ) -> list[Dict[str, Union[str, list[Dict[str, str]]]]]:
         context: GraphqlContext = info.context
         diff = await BranchDiffer.init(
-            db=context.db, branch=context.branch, diff_from=time_from, diff_to=time_to, branch_only=branch_only
+            db=context.db,
+            branch=context.branch,
+            diff_from=time_from,
+            diff_to=time_to,
+            branch_only=branch_only,
+            service=context.service,
         )
         diff_payload_builder = DiffPayloadBuilder(db=context.db, diff=diff)
         branch_diff_nodes = await diff_payload_builder.get_branch_diff_nodes()
@@ -43,7 +43,12 @@ class DiffSummaryEntryOld(ObjectType):
     ) -> list[Dict[str, Union[str, list[str]]]]:
         context: GraphqlContext = info.context
         diff = await BranchDiffer.init(
-            db=context.db, branch=context.branch, diff_from=time_from, diff_to=time_to, branch_only=branch_only
+            db=context.db,
+            branch=context.branch,
+            diff_from=time_from,
+            diff_to=time_to,
+            branch_only=branch_only,
+            service=context.service,
         )
         summary = await diff.get_summary()
         return [entry.to_graphql() for entry in summary]
@@ -9,7 +9,7 @@ from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
 from infrahub.core.query.ipam import get_ip_addresses, get_subnets
 from infrahub.exceptions import NodeNotFoundError, ValidationError
-from infrahub.pools.address import get_available
+from infrahub.pools.address import AddressFreeRanges
 from infrahub.pools.prefix import PrefixPool
 
 if TYPE_CHECKING:
@@ -51,18 +51,17 @@ class IPAddressGetNextAvailable(ObjectType):
             branch=context.branch,
         )
 
-        available = get_available(
+        available = AddressFreeRanges(
             network=ip_prefix,
             addresses=[ip.address for ip in addresses],
             is_pool=prefix.is_pool.value,  # type: ignore[attr-defined]
         )
 
-        if not available:
+        next_address = available.first()
+        if not next_address:
             raise IndexError("No addresses available in prefix")
 
-        next_address = available.iter_cidrs()[0]
-
-        return {"address": f"{next_address.ip}/{prefix_length}"}
+        return {"address": f"{next_address}/{prefix_length}"}
 
 
 class IPPrefixGetNextAvailable(ObjectType):
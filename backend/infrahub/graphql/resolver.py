@@ -8,6 +8,7 @@ from infrahub.core.constants import RelationshipHierarchyDirection
 from infrahub.core.manager import NodeManager
 from infrahub.core.query.node import NodeGetHierarchyQuery
 
+from .loaders import QueryPeerParams
 from .types import RELATIONS_PROPERTY_MAP, RELATIONS_PROPERTY_MAP_REVERSED
 
 if TYPE_CHECKING:
@@ -68,10 +69,8 @@ async def default_resolver(*args, **kwargs):
         if "__" in key and value or key in ["id", "ids"]
     }
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
+    peers_loader = context.get_peers_loader(
+        query_params=QueryPeerParams(
             source_kind=node_schema.kind,
             schema=node_rel,
             filters=filters,
@@ -79,7 +78,10 @@ async def default_resolver(*args, **kwargs):
             at=context.at,
             branch=context.branch,
         )
+    )
+    objs = await peers_loader.load(parent["id"])
 
+    async with context.db.start_session() as db:
         if node_rel.cardinality == "many":
             return [
                 await obj.to_graphql(db=db, fields=fields, related_node_ids=context.related_node_ids) for obj in objs
@@ -122,10 +124,8 @@ async def single_relationship_resolver(parent: dict, info: GraphQLResolveInfo, *
     }
     response: Dict[str, Any] = {"node": None, "properties": {}}
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
+    peers_loader = context.get_peers_loader(
+        query_params=QueryPeerParams(
             source_kind=node_schema.kind,
             schema=node_rel,
             filters=filters,
@@ -133,10 +133,13 @@ async def single_relationship_resolver(parent: dict, info: GraphQLResolveInfo, *
             at=context.at,
             branch=context.branch,
         )
+    )
+    objs = await peers_loader.load(parent["id"])
 
-        if not objs:
-            return response
+    if not objs:
+        return response
 
+    async with context.db.start_session() as db:
         node_graph = await objs[0].to_graphql(db=db, fields=node_fields, related_node_ids=context.related_node_ids)
         for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
             value = node_graph.pop(key, None)
@@ -216,18 +219,32 @@ async def many_relationship_resolver(
         if not node_fields:
             return response
 
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=ids,
-            source_kind=source_kind,
-            schema=node_rel,
-            filters=filters,
-            fields=node_fields,
-            offset=offset,
-            limit=limit,
-            at=context.at,
-            branch=context.branch,
-        )
+        if include_descendants or offset or limit:
+            # The pagination and the descendants are specific to each node and can't be batched
+            objs = await NodeManager.query_peers(
+                db=db,
+                ids=ids,
+                source_kind=source_kind,
+                schema=node_rel,
+                filters=filters,
+                fields=node_fields,
+                offset=offset,
+                limit=limit,
+                at=context.at,
+                branch=context.branch,
+            )
+        else:
+            peers_loader = context.get_peers_loader(
+                query_params=QueryPeerParams(
+                    source_kind=source_kind,
+                    schema=node_rel,
+                    filters=filters,
+                    fields=node_fields,
+                    at=context.at,
+                    branch=context.branch,
+                )
+            )
+            objs = await peers_loader.load(parent["id"])
 
         if not objs:
             return response
@@ -1,21 +1,216 @@
+from __future__ import annotations
+
 import asyncio
-from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Iterable, List, Optional, Set, Tuple
 
+import ujson
 from graphene import Field, Int, String
 from graphene.types.generic import GenericScalar
-from graphql import GraphQLResolveInfo, graphql
 
+from infrahub import config
 from infrahub.core import registry
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
 from infrahub.core.timestamp import Timestamp
+from infrahub.exceptions import SchemaNotFoundError
+from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
 from infrahub.log import get_logger
 
 if TYPE_CHECKING:
+    from graphql import GraphQLResolveInfo
+
+    from infrahub.core.branch import Branch
     from infrahub.graphql import GraphqlContext
 
 log = get_logger(name="infrahub.graphql")
 
+GraphQLQueryExecutionKey = Tuple[str, str, str, int]
+
+
+class GraphQLQueryExecution:
+    """Execution of a stored GraphQL query shared by all the subscribers with the same query, params and interval.
+
+    The query is executed once when the first subscriber registers and then only when a change impacting
+    one of the kinds used by the query is reported on its branch. The interval is the minimum delay between
+    two executions, all the changes reported in the meantime are handled by a single execution.
+    The changes are reported through the message bus, when the broker is disabled the query is executed
+    again after each interval.
+    """
+
+    def __init__(
+        self,
+        context: GraphqlContext,
+        analyzed_query: InfrahubGraphQLQueryAnalyzer,
+        kinds: Set[str],
+        params: Optional[Dict[str, Any]] = None,
+        interval: int = 10,
+    ) -> None:
+        self.context = context
+        self.analyzed_query = analyzed_query
+        self.kinds = kinds
+        self.params = params or {}
+        self.interval = interval
+        self.result: Any = None
+        self.version = 0
+        self.subscribers = 0
+        self._pending = asyncio.Event()
+        self._updated = asyncio.Condition()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def branch(self) -> Branch:
+        return self.context.branch
+
+    def start(self) -> None:
+        self._pending.set()
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def is_impacted(self, branch: str, kinds: Set[str]) -> bool:
+        if branch != self.branch.name and (branch != registry.default_branch or self.branch.is_isolated):
+            return False
+        return not kinds or bool(kinds & self.kinds)
+
+    def refresh(self) -> None:
+        self._pending.set()
+
+    async def wait_for_update(self, version: int) -> Tuple[int, Any]:
+        async with self._updated:
+            await self._updated.wait_for(lambda: self.version > version)
+            return self.version, self.result
+
+    async def _execute(self) -> Any:
+        async with self.context.db.start_session() as db:
+            result = await self.analyzed_query.execute(
+                context_value=self.context.__class__(
+                    db=db, branch=self.branch, at=Timestamp(), related_node_ids=set(), types=self.context.types
+                ),
+                variable_values=self.params,
+            )
+        return result.data
+
+    async def _run(self) -> None:
+        while True:
+            if config.SETTINGS.broker.enable:
+                await self._pending.wait()
+            self._pending.clear()
+
+            try:
+                result = await self._execute()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                log.error("Unable to execute the GraphQL query subscription", exc_info=exc)
+            else:
+                async with self._updated:
+                    self.result = result
+                    self.version += 1
+                    self._updated.notify_all()
+
+            await asyncio.sleep(delay=self.interval)
+
+
+class GraphQLQuerySubscriptionManager:
+    """Registry of the GraphQL query subscriptions opened on this process."""
+
+    def __init__(self) -> None:
+        self._executions: Dict[GraphQLQueryExecutionKey, GraphQLQueryExecution] = {}
+
+    def __len__(self) -> int:
+        return len(self._executions)
+
+    @staticmethod
+    def get_key(branch: str, name: str, params: Optional[Dict[str, Any]], interval: int) -> GraphQLQueryExecutionKey:
+        return (branch, name, ujson.dumps(params or {}, sort_keys=True), interval)
+
+    async def subscribe(
+        self,
+        context: GraphqlContext,
+        name: str,
+        params: Optional[Dict[str, Any]] = None,
+        interval: int = 10,
+    ) -> AsyncGenerator[Any, None]:
+        key = self.get_key(branch=context.branch.name, name=name, params=params, interval=interval)
+        if key not in self._executions:
+            execution = await self._create_execution(context=context, name=name, params=params, interval=interval)
+            # Another subscriber could have registered the same query in the meantime
+            if key not in self._executions:
+                self._executions[key] = execution
+                execution.start()
+        execution = self._executions[key]
+
+        execution.subscribers += 1
+        try:
+            version = 0
+            while True:
+                version, result = await execution.wait_for_update(version=version)
+                yield result
+        finally:
+            execution.subscribers -= 1
+            if not execution.subscribers:
+                execution.stop()
+                self._executions.pop(key, None)
+
+    def notify(self, branch: str, kinds: Optional[List[str]] = None) -> None:
+        """Refresh the subscriptions impacted by a change on a branch, all the subscriptions of the branch are refreshed if no kind is provided."""
+        impacted_kinds: Dict[str, Set[str]] = {}
+        for execution in self._executions.values():
+            if execution.branch.name not in impacted_kinds:
+                impacted_kinds[execution.branch.name] = self._get_impacted_kinds(
+                    branch=execution.branch.name, kinds=kinds or []
+                )
+            if execution.is_impacted(branch=branch, kinds=impacted_kinds[execution.branch.name]):
+                execution.refresh()
+
+    @staticmethod
+    def _get_impacted_kinds(branch: str, kinds: List[str]) -> Set[str]:
+        """Extend the list of kinds with the generics they inherit from, the queries can use either of them."""
+        impacted_kinds = set(kinds)
+        if not kinds:
+            return impacted_kinds
+
+        schema_branch = registry.schema.get_schema_branch(name=branch)
+        for kind in kinds:
+            try:
+                node_schema = schema_branch.get(name=kind, duplicate=False)
+            except SchemaNotFoundError:
+                continue
+            impacted_kinds.update(getattr(node_schema, "inherit_from", None) or [])
+
+        return impacted_kinds
+
+    @staticmethod
+    async def _create_execution(
+        context: GraphqlContext, name: str, params: Optional[Dict[str, Any]], interval: int
+    ) -> GraphQLQueryExecution:
+        async with context.db.start_session() as db:
+            # Find the GraphQLQuery and the GraphQL Schema
+            graphql_query = await NodeManager.get_one_by_default_filter(
+                db=db, id=name, kind=InfrahubKind.GRAPHQLQUERY, branch=context.branch, at=Timestamp()
+            )
+            if not graphql_query:
+                raise ValueError(f"Unable to find the {InfrahubKind.GRAPHQLQUERY} {name}")
+
+        schema_branch = registry.schema.get_schema_branch(name=context.branch.name)
+        analyzed_query = InfrahubGraphQLQueryAnalyzer(
+            query=graphql_query.query.value,  # type: ignore[attr-defined]
+            schema=schema_branch.get_graphql_schema(),
+            branch=context.branch,
+        )
+
+        return GraphQLQueryExecution(
+            context=context,
+            analyzed_query=analyzed_query,
+            kinds=await analyzed_query.get_models_in_use(types=context.types),
+            params=params,
+            interval=interval,
+        )
+
+
+graphql_query_subscriptions = GraphQLQuerySubscriptionManager()
+
 
 async def resolver_graphql_query(
     parent: dict,  # pylint: disable=unused-argument
@@ -25,33 +220,11 @@ async def resolver_graphql_query(
     interval: Optional[int] = 10,
 ) -> Iterable[Dict]:
     context: GraphqlContext = info.context
-    at = Timestamp()
-
-    async with context.db.start_session() as db:
-        # Find the GraphQLQuery and the GraphQL Schema
-        graphql_query = await NodeManager.get_one_by_default_filter(
-            db=db, id=name, kind=InfrahubKind.GRAPHQLQUERY, branch=context.branch, at=at
-        )
-        if not graphql_query:
-            raise ValueError(f"Unable to find the {InfrahubKind.GRAPHQLQUERY} {name}")
-
-        schema_branch = registry.schema.get_schema_branch(name=context.branch.name)
-        graphql_schema = schema_branch.get_graphql_schema()
-
-    while True:
-        async with context.db.start_session() as db:
-            result = await graphql(
-                schema=graphql_schema,
-                source=graphql_query.query.value,
-                context_value=context.__class__(
-                    db=db, branch=context.branch, at=Timestamp(), related_node_ids=set(), types=context.types
-                ),
-                root_value=None,
-                variable_values=params or {},
-            )
-            yield result.data
 
-        await asyncio.sleep(delay=interval)
+    async for result in graphql_query_subscriptions.subscribe(
+        context=context, name=name, params=params, interval=interval or 0
+    ):
+        yield result
 
 
 GraphQLQuerySubscription = Field(
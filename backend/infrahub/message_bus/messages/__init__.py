@@ -22,7 +22,9 @@ from .git_repository_add import GitRepositoryAdd
 from .git_repository_merge import GitRepositoryMerge
 from .git_repository_read_only_add import GitRepositoryAddReadOnly
 from .git_repository_read_only_pull import GitRepositoryPullReadOnly
+from .refresh_graphqlquery_subscriptions import RefreshGraphQLQuerySubscriptions
 from .refresh_registry_branches import RefreshRegistryBranches
+from .refresh_registry_ipaddresspools import RefreshRegistryIPAddressPools
 from .refresh_registry_rebasedbranch import RefreshRegistryRebasedBranch
 from .refresh_webhook_configuration import RefreshWebhookConfiguration
 from .request_artifact_generate import RequestArtifactGenerate
@@ -80,7 +82,9 @@ MESSAGE_MAP: Dict[str, Type[InfrahubMessage]] = {
     "git.repository.pull_read_only": GitRepositoryPullReadOnly,
     "schema.migration.path": SchemaMigrationPath,
     "schema.validator.path": SchemaValidatorPath,
+    "refresh.graphql_query.subscriptions": RefreshGraphQLQuerySubscriptions,
     "refresh.registry.branches": RefreshRegistryBranches,
+    "refresh.registry.ip_address_pools": RefreshRegistryIPAddressPools,
     "refresh.registry.rebased_branch": RefreshRegistryRebasedBranch,
     "refresh.webhook.configuration": RefreshWebhookConfiguration,
     "request.artifact.generate": RequestArtifactGenerate,
@@ -0,0 +1,15 @@
+from typing import List
+
+from pydantic import Field
+
+from infrahub.message_bus import InfrahubMessage
+
+
+class RefreshGraphQLQuerySubscriptions(InfrahubMessage):
+    """Sent to refresh the GraphQL query subscriptions impacted by a change on a branch."""
+
+    branch: str = Field(..., description="The branch that was modified")
+    kinds: List[str] = Field(
+        default_factory=list,
+        description="The kinds of the modified nodes, all the subscriptions are refreshed if empty",
+    )
@@ -0,0 +1,9 @@
+from pydantic import Field
+
+from infrahub.message_bus import InfrahubMessage
+
+
+class RefreshRegistryIPAddressPools(InfrahubMessage):
+    """Sent to drop the free addresses of the IP address pools kept within the local registry."""
+
+    branch: str = Field(..., description="The branch on which an IP address was updated or deleted")
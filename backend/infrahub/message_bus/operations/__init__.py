@@ -40,7 +40,9 @@ COMMAND_MAP = {
     "git.repository.add_read_only": git.repository.add_read_only,
     "git.repository.pull_read_only": git.repository.pull_read_only,
     "git.repository.merge": git.repository.merge,
+    "refresh.graphql_query.subscriptions": refresh.graphql_query.subscriptions,
     "refresh.registry.branches": refresh.registry.branches,
+    "refresh.registry.ip_address_pools": refresh.registry.ip_address_pools,
     "refresh.registry.rebased_branch": refresh.registry.rebased_branch,
     "refresh.webhook.configuration": refresh.webhook.configuration,
     "request.generator.run": requests.generator.run,
@@ -1,5 +1,6 @@
 from typing import List
 
+from infrahub.core.diff.cache import invalidate_diff_cache
 from infrahub.log import get_logger
 from infrahub.message_bus import InfrahubMessage, messages
 from infrahub.services import InfrahubServices
@@ -35,11 +36,15 @@ async def delete(message: messages.EventBranchDelete, service: InfrahubServices)
 async def merge(message: messages.EventBranchMerge, service: InfrahubServices) -> None:
     log.info("Branch merged", source_branch=message.source_branch, target_branch=message.target_branch)
 
+    await invalidate_diff_cache(service=service, branch_name=message.source_branch)
+    await invalidate_diff_cache(service=service, branch_name=message.target_branch)
+
     events: List[InfrahubMessage] = [
         messages.RefreshRegistryBranches(),
         messages.TriggerIpamReconciliation(branch=message.target_branch, ipam_node_details=message.ipam_node_details),
         messages.TriggerArtifactDefinitionGenerate(branch=message.target_branch),
         messages.TriggerGeneratorDefinitionRun(branch=message.target_branch),
+        messages.RefreshGraphQLQuerySubscriptions(branch=message.target_branch),
     ]
 
     for event in events:
@@ -50,8 +55,11 @@ async def merge(message: messages.EventBranchMerge, service: InfrahubServices) -
 async def rebased(message: messages.EventBranchRebased, service: InfrahubServices) -> None:
     log.info("Branch rebased", branch=message.branch)
 
+    await invalidate_diff_cache(service=service, branch_name=message.branch)
+
     events: List[InfrahubMessage] = [
         messages.RefreshRegistryRebasedBranch(branch=message.branch),
+        messages.RefreshGraphQLQuerySubscriptions(branch=message.branch),
     ]
     if message.ipam_node_details:
         events.append(
@@ -1,6 +1,7 @@
 from typing import List
 
-from infrahub.core.constants import InfrahubKind
+from infrahub.core.constants import InfrahubKind, MutationAction
+from infrahub.core.registry import registry
 from infrahub.log import get_logger
 from infrahub.message_bus import InfrahubMessage, messages
 from infrahub.services import InfrahubServices
@@ -26,9 +27,19 @@ async def mutated(
         InfrahubKind.CUSTOMWEBHOOK: [messages.RefreshWebhookConfiguration()],
     }
     events.extend(kind_map.get(message.kind, []))
+    if message.action in (MutationAction.UPDATED.value, MutationAction.REMOVED.value) and _is_ip_address(
+        kind=message.kind, branch=message.branch
+    ):
+        events.append(messages.RefreshRegistryIPAddressPools(branch=message.branch))
+    events.append(messages.RefreshGraphQLQuerySubscriptions(branch=message.branch, kinds=[message.kind]))
     events.append(
         messages.TriggerWebhookActions(event_type=f"{message.kind}.{message.action}", event_data=message.data)
     )
     for event in events:
         event.assign_meta(parent=message)
         await service.send(message=event)
+
+
+def _is_ip_address(kind: str, branch: str) -> bool:
+    schema = registry.schema.get(name=kind, branch=branch, duplicate=False)
+    return InfrahubKind.IPADDRESS in getattr(schema, "inherit_from", [])
@@ -1,3 +1,3 @@
-from . import registry, webhook
+from . import graphql_query, registry, webhook
 
-__all__ = ["registry", "webhook"]
+__all__ = ["graphql_query", "registry", "webhook"]
@@ -0,0 +1,10 @@
+from infrahub.graphql.subscription.graphql_query import graphql_query_subscriptions
+from infrahub.message_bus import messages
+from infrahub.services import InfrahubServices
+
+
+async def subscriptions(
+    message: messages.RefreshGraphQLQuerySubscriptions,
+    service: InfrahubServices,  # pylint: disable=unused-argument
+) -> None:
+    graphql_query_subscriptions.notify(branch=message.branch, kinds=message.kinds)
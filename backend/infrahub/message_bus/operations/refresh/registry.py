@@ -1,6 +1,7 @@
 from infrahub import lock
 from infrahub.core.registry import registry
 from infrahub.message_bus import messages
+from infrahub.pools.address import address_free_ranges_index
 from infrahub.services import InfrahubServices
 from infrahub.tasks.registry import refresh_branches
 from infrahub.worker import WORKER_IDENTITY
@@ -17,6 +18,17 @@ async def branches(message: messages.RefreshRegistryBranches, service: InfrahubS
     await service.component.refresh_schema_hash()
 
 
+async def ip_address_pools(message: messages.RefreshRegistryIPAddressPools, service: InfrahubServices) -> None:
+    if message.meta and message.meta.initiator_id == WORKER_IDENTITY:
+        service.log.info(
+            "Ignoring refresh registry IP address pools request originating from self", worker=WORKER_IDENTITY
+        )
+        return
+
+    service.log.info("Dropping the free ranges of the IP address pools", branch=message.branch)
+    address_free_ranges_index.invalidate()
+
+
 async def rebased_branch(message: messages.RefreshRegistryRebasedBranch, service: InfrahubServices) -> None:
     if message.meta and message.meta.initiator_id == WORKER_IDENTITY:
         service.log.info(
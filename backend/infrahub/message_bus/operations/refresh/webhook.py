@@ -1,8 +1,12 @@
+from uuid import uuid4
+
 import ujson
 
 from infrahub.core.constants import InfrahubKind
 from infrahub.message_bus import messages
 from infrahub.services import InfrahubServices
+from infrahub.webhook import webhook_dispatcher
+from infrahub.webhook.dispatcher import WEBHOOK_ACTIVE_PREFIX, WEBHOOK_VERSION_KEY
 
 
 async def configuration(
@@ -14,8 +18,9 @@ async def configuration(
     custom_webhooks = await service.client.all(kind=InfrahubKind.CUSTOMWEBHOOK)
 
     expected_webhooks = []
+    active_webhooks = {}
     for webhook in standard_webhooks:
-        webhook_key = f"webhook:active:{webhook.id}"
+        webhook_key = f"{WEBHOOK_ACTIVE_PREFIX}:{webhook.id}"
         expected_webhooks.append(webhook_key)
         payload = {
             "webhook_type": "standard",
@@ -26,9 +31,10 @@ async def configuration(
             },
         }
         await service.cache.set(key=webhook_key, value=ujson.dumps(payload))
+        active_webhooks[webhook.id] = payload
 
     for webhook in custom_webhooks:
-        webhook_key = f"webhook:active:{webhook.id}"
+        webhook_key = f"{WEBHOOK_ACTIVE_PREFIX}:{webhook.id}"
         expected_webhooks.append(webhook_key)
         payload = {
             "webhook_type": "custom",
@@ -51,10 +57,17 @@ async def configuration(
             payload["webhook_configuration"]["transform_file"] = transform.file_path.value
             payload["webhook_configuration"]["repository_id"] = transform.repository.id
             payload["webhook_configuration"]["repository_name"] = transform.repository.peer.name.value
+            payload["webhook_configuration"]["repository_kind"] = transform.repository.peer.get_kind()
 
         await service.cache.set(key=webhook_key, value=ujson.dumps(payload))
+        active_webhooks[webhook.id] = payload
 
-    cached_webhooks = await service.cache.list_keys(filter_pattern="webhook:active:*")
+    cached_webhooks = await service.cache.list_keys(filter_pattern=f"{WEBHOOK_ACTIVE_PREFIX}:*")
     for cached_webhook in cached_webhooks:
         if cached_webhook not in expected_webhooks:
             await service.cache.delete(key=cached_webhook)
+
+    # A new version makes the other git agents reload their active webhooks from the cache
+    version = str(uuid4())
+    await service.cache.set(key=WEBHOOK_VERSION_KEY, value=version)
+    webhook_dispatcher.set_webhooks(webhooks=active_webhooks, version=version)
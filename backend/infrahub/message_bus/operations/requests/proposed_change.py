@@ -90,7 +90,7 @@ async def data_integrity(message: messages.RequestProposedChangeDataIntegrity, s
         log.info(f"Got a request to process data integrity defined in proposed_change: {message.proposed_change}")
 
         source_branch = await registry.get_branch(db=service.database, branch=message.source_branch)
-        diff = await BranchDiffer.init(db=service.database, branch=source_branch, branch_only=False)
+        diff = await BranchDiffer.init(db=service.database, branch=source_branch, branch_only=False, service=service)
         conflicts = await diff.get_conflicts_graph()
 
         async with service.database.start_transaction() as db:
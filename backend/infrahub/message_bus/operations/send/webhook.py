@@ -1,11 +1,9 @@
 from typing import Dict, Type
 
-import ujson
-
 from infrahub.exceptions import NodeNotFoundError
 from infrahub.message_bus import messages
 from infrahub.services import InfrahubServices
-from infrahub.webhook import CustomWebhook, StandardWebhook, TransformWebhook, Webhook
+from infrahub.webhook import CustomWebhook, StandardWebhook, TransformWebhook, Webhook, webhook_dispatcher
 
 
 async def event(message: messages.SendWebhookEvent, service: InfrahubServices) -> None:
@@ -13,14 +11,13 @@ async def event(message: messages.SendWebhookEvent, service: InfrahubServices) -
         related_node=message.webhook_id,
         title="Webhook",
     ) as task_report:
-        webhook_definition = await service.cache.get(key=f"webhook:active:{message.webhook_id}")
-        if not webhook_definition:
+        webhook_data = await webhook_dispatcher.get_webhook(service=service, webhook_id=message.webhook_id)
+        if not webhook_data:
             service.log.warning("Webhook not found", webhook_id=message.webhook_id)
             raise NodeNotFoundError(
                 node_type="Webhook", identifier=message.webhook_id, message="The requested Webhook was not found"
             )
 
-        webhook_data = ujson.loads(webhook_definition)
         payload = {"event_type": message.event_type, "data": message.event_data, "service": service}
         webhook_map: Dict[str, Type[Webhook]] = {
             "standard": StandardWebhook,
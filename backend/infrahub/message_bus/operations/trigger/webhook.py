@@ -1,14 +1,31 @@
-from typing import List
+from typing import Any, Dict, List
 
 from infrahub.message_bus import InfrahubMessage, messages
 from infrahub.services import InfrahubServices
+from infrahub.webhook import webhook_dispatcher
+from infrahub.webhook.dispatcher import WEBHOOK_BATCH_EVENT_TYPE
 
 
 async def actions(message: messages.TriggerWebhookActions, service: InfrahubServices) -> None:
-    webhooks = await service.cache.list_keys(filter_pattern="webhook:active:*")
+    webhooks = await webhook_dispatcher.get_webhooks(service=service)
+
+    async def send_batch(webhook_id: str, batch: List[Dict[str, Any]]) -> None:
+        event = messages.SendWebhookEvent(
+            webhook_id=webhook_id, event_type=WEBHOOK_BATCH_EVENT_TYPE, event_data={"events": batch}
+        )
+        event.assign_meta(parent=message)
+        await service.send(message=event)
+
     events: List[InfrahubMessage] = []
-    for webhook in webhooks:
-        webhook_id = webhook.split(":")[-1]
+    for webhook_id, webhook in webhooks.items():
+        if webhook_dispatcher.is_batched(webhook=webhook):
+            await webhook_dispatcher.add_event(
+                webhook_id=webhook_id,
+                event={"event_type": message.event_type, "data": message.event_data},
+                flush=send_batch,
+            )
+            continue
+
         events.append(
             messages.SendWebhookEvent(
                 webhook_id=webhook_id, event_type=message.event_type, event_data=message.event_data
@@ -1,16 +1,143 @@
-from netaddr import IPNetwork, IPSet
+from __future__ import annotations
 
-from infrahub.core.ipam.constants import IPAddressType, IPNetworkType
+import ipaddress
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
+if TYPE_CHECKING:
+    from infrahub.core.ipam.constants import IPAddressType, IPNetworkType
 
-def get_available(network: IPNetworkType, addresses: list[IPAddressType], is_pool: bool) -> IPSet:
-    pool = IPSet(IPNetwork(str(network)))
-    reserved = [IPNetwork(f"{str(address.ip)}/{address.max_prefixlen}") for address in addresses]
-    if not is_pool:
-        # If the specified network is not a pool we remove the network address and
-        # optionally the broadcast address in case of IPv4
-        reserved.append(IPNetwork(f"{str(network.network_address)}/{network.max_prefixlen}"))
-        if network.version == 4:
-            reserved.append(IPNetwork(f"{str(network.broadcast_address)}/{network.max_prefixlen}"))
+IPAddressValue = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
 
-    return pool - IPSet(reserved)
+
+class AddressFreeRanges:
+    """Free addresses of a network, stored as sorted ranges of integers.
+
+    The ranges are built once from the addresses already in use and then updated in place when an address is reserved.
+    The first free address is returned in constant time and reserving an address looks up its range with a binary search.
+    The ranges before `_head` have been fully reserved, they are dropped once they make up half of the lists.
+    """
+
+    def __init__(self, network: IPNetworkType, addresses: Iterable[IPAddressType], is_pool: bool) -> None:
+        self.network = network
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._head = 0
+        self._size = 0
+
+        first = int(network.network_address)
+        last = int(network.broadcast_address)
+        if not is_pool:
+            # If the specified network is not a pool we remove the network address and
+            # optionally the broadcast address in case of IPv4
+            first += 1
+            if network.version == 4:
+                last -= 1
+
+        used = sorted({int(address.ip) for address in addresses if address.ip in network})
+        start = first
+        for value in used:
+            if value < start:
+                continue
+            if value > last:
+                break
+            if value > start:
+                self._add_range(start=start, end=value - 1)
+            start = value + 1
+        if start <= last:
+            self._add_range(start=start, end=last)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def _add_range(self, start: int, end: int) -> None:
+        self._starts.append(start)
+        self._ends.append(end)
+        self._size += end - start + 1
+
+    def _to_address(self, value: int) -> IPAddressValue:
+        if self.network.version == 4:
+            return ipaddress.IPv4Address(value)
+        return ipaddress.IPv6Address(value)
+
+    def first(self) -> Optional[IPAddressValue]:
+        """Return the first free address without reserving it, None is returned if there is no address available."""
+        if not self._size:
+            return None
+        return self._to_address(self._starts[self._head])
+
+    def reserve(self, address: IPAddressValue) -> bool:
+        """Mark an address as used, return False if it was not free."""
+        value = int(address)
+        idx = bisect_right(self._starts, value, lo=self._head) - 1
+        if idx < self._head or value > self._ends[idx]:
+            return False
+
+        start, end = self._starts[idx], self._ends[idx]
+        if start == end:
+            if idx == self._head:
+                self._head += 1
+            else:
+                del self._starts[idx]
+                del self._ends[idx]
+        elif value == start:
+            self._starts[idx] = value + 1
+        elif value == end:
+            self._ends[idx] = value - 1
+        else:
+            self._ends[idx] = value - 1
+            self._starts.insert(idx + 1, value + 1)
+            self._ends.insert(idx + 1, end)
+        self._size -= 1
+
+        if self._head and self._head * 2 >= len(self._starts):
+            del self._starts[: self._head]
+            del self._ends[: self._head]
+            self._head = 0
+        return True
+
+
+class AddressFreeRangesIndex:
+    """Free ranges of the resources of the IP address pools, kept between the allocations of a worker.
+
+    The ranges are indexed by namespace and network, the addresses of all the branches are considered as used.
+    When an address is created, it's reserved in the ranges of the networks that contain it, the ranges of these
+    networks are dropped when an address is updated or deleted and rebuilt from the database on the next allocation.
+    The addresses created by other workers are only known after a lookup in the database, a free address
+    must be checked before being allocated. The addresses updated or deleted by other workers are announced
+    with a RefreshRegistryIPAddressPools message, until then they are only missing from the free ranges.
+    """
+
+    def __init__(self) -> None:
+        self._ranges: dict[tuple[str, IPNetworkType, bool], AddressFreeRanges] = {}
+
+    def get(self, namespace_id: str, network: IPNetworkType, is_pool: bool) -> Optional[AddressFreeRanges]:
+        return self._ranges.get((namespace_id, network, is_pool))
+
+    def set(self, namespace_id: str, free_ranges: AddressFreeRanges, is_pool: bool) -> None:
+        self._ranges[(namespace_id, free_ranges.network, is_pool)] = free_ranges
+
+    def reserve(self, namespace_id: str, address: IPAddressValue) -> None:
+        for (ns_id, network, _), free_ranges in self._ranges.items():
+            if ns_id == namespace_id and network.version == address.version and address in network:
+                free_ranges.reserve(address=address)
+
+    def invalidate(self, address: Optional[IPAddressValue] = None, namespace_id: Optional[str] = None) -> None:
+        """Drop the ranges of the networks containing an address, or all the ranges if no address is provided."""
+        if address is None:
+            self._ranges = {}
+            return
+
+        self._ranges = {
+            (ns_id, network, is_pool): free_ranges
+            for (ns_id, network, is_pool), free_ranges in self._ranges.items()
+            if (namespace_id is not None and ns_id != namespace_id)
+            or network.version != address.version
+            or address not in network
+        }
+
+
+address_free_ranges_index = AddressFreeRangesIndex()
@@ -21,6 +21,7 @@ class NATSCache(InfrahubCache):
 
         # FIXME: remove once NATS supports TTL for keys (2.11)
         self.kv_buckets = {
+            self._tokenize_key_name("diff:"): KVTTL.TWO_HOURS,
             self._tokenize_key_name("validator_execution_id:"): KVTTL.TWO_HOURS,
             self._tokenize_key_name("workers:primary:"): KVTTL.FIFTEEN,
             self._tokenize_key_name("workers:schema_hash:branch:"): KVTTL.TWO_HOURS,
@@ -113,7 +114,7 @@ class NATSCache(InfrahubCache):
             keys = await self._keys(self.kv[KVTTL.FIFTEEN.value], filter_pattern) + await self._keys(
                 self.kv[KVTTL.TWO_HOURS.value], filter_pattern
             )
-        elif filter_pattern.startswith("validator_execution_id."):
+        elif filter_pattern.startswith(("diff.", "validator_execution_id.")):
             keys = await self._keys(self.kv[KVTTL.TWO_HOURS.value], filter_pattern)
         else:
             keys = await self._keys(self.kv[0], filter_pattern)
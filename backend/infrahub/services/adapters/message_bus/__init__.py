@@ -24,7 +24,7 @@ class InfrahubMessageBus:
         "transform.*.*",
         "trigger.*.*",
     ]
-    event_bindings: List[str] = ["refresh.registry.*"]
+    event_bindings: List[str] = ["refresh.graphql_query.*", "refresh.registry.*"]
 
     async def initialize(self, service: InfrahubServices) -> None:
         """Initialize the Message bus"""
@@ -1,10 +1,12 @@
 import hashlib
 import os
 from enum import Enum, EnumMeta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Sequence, TypeVar
 
 KWARGS_TO_DROP = ["session"]
 
+T = TypeVar("T")
+
 
 def get_fixtures_dir() -> str:
     """Get the directory which stores fixtures that are common to multiple unit/integration tests."""
@@ -76,3 +78,9 @@ def get_nested_dict(nested_dict: Dict[str, Any], keys: List[str]) -> Dict[str, A
         else:
             return {}
     return current_level if isinstance(current_level, dict) else {}
+
+
+def chunks(items: Sequence[T], size: int) -> Generator[Sequence[T], None, None]:
+    """Split a sequence into consecutive chunks of at most `size` items."""
+    for idx in range(0, len(items), size):
+        yield items[idx : idx + size]
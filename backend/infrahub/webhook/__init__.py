@@ -0,0 +1,11 @@
+from .dispatcher import WebhookDispatcher, webhook_dispatcher
+from .models import CustomWebhook, StandardWebhook, TransformWebhook, Webhook
+
+__all__ = [
+    "CustomWebhook",
+    "StandardWebhook",
+    "TransformWebhook",
+    "Webhook",
+    "WebhookDispatcher",
+    "webhook_dispatcher",
+]
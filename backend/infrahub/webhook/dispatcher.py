@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+import ujson
+
+from infrahub import config
+from infrahub.log import get_logger
+
+from .metrics import WEBHOOK_DELIVERY_DURATION_METRICS, WEBHOOK_DELIVERY_RETRIES
+
+if TYPE_CHECKING:
+    from infrahub.services import InfrahubServices
+
+log = get_logger()
+
+WEBHOOK_ACTIVE_PREFIX = "webhook:active"
+WEBHOOK_VERSION_KEY = "webhook:version"
+WEBHOOK_BATCH_EVENT_TYPE = "batch"
+# The payload of a transform webhook is computed from a single event, their events are never batched
+WEBHOOK_UNBATCHED_TYPES = ("transform",)
+
+WebhookBatchFlush = Callable[[str, List[Dict[str, Any]]], Awaitable[None]]
+
+
+class WebhookDispatcher:
+    """Deliver the webhooks of a git agent.
+
+    The active webhooks are kept in memory and reloaded from the cache only when their version changes.
+    The HTTP clients are shared by all the deliveries to the same host to reuse the connections,
+    the number of deliveries in progress is bounded and the transient errors are retried with a backoff.
+    When batching is enabled, the events of each webhook are coalesced and delivered together once the batch
+    is full or once the oldest event has waited for the batch interval, the pending batches are flushed on close.
+    """
+
+    def __init__(self) -> None:
+        self._webhooks: Dict[str, Dict[str, Any]] = {}
+        self._version: Optional[str] = None
+        self._clients: Dict[Tuple[str, bool], httpx.AsyncClient] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._batches: Dict[str, List[Dict[str, Any]]] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+        self._flushes: Dict[str, WebhookBatchFlush] = {}
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(config.SETTINGS.webhook.max_concurrent_deliveries)
+        return self._semaphore
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    def set_webhooks(self, webhooks: Dict[str, Dict[str, Any]], version: str) -> None:
+        self._webhooks = webhooks
+        self._version = version
+
+    async def get_webhooks(self, service: InfrahubServices) -> Dict[str, Dict[str, Any]]:
+        """Return the active webhooks indexed by their id, the webhooks are reloaded from the cache only if they have been refreshed."""
+        version = await service.cache.get(key=WEBHOOK_VERSION_KEY)
+        if version is None or version != self._version:
+            keys = await service.cache.list_keys(filter_pattern=f"{WEBHOOK_ACTIVE_PREFIX}:*")
+            values = await service.cache.get_values(keys=keys) if keys else []
+            self._webhooks = {
+                key.split(":")[-1]: ujson.loads(value) for key, value in zip(keys, values) if value is not None
+            }
+            self._version = version
+
+        return self._webhooks
+
+    async def get_webhook(self, service: InfrahubServices, webhook_id: str) -> Optional[Dict[str, Any]]:
+        webhooks = await self.get_webhooks(service=service)
+        return webhooks.get(webhook_id)
+
+    def get_client(self, url: str, verify: bool) -> httpx.AsyncClient:
+        target = httpx.URL(url)
+        key = (f"{target.scheme}://{target.netloc.decode()}", verify)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(verify=verify, timeout=config.SETTINGS.webhook.timeout)
+            self._clients[key] = client
+        return client
+
+    @staticmethod
+    def _is_transient(response: httpx.Response) -> bool:
+        return response.status_code == 429 or response.status_code >= 500
+
+    async def post(
+        self, url: str, payload: Any, headers: Optional[Dict[str, Any]], verify: bool, webhook_type: str
+    ) -> httpx.Response:
+        """Deliver a payload, the requests failing with a transient error are retried with an exponential backoff.
+
+        An exception is raised if the delivery is still failing with a transient error after the last retry.
+        """
+        settings = config.SETTINGS.webhook
+        client = self.get_client(url=url, verify=verify)
+        result = "failure"
+        start_time = time.monotonic()
+        try:
+            for attempt in range(settings.max_retries + 1):
+                if attempt:
+                    WEBHOOK_DELIVERY_RETRIES.labels(webhook_type).inc()
+                    await asyncio.sleep(settings.retry_backoff * 2 ** (attempt - 1))
+
+                try:
+                    async with self.semaphore:
+                        response = await client.post(url, json=payload, headers=headers)
+                except httpx.TransportError:
+                    if attempt == settings.max_retries:
+                        raise
+                    continue
+
+                if not self._is_transient(response) or attempt == settings.max_retries:
+                    break
+
+            if self._is_transient(response):
+                response.raise_for_status()
+            if response.is_success:
+                result = "success"
+            return response
+        finally:
+            WEBHOOK_DELIVERY_DURATION_METRICS.labels(webhook_type, result).observe(time.monotonic() - start_time)
+
+    @staticmethod
+    def is_batched(webhook: Dict[str, Any]) -> bool:
+        return config.SETTINGS.webhook.batch_size > 1 and webhook.get("webhook_type") not in WEBHOOK_UNBATCHED_TYPES
+
+    async def add_event(self, webhook_id: str, event: Dict[str, Any], flush: WebhookBatchFlush) -> None:
+        """Add an event to the batch of a webhook, the batch is flushed right away once it's full."""
+        batch = self._batches.setdefault(webhook_id, [])
+        batch.append(event)
+        self._flushes[webhook_id] = flush
+        if len(batch) >= config.SETTINGS.webhook.batch_size:
+            await self._flush(webhook_id=webhook_id, flush=flush)
+        elif webhook_id not in self._flush_tasks:
+            self._flush_tasks[webhook_id] = asyncio.create_task(self._flush_later(webhook_id=webhook_id, flush=flush))
+
+    async def _flush_later(self, webhook_id: str, flush: WebhookBatchFlush) -> None:
+        await asyncio.sleep(config.SETTINGS.webhook.batch_interval)
+        self._flush_tasks.pop(webhook_id, None)
+        try:
+            await self._flush(webhook_id=webhook_id, flush=flush)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            log.error("Unable to flush the batch of events of the webhook", webhook_id=webhook_id, exc_info=exc)
+
+    async def _flush(self, webhook_id: str, flush: WebhookBatchFlush) -> None:
+        task = self._flush_tasks.pop(webhook_id, None)
+        if task and task is not asyncio.current_task():
+            task.cancel()
+
+        events = self._batches.pop(webhook_id, [])
+        self._flushes.pop(webhook_id, None)
+        if events:
+            await flush(webhook_id, events)
+
+    async def close(self) -> None:
+        """Flush the pending batches and close the HTTP clients."""
+        for webhook_id, flush in list(self._flushes.items()):
+            try:
+                await self._flush(webhook_id=webhook_id, flush=flush)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                log.error("Unable to flush the batch of events of the webhook", webhook_id=webhook_id, exc_info=exc)
+        for task in self._flush_tasks.values():
+            task.cancel()
+        self._flush_tasks.clear()
+        self._batches.clear()
+        self._flushes.clear()
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+
+webhook_dispatcher = WebhookDispatcher()
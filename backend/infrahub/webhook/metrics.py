@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from prometheus_client import Counter, Histogram
+
+METRIC_PREFIX = "infrahub_webhook"
+
+WEBHOOK_DELIVERY_DURATION_METRICS = Histogram(
+    f"{METRIC_PREFIX}_delivery_duration_seconds",
+    "Time to deliver a webhook to its target, including the retries",
+    labelnames=["webhook_type", "result"],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+)
+
+WEBHOOK_DELIVERY_RETRIES = Counter(
+    f"{METRIC_PREFIX}_delivery_retries",
+    "Number of webhook deliveries that have been retried due to a transient error",
+    labelnames=["webhook_type"],
+)
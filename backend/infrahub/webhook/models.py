@@ -3,16 +3,17 @@ import hashlib
 import hmac
 from datetime import datetime, timezone
 from math import floor
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional, Tuple, Union
 from uuid import uuid4
 
-import httpx
 from pydantic import BaseModel, ConfigDict, Field
 
 from infrahub.core.constants import InfrahubKind
 from infrahub.git.repository import InfrahubReadOnlyRepository, InfrahubRepository
 from infrahub.services import InfrahubServices
 
+from .dispatcher import webhook_dispatcher
+
 
 class Webhook(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -37,8 +38,13 @@ class Webhook(BaseModel):
     async def send(self) -> None:
         await self._prepare_payload()
         self._assign_headers()
-        async with httpx.AsyncClient(verify=self.validate_certificates) as client:
-            await client.post(self.url, json=self._payload, headers=self._headers)
+        await webhook_dispatcher.post(
+            url=self.url,
+            payload=self._payload,
+            headers=self._headers,
+            verify=self.validate_certificates,
+            webhook_type=self.webhook_type,
+        )
 
 
 class CustomWebhook(Webhook):
@@ -75,12 +81,32 @@ class TransformWebhook(Webhook):
     transform_class: str = Field(...)
     transform_file: str = Field(...)
 
+    _repositories: ClassVar[Dict[Tuple[str, str, str], Union[InfrahubReadOnlyRepository, InfrahubRepository]]] = {}
+    _repositories_version: ClassVar[Optional[str]] = None
+
+    async def _get_repository(self) -> Union[InfrahubReadOnlyRepository, InfrahubRepository]:
+        """Return the repository of the transform, the repository objects are reused between the events.
+
+        The repositories are dropped each time the webhook configuration is refreshed, only the repositories
+        of the active transform webhooks are kept.
+        """
+        if TransformWebhook._repositories_version != webhook_dispatcher.version:
+            TransformWebhook._repositories = {}
+            TransformWebhook._repositories_version = webhook_dispatcher.version
+
+        key = (self.repository_id, self.repository_name, self.repository_kind)
+        if key not in self._repositories:
+            if self.repository_kind == InfrahubKind.READONLYREPOSITORY:
+                repo = await InfrahubReadOnlyRepository.init(id=self.repository_id, name=self.repository_name)
+            else:
+                repo = await InfrahubRepository.init(id=self.repository_id, name=self.repository_name)
+            self._repositories[key] = repo
+        return self._repositories[key]
+
     async def _prepare_payload(self) -> None:
-        if self.repository_kind == InfrahubKind.READONLYREPOSITORY:
-            repo = await InfrahubReadOnlyRepository.init(id=self.repository_id, name=self.repository_name)
-        else:
-            repo = await InfrahubRepository.init(id=self.repository_id, name=self.repository_name)
+        repo = await self._get_repository()
 
+        # The transform loaded for the current commit is reused until the default branch moves to a new commit
         default_branch = repo.default_branch
         commit = repo.get_commit_value(branch_name=default_branch)
 
@@ -81,6 +81,33 @@ async def test_schema_read_endpoint_branch1(
     assert len(schema["nodes"]) == len(expected_nodes)
 
 
+async def test_schema_read_endpoint_etag(
+    db: InfrahubDatabase,
+    client: TestClient,
+    client_headers,
+    default_branch: Branch,
+    car_person_schema_generics: SchemaRoot,
+    car_person_data_generic,
+):
+    schema_hash = registry.schema.get_schema_branch(name=default_branch.name).get_hash()
+
+    with client:
+        response = client.get("/api/schema", headers=client_headers)
+        not_modified = client.get("/api/schema", headers={**client_headers, "If-None-Match": f'"{schema_hash}"'})
+        modified = client.get("/api/schema", headers={**client_headers, "If-None-Match": '"previous"'})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == f'"{schema_hash}"'
+    assert response.json()["main"] == schema_hash
+
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == f'"{schema_hash}"'
+    assert not not_modified.content
+
+    assert modified.status_code == 200
+    assert modified.json() == response.json()
+
+
 async def test_schema_read_endpoint_wrong_branch(
     db: InfrahubDatabase, client: TestClient, client_headers, default_branch: Branch, car_person_data_generic
 ):
@@ -62,3 +62,32 @@ async def test_get_next_full(
 
     with pytest.raises(PoolExhaustedError, match="There are no more addresses available in this pool"):
         await pool.get_next(db=db, prefixlen=30)
+
+
+async def test_get_next_address_created_by_another_worker(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    default_ipnamespace: Node,
+    register_ipam_schema: SchemaBranch,
+    ip_dataset_prefix_v4,
+):
+    ns1 = ip_dataset_prefix_v4["ns1"]
+    net145 = ip_dataset_prefix_v4["net145"]
+
+    adress_pool_schema = registry.schema.get_node_schema(name=InfrahubKind.IPADDRESSPOOL, branch=default_branch)
+    address_schema = registry.schema.get_node_schema(name="IpamIPAddress", branch=default_branch)
+
+    pool = await CoreIPAddressPool.init(schema=adress_pool_schema, db=db)
+    await pool.new(db=db, name="pool1", resources=[net145], ip_namespace=ns1, default_address_type="IpamIPAddress")
+    await pool.save(db=db)
+
+    next_address = await pool.get_next(db=db, prefixlen=30)
+    assert str(next_address) == "10.10.3.2/30"
+
+    # Created without going through the reconciler, the free ranges of the pool don't know about it
+    address = await Node.init(db=db, schema=address_schema)
+    await address.new(db=db, address="10.10.3.2/27", ip_prefix=net145, ip_namespace=ns1)
+    await address.save(db=db)
+
+    next_address = await pool.get_next(db=db, prefixlen=30)
+    assert str(next_address) == "10.10.3.3/30"
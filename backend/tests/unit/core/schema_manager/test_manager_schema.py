@@ -25,6 +25,7 @@ from infrahub.core.schema import (
     internal_schema,
 )
 from infrahub.core.schema_manager import SchemaBranch, SchemaManager
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 
 from .conftest import _get_schema_by_kind
@@ -2321,6 +2322,43 @@ async def test_load_schema_from_db(
     assert schema11.get(name="TestGenericInterface").get_hash() == schema2.get(name="TestGenericInterface").get_hash()
 
 
+async def test_load_schema_at(
+    db: InfrahubDatabase, reset_registry, default_branch: Branch, register_internal_models_schema
+):
+    criticality = {
+        "namespace": "Test",
+        "name": "Criticality",
+        "default_filter": "name__value",
+        "label": "Criticality",
+        "attributes": [{"name": "name", "kind": "Text", "label": "Name", "unique": True}],
+    }
+    color = {
+        "namespace": "Test",
+        "name": "Color",
+        "default_filter": "name__value",
+        "label": "Color",
+        "attributes": [{"name": "name", "kind": "Text", "label": "Name", "unique": True}],
+    }
+
+    schema1 = registry.schema.register_schema(schema=SchemaRoot(nodes=[criticality]), branch=default_branch.name)
+    await registry.schema.load_schema_to_db(schema=schema1, db=db, branch=default_branch.name)
+    time1 = Timestamp()
+    time2 = Timestamp()
+
+    schema2 = registry.schema.register_schema(schema=SchemaRoot(nodes=[color]), branch=default_branch.name)
+    await registry.schema.load_schema_to_db(schema=schema2, db=db, branch=default_branch.name, limit=["TestColor"])
+    time3 = Timestamp()
+
+    schema_time1 = await registry.schema.load_schema_at(db=db, branch=default_branch, at=time1)
+    assert "TestCriticality" in schema_time1.nodes
+    assert "TestColor" not in schema_time1.nodes
+    assert await registry.schema.load_schema_at(db=db, branch=default_branch, at=time2) is schema_time1
+
+    schema_time3 = await registry.schema.load_schema_at(db=db, branch=default_branch, at=time3)
+    assert schema_time3 is not schema_time1
+    assert "TestColor" in schema_time3.nodes
+
+
 async def test_load_schema(
     db: InfrahubDatabase, reset_registry, default_branch: Branch, register_internal_models_schema
 ):
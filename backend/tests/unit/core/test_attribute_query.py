@@ -1,7 +1,12 @@
+import pytest
+
 from infrahub.core.branch import Branch
+from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
-from infrahub.core.query.attribute import AttributeGetQuery
+from infrahub.core.query.attribute import AttributeGetQuery, AttributeUpdateQuery
+from infrahub.core.query.node import NodeListGetAttributeQuery
 from infrahub.database import InfrahubDatabase
+from infrahub.exceptions import QueryError
 
 
 async def test_AttributeGetQuery(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
@@ -13,3 +18,58 @@ async def test_AttributeGetQuery(db: InfrahubDatabase, default_branch: Branch, c
     await query.execute(db=db)
 
     assert query.num_of_results == 3
+
+
+async def test_AttributeUpdateQuery(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    obj = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await obj.new(db=db, name="Jane", height=170)
+    await obj.save(db=db)
+
+    query = await NodeListGetAttributeQuery.init(
+        db=db, ids=[obj.id], fields={"name": True, "height": True}, branch=default_branch
+    )
+    await query.execute(db=db)
+
+    obj.name.value = "Janet"
+    obj.height.is_protected = True
+    update_data = []
+    for attr in (obj.name, obj.height):
+        current_attr_data, current_attr_result = query.get_result_by_id_and_name(obj.id, attr.name)
+        update_data.append(
+            attr.get_update_data(current_attr_data=current_attr_data, current_attr_result=current_attr_result)
+        )
+
+    assert update_data[0].content == {"value": "Janet", "is_default": False}
+    assert update_data[0].flag_properties == {}
+    assert update_data[1].content is None
+    assert update_data[1].flag_properties == {"is_protected": True}
+
+    query = await AttributeUpdateQuery.init(db=db, attributes=update_data)
+    await query.execute(db=db)
+
+    obj2 = await NodeManager.get_one(db=db, id=obj.id)
+    assert obj2.name.value == "Janet"
+    assert obj2.height.value == 170
+    assert obj2.height.is_protected is True
+
+
+async def test_AttributeUpdateQuery_unknown_source(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    obj = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await obj.new(db=db, name="Jane", height=170)
+    await obj.save(db=db)
+
+    query = await NodeListGetAttributeQuery.init(db=db, ids=[obj.id], fields={"name": True}, branch=default_branch)
+    await query.execute(db=db)
+
+    obj.name.value = "Janet"
+    current_attr_data, current_attr_result = query.get_result_by_id_and_name(obj.id, "name")
+    update_data = obj.name.get_update_data(current_attr_data=current_attr_data, current_attr_result=current_attr_result)
+    update_data.node_properties["source"] = "c2ad0d5a-unknown-source"
+
+    query = await AttributeUpdateQuery.init(db=db, attributes=[update_data])
+    with pytest.raises(QueryError):
+        await query.execute(db=db)
+
+    # Nothing has been written, the previous value is still active
+    obj2 = await NodeManager.get_one(db=db, id=obj.id)
+    assert obj2.name.value == "Jane"
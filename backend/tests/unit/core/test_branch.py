@@ -147,6 +147,38 @@ async def test_get_query_filter_relationships_branch1(db: InfrahubDatabase, base
     assert sorted(params.keys()) == ["branch0", "branch1", "time0", "time1"]
 
 
+def test_get_query_filter_path_cached():
+    branched_from = Timestamp("10m")
+    branch1 = Branch(name="branch1", status="OPEN", branched_from=branched_from.to_string(), is_default=False)
+
+    t1 = Timestamp("5m")
+    filter_str, params = branch1.get_query_filter_path(at=t1)
+    assert params == {
+        "branch0": [GLOBAL_BRANCH_NAME, "main"],
+        "time0": branched_from.to_string(),
+        "branch1": [GLOBAL_BRANCH_NAME, "branch1"],
+        "time1": t1.to_string(),
+    }
+
+    t2 = Timestamp("1m")
+    filter_str2, params = branch1.get_query_filter_path(at=t2, is_isolated=False)
+    assert filter_str2 is filter_str
+    assert params["time0"] == t2.to_string()
+    assert params["time1"] == t2.to_string()
+
+    filters, params = branch1.get_query_filter_relationships(rel_labels=["r1"], at=t2)
+    filters.append("modified by the caller")
+    filters, params = branch1.get_query_filter_relationships(rel_labels=["r1"], at=t2)
+    assert len(filters) == 2
+    assert params["time0"] == branched_from.to_string()
+
+    # The cached branched_from must be invalidated when the branch is rebased
+    branch1.branched_from = t1.to_string()
+    filter_str3, params = branch1.get_query_filter_path(at=t2)
+    assert filter_str3 == filter_str
+    assert params["time0"] == t1.to_string()
+
+
 async def test_get_branches_and_times_to_query_main(db: InfrahubDatabase, base_dataset_02):
     now = Timestamp("1s")
 
@@ -17,7 +17,8 @@ from infrahub.core.schema import AttributeSchema
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.message_bus import messages
-from infrahub.services import services
+from infrahub.services import InfrahubServices, services
+from tests.adapters.cache import MemoryCache
 
 
 async def test_diff_has_conflict_graph(db: InfrahubDatabase, base_dataset_02):
@@ -1070,3 +1071,43 @@ async def test_base_diff_element():
     obj = CL1(**data)
 
     assert obj.to_graphql() == expected_response
+
+
+async def test_diff_cache_incremental(db: InfrahubDatabase, base_dataset_02):
+    branch1 = await Branch.get_by_name(name="branch1", db=db)
+    service = InfrahubServices(cache=MemoryCache(), database=db)
+
+    time1 = Timestamp()
+    diff = await BranchDiffer.init(branch=branch1, db=db, branch_only=False, diff_to=time1, service=service)
+    await diff.get_nodes()
+    await diff.get_relationships()
+    assert len(service.cache.storage) == 2
+
+    c1 = await NodeManager.get_one(id="c1", branch=branch1, db=db)
+    c1.name.value = "new name"
+    await c1.save(db=db)
+
+    p3 = await NodeManager.get_one(id="p3", branch=branch1, db=db)
+    await p3.delete(db=db)
+
+    time2 = Timestamp()
+    cached_diff = await BranchDiffer.init(branch=branch1, db=db, branch_only=False, diff_to=time2, service=service)
+    full_diff = await BranchDiffer.init(branch=branch1, db=db, branch_only=False, diff_to=time2)
+
+    cached_nodes = await cached_diff.get_nodes()
+    full_nodes = await full_diff.get_nodes()
+    assert "p3" in cached_nodes["branch1"]
+    assert cached_nodes["branch1"]["c1"].attributes["name"].properties["HAS_VALUE"].value.new == "new name"
+    assert {
+        name: {key: value.to_graphql() for key, value in nodes.items()} for name, nodes in cached_nodes.items()
+    } == {name: {key: value.to_graphql() for key, value in nodes.items()} for name, nodes in full_nodes.items()}
+
+    cached_rels = await cached_diff.get_relationships()
+    full_rels = await full_diff.get_relationships()
+    assert {
+        name: {rel_name: sorted(rels.keys()) for rel_name, rels in items.items() if rels}
+        for name, items in cached_rels.items()
+    } == {
+        name: {rel_name: sorted(rels.keys()) for rel_name, rels in items.items() if rels}
+        for name, items in full_rels.items()
+    }
@@ -1,8 +1,13 @@
+import pytest
+
+from infrahub import config
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.initialization import create_branch
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
+from infrahub.core.query.branch import GetAllBranchInternalRelationshipQuery, RebaseBranchUpdateRelationshipQuery
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 
 
@@ -43,6 +48,77 @@ async def test_rebase_graph_delete(db: InfrahubDatabase, base_dataset_02, regist
     assert len(persons) == 2
 
 
+async def test_rebase_graph_chunked(db: InfrahubDatabase, base_dataset_02, register_core_models_schema):
+    branch1 = await Branch.get_by_name(name="branch1", db=db)
+    at = Timestamp()
+
+    original_batch_size = config.SETTINGS.database.write_batch_size
+    config.SETTINGS.database.write_batch_size = 2
+    try:
+        await branch1.rebase(db=db, at=at)
+    finally:
+        config.SETTINGS.database.write_batch_size = original_batch_size
+
+    query = await GetAllBranchInternalRelationshipQuery.init(db=db, branch=branch1)
+    await query.execute(db=db)
+
+    assert len(query.results) > 2
+    for result in query.results:
+        assert result.get("r").get("from") == at.to_string()
+        assert result.get("r").get("conflict") is None
+
+    cars = sorted(await NodeManager.query(schema="TestCar", branch=branch1, db=db), key=lambda c: c.id)
+    assert len(cars) == 3
+    assert cars[0].nbr_seats.value == 4
+
+
+async def test_rebase_graph_resume_after_failure(
+    db: InfrahubDatabase, base_dataset_02, register_core_models_schema, monkeypatch
+):
+    branch1 = await Branch.get_by_name(name="branch1", db=db)
+    branched_from = branch1.branched_from
+    at = Timestamp()
+
+    original_execute = RebaseBranchUpdateRelationshipQuery.execute
+    nbr_calls = 0
+
+    async def failing_execute(self, *args, **kwargs):
+        nonlocal nbr_calls
+        nbr_calls += 1
+        if nbr_calls > 1:
+            raise RuntimeError("connection lost")
+        return await original_execute(self, *args, **kwargs)
+
+    monkeypatch.setattr(config.SETTINGS.database, "write_batch_size", 2)
+    monkeypatch.setattr(RebaseBranchUpdateRelationshipQuery, "execute", failing_execute)
+    with pytest.raises(RuntimeError):
+        await branch1.rebase(db=db, at=at)
+
+    # The first chunk has been committed but the branch is still marked as being rebased
+    branch1 = await Branch.get_by_name(name="branch1", db=db)
+    assert branch1.branched_from == branched_from
+    assert branch1.rebase_started_at == at.to_string()
+
+    # A rebase at an earlier time is done at the time of the failed rebase
+    monkeypatch.setattr(RebaseBranchUpdateRelationshipQuery, "execute", original_execute)
+    await branch1.rebase(db=db, at=Timestamp(branched_from))
+
+    branch1 = await Branch.get_by_name(name="branch1", db=db)
+    assert branch1.branched_from == at.to_string()
+    assert branch1.rebase_started_at is None
+
+    query = await GetAllBranchInternalRelationshipQuery.init(db=db, branch=branch1)
+    await query.execute(db=db)
+    for result in query.results:
+        assert result.get("r").get("from") == at.to_string()
+
+    cars = sorted(await NodeManager.query(schema="TestCar", branch=branch1, db=db), key=lambda c: c.id)
+    assert len(cars) == 3
+    assert cars[0].nbr_seats.value == 4
+    assert cars[0].nbr_seats.is_protected is True
+    assert cars[2].name.value == "volt"
+
+
 async def test_merge_relationship_many(
     db: InfrahubDatabase, default_branch: Branch, register_core_models_schema, register_organization_schema
 ):
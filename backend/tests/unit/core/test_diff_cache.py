@@ -0,0 +1,102 @@
+from infrahub import config
+from infrahub.core.constants import DiffAction
+from infrahub.core.diff.cache import (
+    DiffCacheEntry,
+    get_cached_diff,
+    get_diff_cache_key,
+    invalidate_diff_cache,
+    set_cached_diff,
+)
+from infrahub.core.diff.model import NodeAttributeDiffElement, NodeDiffElement, PropertyDiffElement, ValueElement
+from infrahub.core.timestamp import Timestamp
+from infrahub.services import InfrahubServices
+from tests.adapters.cache import MemoryCache
+
+
+def _get_node_diff() -> NodeDiffElement:
+    changed_at = Timestamp("2024-01-01T10:00:00Z")
+    return NodeDiffElement(
+        branch="branch1",
+        labels=["Node", "TestCar"],
+        kind="TestCar",
+        id="c1",
+        path="data/c1",
+        action=DiffAction.UPDATED,
+        db_id="4:db:1",
+        attributes={
+            "name": NodeAttributeDiffElement(
+                id="a1",
+                name="name",
+                path="data/c1/name",
+                action=DiffAction.UPDATED,
+                db_id="4:db:2",
+                rel_id="5:db:3",
+                properties={
+                    "HAS_VALUE": PropertyDiffElement(
+                        branch="branch1",
+                        type="HAS_VALUE",
+                        action=DiffAction.UPDATED,
+                        db_id="4:db:4",
+                        rel_id="5:db:5",
+                        origin_rel_id="5:db:6",
+                        value=ValueElement(previous="volt", new="accord"),
+                        changed_at=changed_at,
+                    )
+                },
+            )
+        },
+    )
+
+
+async def test_diff_cache_entry_roundtrip():
+    entry = DiffCacheEntry(diff_to=Timestamp().to_string(), nodes={"branch1": {"c1": _get_node_diff()}})
+
+    loaded = DiffCacheEntry.from_cache(value=entry.to_cache())
+
+    node = loaded.nodes["branch1"]["c1"]
+    assert node == entry.nodes["branch1"]["c1"]
+    assert node.db_id == "4:db:1"
+    assert node.attributes["name"].properties["HAS_VALUE"].origin_rel_id == "5:db:6"
+    assert node.attributes["name"].properties["HAS_VALUE"].changed_at == Timestamp("2024-01-01T10:00:00Z")
+    assert node.action == DiffAction.UPDATED
+
+
+async def test_invalidate_diff_cache():
+    service = InfrahubServices(cache=MemoryCache())
+    entry = DiffCacheEntry(diff_to=Timestamp().to_string(), nodes={"branch1": {"c1": _get_node_diff()}})
+
+    key_branch1 = get_diff_cache_key(branch_name="branch1", identifiers=["a"], element="nodes")
+    key_branch2 = get_diff_cache_key(branch_name="branch2", identifiers=["a"], element="nodes")
+    await set_cached_diff(service=service, key=key_branch1, entry=entry)
+    await set_cached_diff(service=service, key=key_branch2, entry=entry)
+
+    await invalidate_diff_cache(service=service, branch_name="branch1")
+
+    assert await get_cached_diff(service=service, key=key_branch1) is None
+    assert await get_cached_diff(service=service, key=key_branch2)
+
+
+async def test_diff_cache_without_backend():
+    service = InfrahubServices()
+    key = get_diff_cache_key(branch_name="branch1", identifiers=[], element="nodes")
+
+    await set_cached_diff(service=service, key=key, entry=DiffCacheEntry(diff_to=Timestamp().to_string()))
+    assert await get_cached_diff(service=service, key=key) is None
+    await invalidate_diff_cache(service=service, branch_name="branch1")
+
+
+async def test_diff_cache_too_large():
+    service = InfrahubServices(cache=MemoryCache())
+    entry = DiffCacheEntry(diff_to=Timestamp().to_string(), nodes={"branch1": {"c1": _get_node_diff()}})
+    key = get_diff_cache_key(branch_name="branch1", identifiers=[], element="nodes")
+
+    original_max_size = config.SETTINGS.cache.diff_max_size
+    config.SETTINGS.cache.diff_max_size = len(entry.to_cache()) - 1
+    try:
+        await set_cached_diff(service=service, key=key, entry=entry)
+    finally:
+        config.SETTINGS.cache.diff_max_size = original_max_size
+    assert await get_cached_diff(service=service, key=key) is None
+
+    await set_cached_diff(service=service, key=key, entry=entry)
+    assert await get_cached_diff(service=service, key=key)
@@ -234,6 +234,52 @@ async def test_get_one_by_hfid(
     assert node1.id == dog1.id
 
 
+async def test_get_many_by_default_filter(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    criticality_schema: SchemaBranch,
+    criticality_low: Node,
+    criticality_medium: Node,
+):
+    nodes = await NodeManager.get_many_by_default_filter(
+        db=db, ids=[criticality_low.name.value, criticality_medium.name.value, "unknown"], kind=criticality_schema.kind
+    )
+    assert sorted(nodes.keys()) == sorted([criticality_low.name.value, criticality_medium.name.value])
+    assert nodes[criticality_low.name.value].id == criticality_low.id
+
+
+async def test_get_many_by_hfid(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    animal_person_schema: SchemaBranch,
+):
+    person_schema = animal_person_schema.get(name="TestPerson")
+    dog_schema = animal_person_schema.get(name="TestDog")
+
+    person1 = await Node.init(db=db, schema=person_schema, branch=default_branch)
+    await person1.new(db=db, name="Jack")
+    await person1.save(db=db)
+
+    person2 = await Node.init(db=db, schema=person_schema, branch=default_branch)
+    await person2.new(db=db, name="Jim")
+    await person2.save(db=db)
+
+    dog1 = await Node.init(db=db, schema=dog_schema, branch=default_branch)
+    await dog1.new(db=db, name="Rocky", breed="Labrador", owner=person1)
+    await dog1.save(db=db)
+
+    dog2 = await Node.init(db=db, schema=dog_schema, branch=default_branch)
+    await dog2.new(db=db, name="Bella", breed="French Bulldog", owner=person2)
+    await dog2.save(db=db)
+
+    nodes = await NodeManager.get_many_by_hfid(
+        db=db, hfids=[["Jack", "Rocky"], ["Jim", "Bella"], ["Jim", "Rocky"]], kind=dog_schema.kind
+    )
+    assert len(nodes) == 2
+    assert nodes[("Jack", "Rocky")].id == dog1.id
+    assert nodes[("Jim", "Bella")].id == dog2.id
+
+
 async def test_get_many(db: InfrahubDatabase, default_branch: Branch, criticality_low, criticality_medium):
     nodes = await NodeManager.get_many(db=db, ids=[criticality_low.id, criticality_medium.id])
     assert len(nodes) == 2
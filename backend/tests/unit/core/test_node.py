@@ -716,6 +716,48 @@ async def test_node_update_local_attrs_with_source(
     assert obj3.name.source_id == second_account.id
 
 
+async def test_node_update_modified_attributes_only(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    person = await Node.init(db=db, schema="TestPerson")
+    await person.new(db=db, name="John", height=180)
+    await person.save(db=db)
+    car = await Node.init(db=db, schema="TestCar")
+    await car.new(db=db, name="volt", nbr_seats=4, is_electric=True, owner=person)
+    await car.save(db=db)
+
+    assert car.name.has_been_modified is False
+    assert car.owner.has_been_modified is False
+
+    car2 = await NodeManager.get_one(id=car.id, db=db)
+    assert car2.name.has_been_modified is False
+    assert car2.nbr_seats.has_been_modified is False
+    assert car2.owner.has_been_modified is False
+
+    car2.name.value = "bolt"
+    car2.nbr_seats.value = 5
+    car2.is_electric.is_protected = True
+    assert car2.name.has_been_modified is True
+    assert car2.is_electric.has_been_modified is True
+    assert car2.color.has_been_modified is False
+
+    nbr_rels = await count_relationships(db=db)
+    await car2.save(db=db)
+
+    # 3 new relationships and 3 closed ones for the new values and the new flag
+    assert await count_relationships(db=db) == nbr_rels + 3
+    assert car2.name.has_been_modified is False
+    assert car2.is_electric.has_been_modified is False
+
+    car3 = await NodeManager.get_one(id=car.id, db=db)
+    assert car3.name.value == "bolt"
+    assert car3.nbr_seats.value == 5
+    assert car3.is_electric.is_protected is True
+
+    await car3.owner.get_peer(db=db)
+    assert car3.owner.has_been_modified is False
+    await car3.owner.update(db=db, data=None)
+    assert car3.owner.has_been_modified is True
+
+
 async def test_update_related_node(db: InfrahubDatabase, default_branch, data_schema):
     """
     This test has been written to troubleshoot a specific issue
@@ -7,6 +7,7 @@ from infrahub.core.query import (
     QueryRel,
     QueryRelDirection,
     QueryResult,
+    QueryResultLabels,
     QueryType,
     cleanup_return_labels,
     sort_results_by_time,
@@ -137,6 +138,37 @@ async def test_query_async(db: InfrahubDatabase, simple_dataset_01):
     assert query.results[0].get("at") is not None
 
 
+async def test_query_execute_stream(db: InfrahubDatabase, simple_dataset_01):
+    query = await Query01.init(db=db)
+
+    results = [result async for result in query.execute_stream(db=db)]
+
+    assert query.has_been_executed is True
+    assert query.results == []
+    assert len(results) == 3
+    assert [result.get("av").get("value") for result in results] == ["volt", "accord", 5]
+
+
+async def test_query_execute_stream_write(db: InfrahubDatabase):
+    query = await Query02.init(db=db)
+
+    with pytest.raises(TypeError):
+        [result async for result in query.execute_stream(db=db)]
+
+
+async def test_query_execute_stream_group_by(db: InfrahubDatabase, simple_dataset_01):
+    query = await Query01.init(db=db)
+    results = await query.execute_stream_group_by(db, ("at", "name"))
+
+    reference_query = await Query01.init(db=db)
+    await reference_query.execute(db=db)
+    expected_results = list(reference_query.get_results_group_by(("at", "name")))
+
+    assert [result.get("av").get("value") for result in results] == [
+        result.get("av").get("value") for result in expected_results
+    ]
+
+
 async def test_query_count(db: InfrahubDatabase, simple_dataset_01):
     query = await Query01.init(db=db)
     assert await query.count(db=db) == 3
@@ -186,6 +218,48 @@ async def test_query_result_getters(neo4j_factory):
         qr.get("r3")
 
 
+async def test_query_result_scores(neo4j_factory):
+    n1 = neo4j_factory.hydrate_node(333, {"Car"}, {"uuid": "n1"}, "333")
+    n2 = neo4j_factory.hydrate_node(444, {"AttributeValue"}, {"uuid": "n1a1", "name": "name"}, "444")
+    r1 = neo4j_factory.hydrate_relationship(
+        3334441,
+        333,
+        444,
+        "HAS_ATTRIBUTE",
+        {"branch": "branch1", "branch_level": 2, "from": "2024-01-01T00:00:00Z", "to": None, "status": "active"},
+    )
+    r2 = neo4j_factory.hydrate_relationship(
+        3334442,
+        333,
+        444,
+        "HAS_VALUE",
+        {
+            "branch": "main",
+            "branch_level": 1,
+            "from": "2024-01-01T00:00:00Z",
+            "to": "2024-01-02T00:00:00Z",
+            "status": "deleted",
+        },
+    )
+
+    labels = QueryResultLabels(labels=["n1", "r1", "r2", "n2.name AS name", "n2"])
+    assert labels.positions == {"n1": 0, "r1": 1, "r2": 2, "name": 3, "n2": 4}
+
+    qr1 = QueryResult(data=[n1, r1, r2, "name", n2], labels=labels)
+    qr2 = QueryResult(data=[n1, r1, r1, "name", n2], labels=labels)
+    assert qr1.labels == ["n1", "r1", "r2", "name", "n2"]
+    assert qr1.get("name") == "name"
+    assert qr1.get_node("n2") == n2
+    assert qr1.get_rel("r2") == r2
+
+    assert qr1.branch_score == 3
+    assert qr1.time_score == 3
+    assert qr1.has_deleted_rels is True
+    assert qr2.branch_score == 4
+    assert qr2.time_score == 4
+    assert qr2.has_deleted_rels is False
+
+
 async def test_sort_results_by_time(neo4j_factory):
     time0 = pendulum.now(tz="UTC")
 
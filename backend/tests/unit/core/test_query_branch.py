@@ -1,5 +1,5 @@
 from infrahub.core.branch import Branch
-from infrahub.core.query.branch import GetAllBranchInternalRelationshipQuery
+from infrahub.core.query.branch import AddRelationshipsToBranch, GetAllBranchInternalRelationshipQuery
 from infrahub.core.registry import registry
 from infrahub.database import InfrahubDatabase
 
@@ -14,3 +14,30 @@ async def test_GetAllBranchInternalRelationshipQuery(db: InfrahubDatabase, defau
 
     unique_ids = set([result.get("r").element_id for result in query.results])
     assert len(unique_ids) == len(query.results)
+
+
+async def test_AddRelationshipsToBranch(db: InfrahubDatabase, default_branch: Branch, empty_database):
+    query = """
+    CREATE (p1:Person { name: "Jim" })
+    CREATE (p2:Person { name: "Jane" })
+    CREATE (p3:Person { name: "Billy" })
+    RETURN p1, p2, p3
+    """
+    results = await db.execute_query(query=query)
+    nodes = results[0]
+
+    edges = [
+        {"src_node_id": nodes[0].element_id, "dst_node_id": nodes[1].element_id, "status": "active"},
+        {"src_node_id": nodes[0].element_id, "dst_node_id": nodes[2].element_id, "status": "deleted"},
+    ]
+    query = await AddRelationshipsToBranch.init(db=db, rel_type="knows", edges=edges, branch=default_branch)
+    await query.execute(db=db)
+    assert query.stats.get_counter("relationships_created") == 2
+
+    results = await db.execute_query(
+        query="MATCH (:Person)-[r:KNOWS]->(p:Person) RETURN p.name, r.status, r.branch ORDER BY p.name"
+    )
+    assert [tuple(result) for result in results] == [
+        ("Billy", "deleted", default_branch.name),
+        ("Jane", "active", default_branch.name),
+    ]
@@ -0,0 +1,166 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from infrahub_sdk import Config
+from infrahub_sdk.config import ConfigBase
+
+from infrahub.git.executor import (
+    PythonExecutionPool,
+    PythonTaskError,
+    PythonTaskRequest,
+    PythonTaskType,
+)
+
+TRANSFORM_CODE = """
+import time
+
+from infrahub_sdk.transforms import InfrahubTransform
+
+
+class UpperTransform(InfrahubTransform):
+    query = "my_query"
+
+    async def transform(self, data):
+        return {"name": data["name"].upper()}
+
+
+class SlowTransform(InfrahubTransform):
+    query = "my_query"
+
+    def transform(self, data):
+        time.sleep(30)
+
+
+class DelayedTransform(InfrahubTransform):
+    query = "my_query"
+
+    def transform(self, data):
+        time.sleep(2)
+        return {"name": data["name"]}
+"""
+
+CHECK_CODE = """
+from infrahub_sdk.checks import InfrahubCheck
+
+
+class NameCheck(InfrahubCheck):
+    query = "my_query"
+
+    def validate(self, data):
+        if data["name"] != "valid":
+            self.log_error(message="invalid name")
+"""
+
+
+@pytest.fixture
+def python_repo(tmp_path: Path) -> Path:
+    worktree = tmp_path / "commits" / "c0ffee"
+    worktree.mkdir(parents=True)
+    (worktree / "transform_upper.py").write_text(TRANSFORM_CODE)
+    (worktree / "check_name.py").write_text(CHECK_CODE)
+    return tmp_path
+
+
+def _request(repo: Path, task_type: PythonTaskType, module_name: str, class_name: str, data: dict) -> PythonTaskRequest:
+    return PythonTaskRequest(
+        task_type=task_type,
+        directory_root=str(repo),
+        worktree_directory=str(repo / "commits" / "c0ffee"),
+        module_name=module_name,
+        class_name=class_name,
+        branch_name="main",
+        client_config=Config(address="http://mock").dict(include=set(ConfigBase.__fields__)),
+        data=data,
+    )
+
+
+async def test_execute_python_transform(python_repo: Path):
+    pool = PythonExecutionPool(max_workers=1)
+    try:
+        await pool.warm_up(directory_root=str(python_repo), module_names=["commits.c0ffee.transform_upper"])
+        result = await pool.execute(
+            request=_request(
+                python_repo, PythonTaskType.TRANSFORM, "commits.c0ffee.transform_upper", "UpperTransform", {"name": "a"}
+            )
+        )
+        assert result.error is None
+        assert result.value == {"name": "A"}
+
+        result = await pool.execute(
+            request=_request(
+                python_repo, PythonTaskType.TRANSFORM, "commits.c0ffee.transform_upper", "MissingTransform", {}
+            )
+        )
+        assert result.error == PythonTaskError.CLASS_NOT_FOUND
+
+        result = await pool.execute(
+            request=_request(python_repo, PythonTaskType.TRANSFORM, "commits.c0ffee.notthere", "UpperTransform", {})
+        )
+        assert result.error == PythonTaskError.MODULE_NOT_FOUND
+    finally:
+        pool.shutdown()
+
+
+async def test_execute_python_check(python_repo: Path):
+    pool = PythonExecutionPool(max_workers=1)
+    try:
+        result = await pool.execute(
+            request=_request(python_repo, PythonTaskType.CHECK, "commits.c0ffee.check_name", "NameCheck", {"name": "x"})
+        )
+        assert result.error is None
+        assert result.passed is False
+        assert "invalid name" in result.log_entries
+    finally:
+        pool.shutdown()
+
+
+async def test_execute_python_transform_timeout(python_repo: Path):
+    pool = PythonExecutionPool(max_workers=1)
+    try:
+        result = await pool.execute(
+            request=_request(
+                python_repo, PythonTaskType.TRANSFORM, "commits.c0ffee.transform_upper", "SlowTransform", {"name": "a"}
+            ),
+            timeout=1,
+        )
+        assert result.error == PythonTaskError.TIMEOUT
+
+        # The pool is recreated for the next execution
+        result = await pool.execute(
+            request=_request(
+                python_repo, PythonTaskType.TRANSFORM, "commits.c0ffee.transform_upper", "UpperTransform", {"name": "b"}
+            )
+        )
+        assert result.value == {"name": "B"}
+    finally:
+        pool.shutdown()
+
+
+async def test_execute_python_transform_timeout_other_tasks(python_repo: Path):
+    pool = PythonExecutionPool(max_workers=2)
+    try:
+        slow, delayed = await asyncio.gather(
+            pool.execute(
+                request=_request(
+                    python_repo, PythonTaskType.TRANSFORM, "commits.c0ffee.transform_upper", "SlowTransform", {}
+                ),
+                timeout=1,
+            ),
+            pool.execute(
+                request=_request(
+                    python_repo,
+                    PythonTaskType.TRANSFORM,
+                    "commits.c0ffee.transform_upper",
+                    "DelayedTransform",
+                    {"name": "a"},
+                ),
+                timeout=10,
+            ),
+        )
+        # The task still running on the pool when another one timed out is not impacted
+        assert slow.error == PythonTaskError.TIMEOUT
+        assert delayed.error is None
+        assert delayed.value == {"name": "a"}
+    finally:
+        pool.shutdown()
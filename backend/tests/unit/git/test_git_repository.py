@@ -1,4 +1,8 @@
+import asyncio
+import copy
 import os
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from git import Repo
@@ -25,6 +29,7 @@ from infrahub.git import (
     Worktree,
     extract_repo_file_information,
 )
+from infrahub.git.cache import Jinja2TemplateCache, PythonTransformCache, jinja2_template_cache, python_transform_cache
 from infrahub.utils import find_first_file_in_directory
 
 
@@ -419,6 +424,23 @@ magnum
     assert rendered_tpl_main != rendered_tpl_branch
 
 
+async def test_render_jinja2_template_cached(git_repo_jinja: InfrahubRepository):
+    repo = git_repo_jinja
+    commit_main = repo.get_commit_value(branch_name="main", remote=False)
+    data = {"data": {"items": ["consilium", "potum"]}}
+
+    jinja2_template_cache.clear()
+    first = await repo.render_jinja2_template(commit=commit_main, location="template01.tpl.j2", data=data)
+    template = jinja2_template_cache.get(
+        repository=str(repo.id), commit=commit_main, location="template01.tpl.j2", directory="/not/used"
+    )
+    second = await repo.render_jinja2_template(commit=commit_main, location="template01.tpl.j2", data=data)
+
+    assert first == second
+    assert len(jinja2_template_cache) == 1
+    assert template.render(**data) == first
+
+
 async def test_render_jinja2_template_error(git_repo_jinja: InfrahubRepository):
     repo = git_repo_jinja
 
@@ -488,6 +510,59 @@ async def test_execute_python_transform_w_data(client, git_repo_transforms: Infr
     assert result == expected_data
 
 
+async def test_execute_python_transform_cached(client, git_repo_transforms: InfrahubRepository):
+    repo = git_repo_transforms
+    commit_main = repo.get_commit_value(branch_name="main", remote=False)
+
+    python_transform_cache.clear()
+    for data in [{"key1": "value1"}, {"key2": "value2"}]:
+        result = await repo.execute_python_transform(
+            branch_name="main", data=data, commit=commit_main, location="transform01.py::Transform01", client=client
+        )
+        assert result == {key.upper(): value for key, value in data.items()}
+
+    assert len(python_transform_cache) == 1
+    assert python_transform_cache.get(
+        repository=str(repo.id), commit=commit_main, location="transform01.py::Transform01", branch="main"
+    )
+
+
+async def test_execute_python_transform_cached_client_per_run(client, git_repo_transforms: InfrahubRepository):
+    """Concurrent executions of a cached transform must each use their own instance and client."""
+    repo = git_repo_transforms
+    commit_main = repo.get_commit_value(branch_name="main", remote=False)
+
+    python_transform_cache.clear()
+    await repo.execute_python_transform(
+        branch_name="main", data={}, commit=commit_main, location="transform01.py::Transform01", client=client
+    )
+    transform_class = python_transform_cache.get(
+        repository=str(repo.id), commit=commit_main, location="transform01.py::Transform01", branch="main"
+    )
+
+    clients = []
+    original_run = transform_class.run
+
+    async def run(self, data=None):
+        run_client = self.client
+        clients.append(run_client)
+        await asyncio.sleep(0)
+        assert self.client is run_client
+        return await original_run(self, data=data)
+
+    client2 = copy.copy(client)
+    with patch.object(transform_class, "run", run):
+        await asyncio.gather(
+            *[
+                repo.execute_python_transform(
+                    branch_name="main", data={}, commit=commit_main, location="transform01.py::Transform01", client=item
+                )
+                for item in (client, client2)
+            ]
+        )
+    assert clients == [client, client2]
+
+
 async def test_execute_python_transform_w_query(
     client, git_repo_transforms: InfrahubRepository, mock_gql_query_my_query
 ):
@@ -870,3 +945,46 @@ async def test_compare_python_check(
     )
 
     assert await repo.compare_python_check_definition(check=check03, existing_check=existing_check) is False
+
+
+async def test_jinja2_template_cache_lru(tmp_path: Path):
+    for name in ["first", "second", "third"]:
+        (tmp_path / f"{name}.j2").write_text(f"{name} {{{{ value }}}}")
+
+    cache = Jinja2TemplateCache(max_size=2)
+    cache.get(repository="repo", commit="c1", location="first.j2", directory=str(tmp_path))
+    cache.get(repository="repo", commit="c1", location="second.j2", directory=str(tmp_path))
+    cache.get(repository="repo", commit="c1", location="first.j2", directory=str(tmp_path))
+    cache.get(repository="repo", commit="c1", location="third.j2", directory=str(tmp_path))
+
+    assert len(cache) == 2
+    assert list(cache._entries.keys()) == [("repo", "c1", "first.j2"), ("repo", "c1", "third.j2")]
+    template = cache.get(repository="repo", commit="c1", location="third.j2", directory=str(tmp_path))
+    assert template.render(value=1) == "third 1"
+
+
+def test_python_transform_cache_new_commit():
+    cache = PythonTransformCache(max_size=2)
+    transform1, transform2, transform3 = object(), object(), object()
+    cache.set(repository="repo", commit="c1", location="t.py::T1", branch="main", transform_class=transform1)
+    cache.set(repository="other", commit="c1", location="t.py::T1", branch="main", transform_class=transform2)
+    assert cache.get(repository="repo", commit="c1", location="t.py::T1", branch="main") is transform1
+
+    # The transform loaded from the previous commit for the same repository, branch and location is discarded
+    cache.set(repository="repo", commit="c2", location="t.py::T1", branch="main", transform_class=transform3)
+    assert len(cache) == 2
+    assert cache.get(repository="repo", commit="c1", location="t.py::T1", branch="main") is None
+    assert cache.get(repository="other", commit="c1", location="t.py::T1", branch="main") is transform2
+
+
+def test_python_transform_cache_other_branch():
+    cache = PythonTransformCache(max_size=4)
+    transform1, transform2, transform3 = object(), object(), object()
+    cache.set(repository="repo", commit="c1", location="t.py::T1", branch="main", transform_class=transform1)
+    cache.set(repository="repo", commit="c1", location="t.py::T2", branch="main", transform_class=transform2)
+
+    # Another branch at a new commit doesn't discard the transforms of the main branch
+    cache.set(repository="repo", commit="c2", location="t.py::T1", branch="branch1", transform_class=transform3)
+    assert len(cache) == 3
+    assert cache.get(repository="repo", commit="c1", location="t.py::T1", branch="main") is transform1
+    assert cache.get(repository="repo", commit="c1", location="t.py::T2", branch="main") is transform2
@@ -1,9 +1,11 @@
 from fastapi.testclient import TestClient
+from starlette.responses import StreamingResponse
 
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.node import Node
 from infrahub.database import InfrahubDatabase
+from infrahub.graphql import app as graphql_app
 
 
 async def test_websocket(db: InfrahubDatabase, default_branch: Branch, register_core_models_schema):
@@ -30,3 +32,20 @@ async def test_websocket(db: InfrahubDatabase, default_branch: Branch, register_
             )
             data = websocket.receive_json()
             assert data == {"id": "1", "payload": {"data": {"query": {"BuiltinTag": {"count": 1}}}}, "type": "data"}
+
+
+async def test_build_json_response_streams_large_body(monkeypatch):
+    monkeypatch.setattr(graphql_app, "GRAPHQL_RESPONSE_STREAM_THRESHOLD", 16)
+    monkeypatch.setattr(graphql_app, "GRAPHQL_RESPONSE_CHUNK_SIZE", 8)
+
+    small = graphql_app._build_json_response(body=b'{"data":{}}')
+    assert not isinstance(small, StreamingResponse)
+    assert small.body == b'{"data":{}}'
+
+    body = b'{"data":{"name":"a long enough value"}}'
+    large = graphql_app._build_json_response(body=body)
+    assert isinstance(large, StreamingResponse)
+    assert large.headers["content-length"] == str(len(body))
+    chunks = [chunk async for chunk in large.body_iterator]
+    assert len(chunks) == 5
+    assert b"".join(chunks) == body
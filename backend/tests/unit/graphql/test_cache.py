@@ -0,0 +1,66 @@
+from graphql import build_schema
+
+from infrahub.core import registry
+from infrahub.core.branch import Branch
+from infrahub.database import InfrahubDatabase
+from infrahub.graphql.cache import GraphQLSchemaCache, graphql_schema_cache
+from infrahub.graphql.document_cache import GraphQLDocumentCache
+
+
+async def test_schema_shared_between_identical_branches(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema
+):
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+    other_schema = schema.duplicate(name="branch2")
+
+    assert schema.get_graphql_schema() is other_schema.get_graphql_schema()
+    assert schema.get_graphql_manager() is other_schema.get_graphql_manager()
+    assert graphql_schema_cache.get_key(schema_branch=schema) == graphql_schema_cache.get_key(
+        schema_branch=other_schema
+    )
+
+
+async def test_schema_cache_options(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+    cache = GraphQLSchemaCache(max_size=5)
+
+    full = cache.get(schema_branch=schema)
+    no_mutation = cache.get(schema_branch=schema, include_mutation=False)
+
+    assert len(cache) == 2
+    assert full.schema is not no_mutation.schema
+    assert full.schema.mutation_type is not None
+    assert no_mutation.schema.mutation_type is None
+
+
+async def test_schema_cache_eviction(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+    cache = GraphQLSchemaCache(max_size=2)
+
+    first = cache.get(schema_branch=schema)
+    cache.get(schema_branch=schema, include_mutation=False)
+    assert cache.get(schema_branch=schema) is first
+
+    cache.get(schema_branch=schema, include_subscription=False)
+    assert len(cache) == 2
+    assert cache.get(schema_branch=schema) is first
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get(schema_branch=schema) is not first
+
+
+def test_document_cache():
+    schema = build_schema("type Query { name: String }")
+    other_schema = build_schema("type Query { name: String }")
+    cache = GraphQLDocumentCache(max_size=2)
+
+    valid = cache.get(schema=schema, query="query { name }")
+    assert valid.errors == []
+    assert cache.get(schema=schema, query="query { name }") is valid
+    assert cache.get(schema=other_schema, query="query { name }") is not valid
+
+    invalid = cache.get(schema=schema, query="query { description }")
+    assert len(invalid.errors) == 1
+    assert len(cache) == 2
+    assert cache.get(schema=schema, query="query { name }") is not valid
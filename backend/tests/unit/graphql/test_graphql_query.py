@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from deepdiff import DeepDiff
 from graphql import graphql
@@ -507,6 +509,66 @@ async def test_nested_query(db: InfrahubDatabase, default_branch: Branch, car_pe
     assert gql_params.context.related_node_ids == {p1.id, p2.id, c1.id, c2.id, c3.id}
 
 
+async def test_nested_query_peers_batched(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    car = registry.schema.get(name="TestCar")
+    person = registry.schema.get(name="TestPerson")
+
+    persons = []
+    for idx in range(3):
+        obj = await Node.init(db=db, schema=person)
+        await obj.new(db=db, name=f"person{idx}", height=180)
+        await obj.save(db=db)
+        persons.append(obj)
+
+    for idx, owner in enumerate(persons):
+        obj = await Node.init(db=db, schema=car)
+        await obj.new(db=db, name=f"car{idx}", nbr_seats=4, is_electric=True, owner=owner)
+        await obj.save(db=db)
+
+    query = """
+    query {
+        TestPerson {
+            edges {
+                node {
+                    name {
+                        value
+                    }
+                    cars {
+                        edges {
+                            node {
+                                name {
+                                    value
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+    """
+
+    gql_params = prepare_graphql_params(
+        db=db, include_mutation=False, include_subscription=False, branch=default_branch
+    )
+    with patch.object(NodeManager, "query_peers", wraps=NodeManager.query_peers) as spy_query_peers:
+        result = await graphql(
+            schema=gql_params.schema,
+            source=query,
+            context_value=gql_params.context,
+            root_value=None,
+            variable_values={},
+        )
+
+    assert result.errors is None
+    result_per_name = {result["node"]["name"]["value"]: result["node"] for result in result.data["TestPerson"]["edges"]}
+    assert {
+        name: [car["node"]["name"]["value"] for car in node["cars"]["edges"]] for name, node in result_per_name.items()
+    } == {"person0": ["car0"], "person1": ["car1"], "person2": ["car2"]}
+    assert len(gql_params.context.peers_loaders) == 1
+    assert spy_query_peers.call_count == 1
+
+
 async def test_double_nested_query(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
     car = registry.schema.get(name="TestCar")
     person = registry.schema.get(name="TestPerson")
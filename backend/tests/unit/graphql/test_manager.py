@@ -83,6 +83,16 @@ async def test_generate_graphql_mutation_create(db: InfrahubDatabase, default_br
     assert sorted(list(result._meta.fields.keys())) == ["object", "ok"]
 
 
+async def test_generate_graphql_mutation_create_many(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+    gqlm = GraphQLSchemaManager(schema=schema)
+
+    input_type = gqlm.generate_graphql_mutation_create_input(schema=criticality_schema)
+    result = gqlm.generate_graphql_mutation_create_many(schema=criticality_schema, input_type=input_type)
+    assert result._meta.name == "TestCriticalityCreateMany"
+    assert sorted(list(result._meta.fields.keys())) == ["count", "objects", "ok"]
+
+
 async def test_generate_graphql_mutation_update(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
     schema = registry.schema.get_schema_branch(name=default_branch.name)
     gqlm = GraphQLSchemaManager(schema=schema)
@@ -985,6 +985,79 @@ async def test_create_with_uniqueness_constraint_violation(db: InfrahubDatabase,
     assert "Violates uniqueness constraint 'owner-color'" in result.errors[0].message
 
 
+async def test_create_many_objects(db: InfrahubDatabase, default_branch, car_person_schema):
+    query = """
+    mutation {
+        TestPersonCreateMany(data: [
+            {name: { value: "Alice"}, height: {value: 165}},
+            {name: { value: "Bob"}, height: {value: 172}},
+            {name: { value: "Carol"}},
+        ]) {
+            ok
+            count
+            objects {
+                id
+                name {
+                    value
+                }
+            }
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors is None
+    assert result.data["TestPersonCreateMany"]["ok"] is True
+    assert result.data["TestPersonCreateMany"]["count"] == 3
+    assert [obj["name"]["value"] for obj in result.data["TestPersonCreateMany"]["objects"]] == [
+        "Alice",
+        "Bob",
+        "Carol",
+    ]
+
+    persons = await NodeManager.query(db=db, schema="TestPerson", branch=default_branch)
+    heights = {person.name.value: person.height.value for person in persons}
+    assert heights == {"Alice": 165, "Bob": 172, "Carol": None}
+
+
+async def test_create_many_with_uniqueness_violation(db: InfrahubDatabase, default_branch, car_person_schema):
+    p1 = await Node.init(db=db, schema="TestPerson")
+    await p1.new(db=db, name="Bruce Wayne", height=180)
+    await p1.save(db=db)
+
+    query = """
+    mutation {
+        TestPersonCreateMany(data: [
+            {name: { value: "Dick Grayson"}},
+            {name: { value: "%s"}},
+        ]) {
+            ok
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    for duplicate_name in ("Bruce Wayne", "Dick Grayson"):
+        result = await graphql(
+            schema=gql_params.schema,
+            source=query % duplicate_name,
+            context_value=gql_params.context,
+            root_value=None,
+            variable_values={},
+        )
+        assert len(result.errors) == 1
+        assert f"An object already exist with this value: name: {duplicate_name}" in result.errors[0].message
+
+    persons = await NodeManager.query(db=db, schema="TestPerson", branch=default_branch)
+    assert [person.name.value for person in persons] == ["Bruce Wayne"]
+
+
 async def test_relationship_with_hfid(db: InfrahubDatabase, default_branch, animal_person_schema):
     person_schema = animal_person_schema.get(name="TestPerson")
 
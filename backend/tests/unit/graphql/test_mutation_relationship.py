@@ -1,6 +1,7 @@
 from graphql import graphql
 from infrahub_sdk import UUIDT
 
+from infrahub import config
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
@@ -8,6 +9,10 @@ from infrahub.core.node import Node
 from infrahub.core.utils import count_relationships
 from infrahub.database import InfrahubDatabase
 from infrahub.graphql import prepare_graphql_params
+from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql.subscription.graphql_query import GraphQLQueryExecution, GraphQLQuerySubscriptionManager
+from infrahub.services import InfrahubServices, services
+from tests.adapters.message_bus import BusRecorder
 
 
 async def test_relationship_add(
@@ -97,6 +102,72 @@ async def test_relationship_add(
     )
 
 
+async def test_relationship_add_refresh_subscriptions(
+    db: InfrahubDatabase,
+    person_jack_main: Node,
+    tag_blue_main: Node,
+    default_branch: Branch,
+    monkeypatch,
+):
+    """A change limited to a relationship must refresh the subscriptions using the kinds on both sides."""
+    monkeypatch.setattr(config.SETTINGS.broker, "enable", True)
+    recorder = BusRecorder()
+    service = InfrahubServices(message_bus=recorder)
+    monkeypatch.setattr(services, "send", service.send)
+
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch, service=service)
+    analyzed_query = InfrahubGraphQLQueryAnalyzer(
+        query="query { TestPerson { edges { node { tags { count } } } } }",
+        schema=gql_params.schema,
+        branch=default_branch,
+    )
+    execution = GraphQLQueryExecution(
+        context=gql_params.context,
+        analyzed_query=analyzed_query,
+        kinds=await analyzed_query.get_models_in_use(types=gql_params.context.types),
+        interval=0,
+    )
+    manager = GraphQLQuerySubscriptionManager()
+    manager._executions[manager.get_key(branch=default_branch.name, name="query01", params=None, interval=0)] = (
+        execution
+    )
+    execution.start()
+
+    version, data = await execution.wait_for_update(version=0)
+    assert data["TestPerson"]["edges"][0]["node"]["tags"]["count"] == 0
+
+    query = """
+    mutation {
+        RelationshipAdd(data: {
+            id: "%s",
+            name: "tags",
+            nodes: [{id: "%s"}],
+        }) {
+            ok
+        }
+    }
+    """ % (person_jack_main.id, tag_blue_main.id)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+    assert result.errors is None
+    await gql_params.context.background()
+
+    refresh_messages = recorder.messages_per_routing_key["refresh.graphql_query.subscriptions"]
+    assert len(refresh_messages) == 1
+    assert refresh_messages[0].branch == default_branch.name
+    assert refresh_messages[0].kinds == sorted([InfrahubKind.TAG, "TestPerson"])
+
+    manager.notify(branch=refresh_messages[0].branch, kinds=refresh_messages[0].kinds)
+    version, data = await execution.wait_for_update(version=version)
+    assert data["TestPerson"]["edges"][0]["node"]["tags"]["count"] == 1
+    execution.stop()
+
+
 async def test_relationship_remove(
     db: InfrahubDatabase,
     person_jack_tags_main: Node,
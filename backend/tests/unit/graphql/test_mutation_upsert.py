@@ -310,3 +310,39 @@ async def test_with_hfid_new(db: InfrahubDatabase, default_branch, animal_person
         "id": new_id,
         "name": {"value": "Bella"},
     }
+
+
+async def test_upsert_many_objects(db: InfrahubDatabase, person_john_main: Node, branch: Branch):
+    query = """
+    mutation {
+        TestPersonUpsertMany(data: [
+            {name: { value: "John"}, height: {value: 138}},
+            {name: { value: "Jane"}, height: {value: 165}},
+        ]) {
+            ok
+            count
+            objects {
+                id
+            }
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors is None
+    assert result.data["TestPersonUpsertMany"]["ok"] is True
+    assert result.data["TestPersonUpsertMany"]["count"] == 2
+    assert result.data["TestPersonUpsertMany"]["objects"][0]["id"] == person_john_main.id
+
+    obj1 = await NodeManager.get_one(db=db, id=person_john_main.id, branch=branch)
+    assert obj1.height.value == 138
+    obj2 = await NodeManager.get_one(db=db, id=result.data["TestPersonUpsertMany"]["objects"][1]["id"], branch=branch)
+    assert obj2.name.value == "Jane"
+    assert obj2.height.value == 165
@@ -0,0 +1,77 @@
+from infrahub import config
+from infrahub.core.branch import Branch
+from infrahub.core.constants import InfrahubKind
+from infrahub.core.node import Node
+from infrahub.database import InfrahubDatabase
+from infrahub.graphql import prepare_graphql_params
+from infrahub.graphql.subscription.graphql_query import GraphQLQuerySubscriptionManager
+
+
+async def test_graphql_query_subscription(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema, monkeypatch
+):
+    monkeypatch.setattr(config.SETTINGS.broker, "enable", True)
+    tag = await Node.init(db=db, schema=InfrahubKind.TAG, branch=default_branch)
+    await tag.new(db=db, name="Red")
+    await tag.save(db=db)
+
+    query = await Node.init(db=db, schema=InfrahubKind.GRAPHQLQUERY, branch=default_branch)
+    await query.new(db=db, name="query01", query="query { BuiltinTag { count }}")
+    await query.save(db=db)
+
+    gql_params = prepare_graphql_params(db=db, branch=default_branch)
+    manager = GraphQLQuerySubscriptionManager()
+
+    first = manager.subscribe(context=gql_params.context, name="query01", interval=0)
+    second = manager.subscribe(context=gql_params.context, name="query01", interval=0)
+    assert await first.__anext__() == {"BuiltinTag": {"count": 1}}
+    assert await second.__anext__() == {"BuiltinTag": {"count": 1}}
+    assert len(manager) == 1
+
+    execution = list(manager._executions.values())[0]
+    assert execution.kinds == {InfrahubKind.TAG}
+    assert execution.subscribers == 2
+    assert execution.is_impacted(branch=default_branch.name, kinds={InfrahubKind.TAG})
+    assert execution.is_impacted(branch=default_branch.name, kinds=set())
+    assert not execution.is_impacted(branch=default_branch.name, kinds={InfrahubKind.ACCOUNT})
+    assert not execution.is_impacted(branch="branch2", kinds={InfrahubKind.TAG})
+
+    tag = await Node.init(db=db, schema=InfrahubKind.TAG, branch=default_branch)
+    await tag.new(db=db, name="Blue")
+    await tag.save(db=db)
+
+    manager.notify(branch=default_branch.name, kinds=[InfrahubKind.TAG])
+    assert await first.__anext__() == {"BuiltinTag": {"count": 2}}
+    assert await second.__anext__() == {"BuiltinTag": {"count": 2}}
+    assert execution.version == 2
+
+    await first.aclose()
+    assert len(manager) == 1
+    await second.aclose()
+    assert len(manager) == 0
+
+
+async def test_graphql_query_subscription_without_broker(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema, monkeypatch
+):
+    """Without the message bus, no change is ever reported and the query is executed again after each interval."""
+    monkeypatch.setattr(config.SETTINGS.broker, "enable", False)
+    query = await Node.init(db=db, schema=InfrahubKind.GRAPHQLQUERY, branch=default_branch)
+    await query.new(db=db, name="query01", query="query { BuiltinTag { count }}")
+    await query.save(db=db)
+
+    gql_params = prepare_graphql_params(db=db, branch=default_branch)
+    manager = GraphQLQuerySubscriptionManager()
+
+    subscription = manager.subscribe(context=gql_params.context, name="query01", interval=0)
+    assert await subscription.__anext__() == {"BuiltinTag": {"count": 0}}
+
+    tag = await Node.init(db=db, schema=InfrahubKind.TAG, branch=default_branch)
+    await tag.new(db=db, name="Blue")
+    await tag.save(db=db)
+
+    # No change is reported, an execution started before the tag was saved can still return the previous count
+    assert await subscription.__anext__() in ({"BuiltinTag": {"count": 0}}, {"BuiltinTag": {"count": 1}})
+    assert await subscription.__anext__() == {"BuiltinTag": {"count": 1}}
+    await subscription.aclose()
+    assert len(manager) == 0
@@ -33,7 +33,11 @@ async def test_rebased():
 
     await rebased(message=message, service=service)
 
-    assert len(recorder.messages) == 1
+    assert len(recorder.messages) == 2
     assert isinstance(recorder.messages[0], messages.RefreshRegistryRebasedBranch)
     refresh_message: messages.RefreshRegistryRebasedBranch = recorder.messages[0]
     assert refresh_message.branch == "cr1234"
+    assert isinstance(recorder.messages[1], messages.RefreshGraphQLQuerySubscriptions)
+    refresh_subscriptions: messages.RefreshGraphQLQuerySubscriptions = recorder.messages[1]
+    assert refresh_subscriptions.branch == "cr1234"
+    assert refresh_subscriptions.kinds == []
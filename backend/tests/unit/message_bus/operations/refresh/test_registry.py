@@ -1,11 +1,14 @@
+from ipaddress import ip_network
 from uuid import uuid4
 
 from infrahub.core.branch import Branch
 from infrahub.core.registry import registry
 from infrahub.database import InfrahubDatabase
 from infrahub.message_bus import Meta, messages
-from infrahub.message_bus.operations.refresh.registry import rebased_branch
+from infrahub.message_bus.operations.refresh.registry import ip_address_pools, rebased_branch
+from infrahub.pools.address import AddressFreeRanges, address_free_ranges_index
 from infrahub.services import InfrahubServices
+from infrahub.worker import WORKER_IDENTITY
 from tests.adapters.message_bus import BusSimulator
 
 
@@ -22,3 +25,19 @@ async def test_rebased_branch(db: InfrahubDatabase):
     assert branch_name not in registry.branch
     await rebased_branch(message=message, service=service)
     assert branch_name in registry.branch
+
+
+async def test_ip_address_pools():
+    network = ip_network("10.0.0.0/30")
+    address_free_ranges_index.set(
+        namespace_id="ns1", free_ranges=AddressFreeRanges(network=network, addresses=[], is_pool=False), is_pool=False
+    )
+    service = InfrahubServices(message_bus=BusSimulator())
+
+    message = messages.RefreshRegistryIPAddressPools(branch="main", meta=Meta(initiator_id=WORKER_IDENTITY))
+    await ip_address_pools(message=message, service=service)
+    assert address_free_ranges_index.get(namespace_id="ns1", network=network, is_pool=False)
+
+    message = messages.RefreshRegistryIPAddressPools(branch="main", meta=Meta(initiator_id=str(uuid4())))
+    await ip_address_pools(message=message, service=service)
+    assert address_free_ranges_index.get(namespace_id="ns1", network=network, is_pool=False) is None
@@ -1,29 +1,81 @@
-from ipaddress import ip_interface, ip_network
+from ipaddress import ip_address, ip_interface, ip_network
 
-from netaddr import IPNetwork
+from infrahub.pools.address import AddressFreeRanges, AddressFreeRangesIndex
 
-from infrahub.pools.address import get_available
 
+def test_address_free_ranges():
+    network = ip_network("10.16.18.0/28")
+    addresses = [ip_interface("10.16.18.1/28"), ip_interface("10.16.18.4/28"), ip_interface("10.16.18.5/28")]
+    free_ranges = AddressFreeRanges(network=network, addresses=addresses, is_pool=False)
+    assert len(free_ranges) == 11
+    assert free_ranges.first() == ip_address("10.16.18.2")
 
-def test_get_available():
-    network = ip_network("10.16.18.0/30")
-    addresses = [ip_interface("10.16.18.1/30")]
-    available = get_available(network=network, addresses=addresses, is_pool=False)
-    assert len(available) == 1
-    assert available.iter_cidrs()[0] == IPNetwork("10.16.18.2/32")
+    assert free_ranges.reserve(address=ip_address("10.16.18.2"))
+    assert free_ranges.first() == ip_address("10.16.18.3")
+    assert not free_ranges.reserve(address=ip_address("10.16.18.2"))
+    assert not free_ranges.reserve(address=ip_address("10.16.18.4"))
+    assert not free_ranges.reserve(address=ip_address("10.16.18.15"))
 
+    assert free_ranges.reserve(address=ip_address("10.16.18.10"))
+    assert free_ranges.reserve(address=ip_address("10.16.18.14"))
+    assert len(free_ranges) == 8
 
-def test_get_available_pool():
-    network = ip_network("10.16.18.0/30")
-    addresses = [ip_interface("10.16.18.1/30")]
-    available = get_available(network=network, addresses=addresses, is_pool=True)
-    assert len(available) == 3
-    assert available.iter_cidrs()[0] == IPNetwork("10.16.18.0/32")
-    assert available.iter_cidrs()[1] == IPNetwork("10.16.18.2/31")
+    reserved = []
+    while (address := free_ranges.first()) is not None:
+        assert free_ranges.reserve(address=address)
+        reserved.append(address)
+    assert reserved == [
+        ip_address("10.16.18.3"),
+        ip_address("10.16.18.6"),
+        ip_address("10.16.18.7"),
+        ip_address("10.16.18.8"),
+        ip_address("10.16.18.9"),
+        ip_address("10.16.18.11"),
+        ip_address("10.16.18.12"),
+        ip_address("10.16.18.13"),
+    ]
+    assert not free_ranges
+    assert free_ranges.first() is None
 
 
-def test_get_available_full():
+def test_address_free_ranges_full():
     network = ip_network("10.16.18.0/30")
     addresses = [ip_interface("10.16.18.1/30"), ip_interface("10.16.18.2/30")]
-    available = get_available(network=network, addresses=addresses, is_pool=False)
-    assert len(available) == 0
+    free_ranges = AddressFreeRanges(network=network, addresses=addresses, is_pool=False)
+    assert len(free_ranges) == 0
+    assert free_ranges.first() is None
+    assert not free_ranges.reserve(address=ip_address("10.16.18.1"))
+
+
+def test_address_free_ranges_ipv6_pool():
+    network = ip_network("2001:db8::/126")
+    free_ranges = AddressFreeRanges(network=network, addresses=[ip_interface("2001:db8::1/126")], is_pool=True)
+    assert len(free_ranges) == 3
+    assert free_ranges.first() == ip_address("2001:db8::")
+    assert free_ranges.reserve(address=ip_address("2001:db8::"))
+    assert free_ranges.first() == ip_address("2001:db8::2")
+
+
+def test_address_free_ranges_index():
+    network = ip_network("10.16.18.0/28")
+    index = AddressFreeRangesIndex()
+    index.set(
+        namespace_id="ns1", free_ranges=AddressFreeRanges(network=network, addresses=[], is_pool=False), is_pool=False
+    )
+    index.set(
+        namespace_id="ns2", free_ranges=AddressFreeRanges(network=network, addresses=[], is_pool=False), is_pool=False
+    )
+
+    index.reserve(namespace_id="ns1", address=ip_address("10.16.18.1"))
+    index.reserve(namespace_id="ns1", address=ip_address("2001:db8::1"))
+    assert index.get(namespace_id="ns1", network=network, is_pool=False).first() == ip_address("10.16.18.2")
+    assert index.get(namespace_id="ns2", network=network, is_pool=False).first() == ip_address("10.16.18.1")
+    assert index.get(namespace_id="ns1", network=network, is_pool=True) is None
+
+    index.invalidate(address=ip_address("10.16.19.1"), namespace_id="ns1")
+    index.invalidate(address=ip_address("10.16.18.1"), namespace_id="ns1")
+    assert index.get(namespace_id="ns1", network=network, is_pool=False) is None
+    assert index.get(namespace_id="ns2", network=network, is_pool=False) is not None
+
+    index.invalidate()
+    assert index.get(namespace_id="ns2", network=network, is_pool=False) is None
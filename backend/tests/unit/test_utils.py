@@ -1,7 +1,13 @@
 import os
 
-from infrahub.utils import get_fixtures_dir
+from infrahub.utils import chunks, get_fixtures_dir
 
 
 def test_get_fixtures_dir():
     assert os.path.exists(get_fixtures_dir())
+
+
+def test_chunks():
+    assert list(chunks([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+    assert list(chunks([1, 2], 5)) == [[1, 2]]
+    assert list(chunks([], 3)) == []
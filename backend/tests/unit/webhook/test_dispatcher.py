@@ -0,0 +1,85 @@
+from typing import Any, Dict, List
+
+import ujson
+from pytest_httpx import HTTPXMock
+
+from infrahub import config
+from infrahub.services import InfrahubServices
+from infrahub.webhook import WebhookDispatcher
+from infrahub.webhook.dispatcher import WEBHOOK_VERSION_KEY
+from tests.adapters.cache import MemoryCache
+
+
+async def test_get_webhooks_reload_on_new_version():
+    cache = MemoryCache()
+    service = InfrahubServices(cache=cache)
+    dispatcher = WebhookDispatcher()
+
+    await cache.set(key="webhook:active:abc", value=ujson.dumps({"webhook_type": "custom"}))
+    await cache.set(key=WEBHOOK_VERSION_KEY, value="v1")
+    assert await dispatcher.get_webhooks(service=service) == {"abc": {"webhook_type": "custom"}}
+
+    # The webhooks are not reloaded as long as the version is the same
+    await cache.set(key="webhook:active:def", value=ujson.dumps({"webhook_type": "standard"}))
+    assert list(await dispatcher.get_webhooks(service=service)) == ["abc"]
+
+    await cache.set(key=WEBHOOK_VERSION_KEY, value="v2")
+    assert await dispatcher.get_webhook(service=service, webhook_id="def") == {"webhook_type": "standard"}
+
+
+async def test_post_retry_transient_error(httpx_mock: HTTPXMock, monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.webhook, "retry_backoff", 0)
+    httpx_mock.add_response(method="POST", url="http://webhook.example/hook", status_code=503)
+    httpx_mock.add_response(method="POST", url="http://webhook.example/hook", json={"ok": True})
+
+    dispatcher = WebhookDispatcher()
+    response = await dispatcher.post(
+        url="http://webhook.example/hook", payload={"data": 1}, headers={}, verify=True, webhook_type="CustomWebhook"
+    )
+    assert response.status_code == 200
+    assert len(httpx_mock.get_requests()) == 2
+    assert dispatcher.get_client(url="http://webhook.example/other", verify=True) is dispatcher.get_client(
+        url="http://webhook.example/hook", verify=True
+    )
+    await dispatcher.close()
+
+
+async def test_add_event_batch(monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.webhook, "batch_size", 2)
+    flushed: List[tuple[str, List[Dict[str, Any]]]] = []
+
+    async def flush(webhook_id: str, events: List[Dict[str, Any]]) -> None:
+        flushed.append((webhook_id, events))
+
+    dispatcher = WebhookDispatcher()
+    await dispatcher.add_event(webhook_id="abc", event={"event_type": "a"}, flush=flush)
+    assert not flushed
+    await dispatcher.add_event(webhook_id="abc", event={"event_type": "b"}, flush=flush)
+    assert flushed == [("abc", [{"event_type": "a"}, {"event_type": "b"}])]
+    await dispatcher.close()
+
+
+async def test_close_flush_pending_batches(monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.webhook, "batch_size", 10)
+    monkeypatch.setattr(config.SETTINGS.webhook, "batch_interval", 60)
+    flushed: List[tuple[str, List[Dict[str, Any]]]] = []
+
+    async def flush(webhook_id: str, events: List[Dict[str, Any]]) -> None:
+        flushed.append((webhook_id, events))
+
+    dispatcher = WebhookDispatcher()
+    await dispatcher.add_event(webhook_id="abc", event={"event_type": "a"}, flush=flush)
+    await dispatcher.add_event(webhook_id="def", event={"event_type": "b"}, flush=flush)
+    assert not flushed
+
+    await dispatcher.close()
+    assert flushed == [("abc", [{"event_type": "a"}]), ("def", [{"event_type": "b"}])]
+
+
+def test_is_batched(monkeypatch):
+    assert not WebhookDispatcher.is_batched(webhook={"webhook_type": "standard"})
+
+    monkeypatch.setattr(config.SETTINGS.webhook, "batch_size", 2)
+    assert WebhookDispatcher.is_batched(webhook={"webhook_type": "standard"})
+    assert WebhookDispatcher.is_batched(webhook={"webhook_type": "custom"})
+    assert not WebhookDispatcher.is_batched(webhook={"webhook_type": "transform"})
@@ -0,0 +1,34 @@
+from infrahub.core.constants import InfrahubKind
+from infrahub.git.repository import InfrahubRepository
+from infrahub.services import InfrahubServices
+from infrahub.webhook import webhook_dispatcher
+from infrahub.webhook.models import TransformWebhook
+
+
+async def test_transform_webhook_repositories_dropped_on_refresh(monkeypatch):
+    async def init(cls, id: str, name: str):  # pylint: disable=redefined-builtin
+        return object()
+
+    monkeypatch.setattr(InfrahubRepository, "init", classmethod(init))
+    webhook_dispatcher.set_webhooks(webhooks={}, version="v1")
+
+    webhook = TransformWebhook(
+        service=InfrahubServices(),
+        url="http://webhook.example/hook",
+        event_type="InfraDevice.updated",
+        data={},
+        validate_certificates=True,
+        repository_id="repo-id",
+        repository_name="repo",
+        repository_kind=InfrahubKind.REPOSITORY,
+        transform_name="transform",
+        transform_class="Transform",
+        transform_file="transform.py",
+    )
+    repo = await webhook._get_repository()
+    assert await webhook._get_repository() is repo
+
+    # A new webhook configuration drops the repositories loaded for the previous one
+    webhook_dispatcher.set_webhooks(webhooks={}, version="v2")
+    assert await webhook._get_repository() is not repo
+    assert len(TransformWebhook._repositories) == 1
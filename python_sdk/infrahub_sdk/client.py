@@ -3,9 +3,27 @@ from __future__ import annotations
 import asyncio
 import copy
 import logging
+import math
+from collections import deque
 from functools import wraps
 from time import sleep
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, MutableMapping, Optional, Type, TypedDict, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    TypedDict,
+    Union,
+)
 
 import httpx
 import ujson
@@ -37,7 +55,7 @@ from infrahub_sdk.node import (
 from infrahub_sdk.object_store import ObjectStore, ObjectStoreSync
 from infrahub_sdk.queries import get_commit_update_mutation
 from infrahub_sdk.query_groups import InfrahubGroupContext, InfrahubGroupContextSync
-from infrahub_sdk.schema import InfrahubSchema, InfrahubSchemaSync, NodeSchema
+from infrahub_sdk.schema import InfrahubSchema, InfrahubSchemaSync, MainSchemaTypes, NodeSchema
 from infrahub_sdk.store import NodeStore, NodeStoreSync
 from infrahub_sdk.timestamp import Timestamp
 from infrahub_sdk.types import AsyncRequester, HTTPMethod, SyncRequester
@@ -157,6 +175,26 @@ class BaseClient:
     def _initialize(self) -> None:
         """Sets the properties for each version of the client"""
 
+    def _get_http_client_params(
+        self, transport_class: Union[Type[httpx.HTTPTransport], Type[httpx.AsyncHTTPTransport]]
+    ) -> Dict[str, Any]:
+        """Return the parameters of the HTTP client used for all the requests of the client."""
+        verify = self.config.tls_ca_file if self.config.tls_ca_file else not self.config.tls_insecure
+        limits = httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+        )
+        params: Dict[str, Any] = {"verify": verify, "limits": limits, "http2": self.config.http2}
+        if self.config.proxy:
+            params["proxy"] = self.config.proxy
+        elif self.config.proxy_mounts:
+            params["mounts"] = {
+                key: transport_class(proxy=value, verify=verify, limits=limits, http2=self.config.http2)
+                for key, value in self.config.proxy_mounts.dict(by_alias=True).items()
+            }
+
+        return params
+
     def _record(self, response: httpx.Response) -> None:
         self.config.custom_recorder.record(response)
 
@@ -279,7 +317,7 @@ class BaseClient:
         """ % (mutation_definition, mutation_parameters)
 
 
-class InfrahubClient(BaseClient):
+class InfrahubClient(BaseClient):  # noqa: PLR0904
     """GraphQL Client to interact with Infrahub."""
 
     group_context: InfrahubGroupContext
@@ -292,6 +330,9 @@ class InfrahubClient(BaseClient):
         self.concurrent_execution_limit = asyncio.Semaphore(self.max_concurrent_execution)
         self._request_method: AsyncRequester = self.config.requester or self._default_request_method
         self.group_context = InfrahubGroupContext(self)
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._owns_http_client = False
 
     @classmethod
     async def init(
@@ -491,41 +532,21 @@ class InfrahubClient(BaseClient):
         nodes: List[InfrahubNode] = []
         related_nodes: List[InfrahubNode] = []
 
-        has_remaining_items = True
-        page_number = 1
-
-        while has_remaining_items:
-            page_offset = (page_number - 1) * self.pagination_size
-
-            query_data = await InfrahubNode(client=self, schema=schema, branch=branch).generate_query_data(
-                offset=offset or page_offset,
-                limit=limit or self.pagination_size,
-                filters=filters,
-                include=include,
-                exclude=exclude,
-                fragment=fragment,
-                prefetch_relationships=prefetch_relationships,
-                partial_match=partial_match,
-            )
-            query = Query(query=query_data)
-            response = await self.execute_graphql(
-                query=query.render(),
-                branch_name=branch,
-                at=at,
-                tracker=f"query-{str(schema.kind).lower()}-page{page_number}",
-            )
-
-            process_result: ProcessRelationsNode = await self._process_nodes_and_relationships(
-                response=response, schema_kind=schema.kind, branch=branch, prefetch_relationships=prefetch_relationships
-            )
-            nodes.extend(process_result["nodes"])
-            related_nodes.extend(process_result["related_nodes"])
-
-            remaining_items = response[schema.kind].get("count", 0) - (page_offset + self.pagination_size)
-            if remaining_items < 0 or offset is not None or limit is not None:
-                has_remaining_items = False
-
-            page_number += 1
+        async for page in self._get_pages(
+            schema=schema,
+            branch=branch,
+            at=at,
+            offset=offset,
+            limit=limit,
+            filters=filters,
+            include=include,
+            exclude=exclude,
+            fragment=fragment,
+            prefetch_relationships=prefetch_relationships,
+            partial_match=partial_match,
+        ):
+            nodes.extend(page["nodes"])
+            related_nodes.extend(page["related_nodes"])
 
         if populate_store:
             for node in nodes:
@@ -538,9 +559,160 @@ class InfrahubClient(BaseClient):
 
         return nodes
 
+    async def filters_iter(
+        self,
+        kind: str,
+        at: Optional[Timestamp] = None,
+        branch: Optional[str] = None,
+        populate_store: bool = False,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        fragment: bool = False,
+        prefetch_relationships: bool = False,
+        partial_match: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[List[InfrahubNode]]:
+        """Retrieve nodes of a given kind based on provided filters and return them page by page.
+
+        Unlike filters, the nodes are not accumulated in memory, each page is returned as soon as it's available.
+
+        Args:
+            kind (str): kind of the nodes to query
+            at (Timestamp, optional): Time of the query. Defaults to Now.
+            branch (str, optional): Name of the branch to query from. Defaults to default_branch.
+            populate_store (bool, optional): Flag to indicate whether to populate the store with the retrieved nodes.
+            include (List[str], optional): List of attributes or relationships to include in the query.
+            exclude (List[str], optional): List of attributes or relationships to exclude from the query.
+            fragment (bool, optional): Flag to use GraphQL fragments for generic schemas.
+            prefetch_relationships (bool, optional): Flag to indicate whether to prefetch related node data.
+            partial_match (bool, optional): Allow partial match of filter criteria for the query.
+            **kwargs (Any): Additional filter criteria for the query.
+
+        Returns:
+            AsyncIterator[List[InfrahubNode]]: The nodes that match the given filters, one list per page.
+        """
+        schema = await self.schema.get(kind=kind)
+
+        branch = branch or self.default_branch
+        if at:
+            at = Timestamp(at)
+
+        filters = kwargs
+        if filters:
+            InfrahubNode(client=self, schema=schema, branch=branch).validate_filters(filters=filters)
+
+        async for page in self._get_pages(
+            schema=schema,
+            branch=branch,
+            at=at,
+            filters=filters,
+            include=include,
+            exclude=exclude,
+            fragment=fragment,
+            prefetch_relationships=prefetch_relationships,
+            partial_match=partial_match,
+        ):
+            if populate_store:
+                for node in page["nodes"] + page["related_nodes"]:
+                    if node.id:
+                        self.store.set(key=node.id, node=node)
+            yield page["nodes"]
+
+    async def _get_page(
+        self,
+        schema: MainSchemaTypes,
+        branch: str,
+        at: Optional[Timestamp],
+        page_number: int,
+        offset: int,
+        limit: int,
+        query_options: Dict[str, Any],
+    ) -> Tuple[ProcessRelationsNode, int]:
+        """Query a single page of nodes and return the nodes along with the total number of nodes matching the query."""
+        query_data = await InfrahubNode(client=self, schema=schema, branch=branch).generate_query_data(
+            offset=offset, limit=limit, **query_options
+        )
+        query = Query(query=query_data)
+        response = await self.execute_graphql(
+            query=query.render(),
+            branch_name=branch,
+            at=at,
+            tracker=f"query-{str(schema.kind).lower()}-page{page_number}",
+        )
+
+        process_result: ProcessRelationsNode = await self._process_nodes_and_relationships(
+            response=response,
+            schema_kind=schema.kind,
+            branch=branch,
+            prefetch_relationships=query_options["prefetch_relationships"],
+        )
+        return process_result, response[schema.kind].get("count", 0)
+
+    async def _get_pages(
+        self,
+        schema: MainSchemaTypes,
+        branch: str,
+        at: Optional[Timestamp],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        **query_options: Any,
+    ) -> AsyncIterator[ProcessRelationsNode]:
+        """Query all the pages of nodes matching a query and return them in order.
+
+        The number of pages is calculated from the count returned with the first page, the following pages
+        are then queried concurrently, up to `pagination_concurrency` pages at a time.
+        """
+        first_page, count = await self._get_page(
+            schema=schema,
+            branch=branch,
+            at=at,
+            page_number=1,
+            offset=offset or 0,
+            limit=limit or self.pagination_size,
+            query_options=query_options,
+        )
+        yield first_page
+
+        if offset is not None or limit is not None:
+            return
+
+        nbr_pages = math.ceil(count / self.pagination_size)
+        pending: Deque[asyncio.Task] = deque()
+        next_page_number = 2
+        try:
+            while pending or next_page_number <= nbr_pages:
+                while next_page_number <= nbr_pages and len(pending) < self.config.pagination_concurrency:
+                    pending.append(
+                        asyncio.create_task(
+                            self._get_page(
+                                schema=schema,
+                                branch=branch,
+                                at=at,
+                                page_number=next_page_number,
+                                offset=(next_page_number - 1) * self.pagination_size,
+                                limit=self.pagination_size,
+                                query_options=query_options,
+                            )
+                        )
+                    )
+                    next_page_number += 1
+
+                page, _ = await pending.popleft()
+                yield page
+        finally:
+            for task in pending:
+                task.cancel()
+
     def clone(self) -> InfrahubClient:
-        """Return a cloned version of the client using the same configuration"""
-        return InfrahubClient(config=self.config)
+        """Return a cloned version of the client using the same configuration
+
+        The connections already opened by the client are shared with the clone.
+        """
+        client = InfrahubClient(config=self.config)
+        if self._http_client and not self._http_client.is_closed:
+            client._http_client = self._http_client
+            client._http_client_loop = self._http_client_loop
+        return client
 
     async def execute_graphql(
         self,
@@ -674,6 +846,21 @@ class InfrahubClient(BaseClient):
         self._record(response)
         return response
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client used for all the requests, the connections are kept open and reused between requests.
+
+        The connections are bound to the event loop that opened them, a new client is created if the loop has changed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client.is_closed or self._http_client_loop is not loop:
+            self._http_client = httpx.AsyncClient(
+                **self._get_http_client_params(transport_class=httpx.AsyncHTTPTransport)
+            )
+            self._http_client_loop = loop
+            self._owns_http_client = True
+
+        return self._http_client
+
     async def _default_request_method(
         self,
         url: str,
@@ -686,34 +873,29 @@ class InfrahubClient(BaseClient):
         if payload:
             params["json"] = payload
 
-        proxy_config: Dict[str, Union[str, Dict[str, httpx.HTTPTransport]]] = {}
-        if self.config.proxy:
-            proxy_config["proxy"] = self.config.proxy
-        elif self.config.proxy_mounts:
-            proxy_config["mounts"] = {
-                key: httpx.HTTPTransport(proxy=value)
-                for key, value in self.config.proxy_mounts.dict(by_alias=True).items()
-            }
-
-        async with httpx.AsyncClient(
-            **proxy_config,  # type: ignore[arg-type]
-            verify=self.config.tls_ca_file if self.config.tls_ca_file else not self.config.tls_insecure,
-        ) as client:
-            try:
-                response = await client.request(
-                    method=method.value,
-                    url=url,
-                    headers=headers,
-                    timeout=timeout,
-                    **params,
-                )
-            except httpx.NetworkError as exc:
-                raise ServerNotReachableError(address=self.address) from exc
-            except httpx.ReadTimeout as exc:
-                raise ServerNotResponsiveError(url=url, timeout=timeout) from exc
+        try:
+            response = await self._get_http_client().request(
+                method=method.value,
+                url=url,
+                headers=headers,
+                timeout=timeout,
+                **params,
+            )
+        except httpx.NetworkError as exc:
+            raise ServerNotReachableError(address=self.address) from exc
+        except httpx.ReadTimeout as exc:
+            raise ServerNotResponsiveError(url=url, timeout=timeout) from exc
 
         return response
 
+    async def close(self) -> None:
+        """Close the connections opened by the client, new connections will be opened by the next request."""
+        if self._http_client and self._owns_http_client and self._http_client_loop is asyncio.get_running_loop():
+            await self._http_client.aclose()
+        self._http_client = None
+        self._http_client_loop = None
+        self._owns_http_client = False
+
     async def refresh_login(self) -> None:
         if not self.refresh_token:
             return
@@ -1020,6 +1202,8 @@ class InfrahubClient(BaseClient):
         return True
 
     async def __aenter__(self) -> Self:
+        if not self.config.requester:
+            self._get_http_client()
         return self
 
     async def __aexit__(
@@ -1032,9 +1216,10 @@ class InfrahubClient(BaseClient):
             await self.group_context.update_group()
 
         self.mode = InfrahubClientMode.DEFAULT
+        await self.close()
 
 
-class InfrahubClientSync(BaseClient):
+class InfrahubClientSync(BaseClient):  # noqa: PLR0904
     group_context: InfrahubGroupContextSync
 
     def _initialize(self) -> None:
@@ -1044,6 +1229,8 @@ class InfrahubClientSync(BaseClient):
         self.store = NodeStoreSync()
         self._request_method: SyncRequester = self.config.sync_requester or self._default_request_method
         self.group_context = InfrahubGroupContextSync(self)
+        self._http_client: Optional[httpx.Client] = None
+        self._owns_http_client = False
 
     @classmethod
     def init(
@@ -1079,8 +1266,14 @@ class InfrahubClientSync(BaseClient):
         raise NotImplementedError("This method hasn't been implemented in the sync client yet.")
 
     def clone(self) -> InfrahubClientSync:
-        """Return a cloned version of the client using the same configuration"""
-        return InfrahubClientSync(config=self.config)
+        """Return a cloned version of the client using the same configuration
+
+        The connections already opened by the client are shared with the clone.
+        """
+        client = InfrahubClientSync(config=self.config)
+        if self._http_client and not self._http_client.is_closed:
+            client._http_client = self._http_client
+        return client
 
     def execute_graphql(
         self,
@@ -1281,41 +1474,21 @@ class InfrahubClientSync(BaseClient):
         nodes: List[InfrahubNodeSync] = []
         related_nodes: List[InfrahubNodeSync] = []
 
-        has_remaining_items = True
-        page_number = 1
-
-        while has_remaining_items:
-            page_offset = (page_number - 1) * self.pagination_size
-
-            query_data = InfrahubNodeSync(client=self, schema=schema, branch=branch).generate_query_data(
-                offset=offset or page_offset,
-                limit=limit or self.pagination_size,
-                filters=filters,
-                include=include,
-                exclude=exclude,
-                fragment=fragment,
-                prefetch_relationships=prefetch_relationships,
-                partial_match=partial_match,
-            )
-            query = Query(query=query_data)
-            response = self.execute_graphql(
-                query=query.render(),
-                branch_name=branch,
-                at=at,
-                tracker=f"query-{str(schema.kind).lower()}-page{page_number}",
-            )
-
-            process_result: ProcessRelationsNodeSync = self._process_nodes_and_relationships(
-                response=response, schema_kind=schema.kind, branch=branch, prefetch_relationships=prefetch_relationships
-            )
-            nodes.extend(process_result["nodes"])
-            related_nodes.extend(process_result["related_nodes"])
-
-            remaining_items = response[schema.kind].get("count", 0) - (page_offset + self.pagination_size)
-            if remaining_items < 0 or offset is not None or limit is not None:
-                has_remaining_items = False
-
-            page_number += 1
+        for page in self._get_pages(
+            schema=schema,
+            branch=branch,
+            at=at,
+            offset=offset,
+            limit=limit,
+            filters=filters,
+            include=include,
+            exclude=exclude,
+            fragment=fragment,
+            prefetch_relationships=prefetch_relationships,
+            partial_match=partial_match,
+        ):
+            nodes.extend(page["nodes"])
+            related_nodes.extend(page["related_nodes"])
 
         if populate_store:
             for node in nodes:
@@ -1328,6 +1501,135 @@ class InfrahubClientSync(BaseClient):
 
         return nodes
 
+    def filters_iter(
+        self,
+        kind: str,
+        at: Optional[Timestamp] = None,
+        branch: Optional[str] = None,
+        populate_store: bool = False,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        fragment: bool = False,
+        prefetch_relationships: bool = False,
+        partial_match: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[List[InfrahubNodeSync]]:
+        """Retrieve nodes of a given kind based on provided filters and return them page by page.
+
+        Unlike filters, the nodes are not accumulated in memory, each page is returned as soon as it's available.
+
+        Args:
+            kind (str): kind of the nodes to query
+            at (Timestamp, optional): Time of the query. Defaults to Now.
+            branch (str, optional): Name of the branch to query from. Defaults to default_branch.
+            populate_store (bool, optional): Flag to indicate whether to populate the store with the retrieved nodes.
+            include (List[str], optional): List of attributes or relationships to include in the query.
+            exclude (List[str], optional): List of attributes or relationships to exclude from the query.
+            fragment (bool, optional): Flag to use GraphQL fragments for generic schemas.
+            prefetch_relationships (bool, optional): Flag to indicate whether to prefetch related node data.
+            partial_match (bool, optional): Allow partial match of filter criteria for the query.
+            **kwargs (Any): Additional filter criteria for the query.
+
+        Returns:
+            Iterator[List[InfrahubNodeSync]]: The nodes that match the given filters, one list per page.
+        """
+        schema = self.schema.get(kind=kind)
+
+        branch = branch or self.default_branch
+        if at:
+            at = Timestamp(at)
+
+        filters = kwargs
+        if filters:
+            InfrahubNodeSync(client=self, schema=schema, branch=branch).validate_filters(filters=filters)
+
+        for page in self._get_pages(
+            schema=schema,
+            branch=branch,
+            at=at,
+            filters=filters,
+            include=include,
+            exclude=exclude,
+            fragment=fragment,
+            prefetch_relationships=prefetch_relationships,
+            partial_match=partial_match,
+        ):
+            if populate_store:
+                for node in page["nodes"] + page["related_nodes"]:
+                    if node.id:
+                        self.store.set(key=node.id, node=node)
+            yield page["nodes"]
+
+    def _get_page(
+        self,
+        schema: MainSchemaTypes,
+        branch: str,
+        at: Optional[Timestamp],
+        page_number: int,
+        offset: int,
+        limit: int,
+        query_options: Dict[str, Any],
+    ) -> Tuple[ProcessRelationsNodeSync, int]:
+        """Query a single page of nodes and return the nodes along with the total number of nodes matching the query."""
+        query_data = InfrahubNodeSync(client=self, schema=schema, branch=branch).generate_query_data(
+            offset=offset, limit=limit, **query_options
+        )
+        query = Query(query=query_data)
+        response = self.execute_graphql(
+            query=query.render(),
+            branch_name=branch,
+            at=at,
+            tracker=f"query-{str(schema.kind).lower()}-page{page_number}",
+        )
+
+        process_result: ProcessRelationsNodeSync = self._process_nodes_and_relationships(
+            response=response,
+            schema_kind=schema.kind,
+            branch=branch,
+            prefetch_relationships=query_options["prefetch_relationships"],
+        )
+        return process_result, response[schema.kind].get("count", 0)
+
+    def _get_pages(
+        self,
+        schema: MainSchemaTypes,
+        branch: str,
+        at: Optional[Timestamp],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        **query_options: Any,
+    ) -> Iterator[ProcessRelationsNodeSync]:
+        """Query all the pages of nodes matching a query and return them in order.
+
+        The number of pages is calculated from the count returned with the first page,
+        the pages are queried one after another with the sync client.
+        """
+        first_page, count = self._get_page(
+            schema=schema,
+            branch=branch,
+            at=at,
+            page_number=1,
+            offset=offset or 0,
+            limit=limit or self.pagination_size,
+            query_options=query_options,
+        )
+        yield first_page
+
+        if offset is not None or limit is not None:
+            return
+
+        for page_number in range(2, math.ceil(count / self.pagination_size) + 1):
+            page, _ = self._get_page(
+                schema=schema,
+                branch=branch,
+                at=at,
+                page_number=page_number,
+                offset=(page_number - 1) * self.pagination_size,
+                limit=self.pagination_size,
+                query_options=query_options,
+            )
+            yield page
+
     def get(
         self,
         kind: str,
@@ -1640,6 +1942,14 @@ class InfrahubClientSync(BaseClient):
         self._record(response)
         return response
 
+    def _get_http_client(self) -> httpx.Client:
+        """Return the HTTP client used for all the requests, the connections are kept open and reused between requests."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.Client(**self._get_http_client_params(transport_class=httpx.HTTPTransport))
+            self._owns_http_client = True
+
+        return self._http_client
+
     def _default_request_method(
         self,
         url: str,
@@ -1652,34 +1962,28 @@ class InfrahubClientSync(BaseClient):
         if payload:
             params["json"] = payload
 
-        proxy_config: Dict[str, Union[str, Dict[str, httpx.HTTPTransport]]] = {}
-        if self.config.proxy:
-            proxy_config["proxy"] = self.config.proxy
-        elif self.config.proxy_mounts:
-            proxy_config["mounts"] = {
-                key: httpx.HTTPTransport(proxy=value)
-                for key, value in self.config.proxy_mounts.dict(by_alias=True).items()
-            }
-
-        with httpx.Client(
-            **proxy_config,  # type: ignore[arg-type]
-            verify=self.config.tls_ca_file if self.config.tls_ca_file else not self.config.tls_insecure,
-        ) as client:
-            try:
-                response = client.request(
-                    method=method.value,
-                    url=url,
-                    headers=headers,
-                    timeout=timeout,
-                    **params,
-                )
-            except httpx.NetworkError as exc:
-                raise ServerNotReachableError(address=self.address) from exc
-            except httpx.ReadTimeout as exc:
-                raise ServerNotResponsiveError(url=url, timeout=timeout) from exc
+        try:
+            response = self._get_http_client().request(
+                method=method.value,
+                url=url,
+                headers=headers,
+                timeout=timeout,
+                **params,
+            )
+        except httpx.NetworkError as exc:
+            raise ServerNotReachableError(address=self.address) from exc
+        except httpx.ReadTimeout as exc:
+            raise ServerNotResponsiveError(url=url, timeout=timeout) from exc
 
         return response
 
+    def close(self) -> None:
+        """Close the connections opened by the client, new connections will be opened by the next request."""
+        if self._http_client and self._owns_http_client:
+            self._http_client.close()
+        self._http_client = None
+        self._owns_http_client = False
+
     def refresh_login(self) -> None:
         if not self.refresh_token:
             return
@@ -1733,6 +2037,8 @@ class InfrahubClientSync(BaseClient):
         self.headers["Authorization"] = f"Bearer {self.access_token}"
 
     def __enter__(self) -> Self:
+        if not self.config.sync_requester:
+            self._get_http_client()
         return self
 
     def __exit__(
@@ -1745,3 +2051,4 @@ class InfrahubClientSync(BaseClient):
             self.group_context.update_group()
 
         self.mode = InfrahubClientMode.DEFAULT
+        self.close()
@@ -49,9 +49,23 @@ class ConfigBase(pydantic.BaseSettings):
     max_concurrent_execution: int = pydantic.Field(default=5, description="Max concurrent execution in batch mode")
     mode: InfrahubClientMode = pydantic.Field(InfrahubClientMode.DEFAULT, description="Default mode for the client")
     pagination_size: int = pydantic.Field(default=50, description="Page size for queries to the server")
+    pagination_concurrency: int = pydantic.Field(
+        default=1,
+        ge=1,
+        description="Number of pages queried concurrently by the async client when retrieving multiple pages of nodes",
+    )
     retry_delay: int = pydantic.Field(default=5, description="Number of seconds to wait until attempting a retry.")
     retry_on_failure: bool = pydantic.Field(default=False, description="Retry operation in case of failure")
     timeout: int = pydantic.Field(default=10, description="Default connection timeout in seconds")
+    http2: bool = pydantic.Field(
+        default=False, description="Use HTTP/2 to connect to Infrahub, requires the httpx[http2] extra to be installed"
+    )
+    max_connections: int = pydantic.Field(
+        default=100, description="Maximum number of concurrent connections opened by the client"
+    )
+    max_keepalive_connections: int = pydantic.Field(
+        default=20, description="Maximum number of idle connections kept open by the client to be reused"
+    )
     transport: RequesterTransport = pydantic.Field(
         default=RequesterTransport.HTTPX,
         description="Set an alternate transport using a predefined option",
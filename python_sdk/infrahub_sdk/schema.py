@@ -453,9 +453,44 @@ MainSchemaTypes: TypeAlias = Union[NodeSchema, GenericSchema, ProfileSchema]
 
 
 class InfrahubSchemaBase:
+    _fetched_schemas: Dict[str, Tuple[str, MutableMapping[str, MainSchemaTypes]]]
+
     def validate(self, data: dict[str, Any]) -> None:
         SchemaRoot(**data)
 
+    def _get_fetch_headers(self, url: str) -> Dict[str, str]:
+        """Send back the ETag of the schema already fetched from this URL, the server won't send it again if it hasn't changed."""
+        if url not in self._fetched_schemas:
+            return {}
+        return {"If-None-Match": self._fetched_schemas[url][0]}
+
+    def _process_fetch_response(self, url: str, response: httpx.Response) -> MutableMapping[str, MainSchemaTypes]:
+        if response.status_code == httpx.codes.NOT_MODIFIED and url in self._fetched_schemas:
+            return dict(self._fetched_schemas[url][1])
+
+        response.raise_for_status()
+
+        data: MutableMapping[str, Any] = response.json()
+
+        nodes: MutableMapping[str, MainSchemaTypes] = {}
+        for node_schema in data.get("nodes", []):
+            node = NodeSchema(**node_schema)
+            nodes[node.kind] = node
+
+        for generic_schema in data.get("generics", []):
+            generic = GenericSchema(**generic_schema)
+            nodes[generic.kind] = generic
+
+        for profile_schema in data.get("profiles", []):
+            profile = ProfileSchema(**profile_schema)
+            nodes[profile.kind] = profile
+
+        etag = response.headers.get("etag")
+        if etag:
+            self._fetched_schemas[url] = (etag, dict(nodes))
+
+        return nodes
+
     def validate_data_against_schema(self, schema: MainSchemaTypes, data: dict) -> None:
         for key in data.keys():
             if key not in schema.relationship_names + schema.attribute_names:
@@ -524,6 +559,7 @@ class InfrahubSchema(InfrahubSchemaBase):
     def __init__(self, client: InfrahubClient):
         self.client = client
         self.cache: dict = defaultdict(lambda: dict)
+        self._fetched_schemas = {}
 
     async def get(self, kind: str, branch: Optional[str] = None, refresh: bool = False) -> MainSchemaTypes:
         branch = branch or self.client.default_branch
@@ -721,31 +757,16 @@ class InfrahubSchema(InfrahubSchemaBase):
         query_params = urlencode(url_parts)
         url = f"{self.client.address}/api/schema/?{query_params}"
 
-        response = await self.client._get(url=url)
-        response.raise_for_status()
+        response = await self.client._get(url=url, headers=self._get_fetch_headers(url=url))
 
-        data: MutableMapping[str, Any] = response.json()
-
-        nodes: MutableMapping[str, MainSchemaTypes] = {}
-        for node_schema in data.get("nodes", []):
-            node = NodeSchema(**node_schema)
-            nodes[node.kind] = node
-
-        for generic_schema in data.get("generics", []):
-            generic = GenericSchema(**generic_schema)
-            nodes[generic.kind] = generic
-
-        for profile_schema in data.get("profiles", []):
-            profile = ProfileSchema(**profile_schema)
-            nodes[profile.kind] = profile
-
-        return nodes
+        return self._process_fetch_response(url=url, response=response)
 
 
 class InfrahubSchemaSync(InfrahubSchemaBase):
     def __init__(self, client: InfrahubClientSync):
         self.client = client
         self.cache: dict = defaultdict(lambda: dict)
+        self._fetched_schemas = {}
 
     def all(
         self, branch: Optional[str] = None, refresh: bool = False, namespaces: Optional[List[str]] = None
@@ -914,25 +935,9 @@ class InfrahubSchemaSync(InfrahubSchemaBase):
         query_params = urlencode(url_parts)
         url = f"{self.client.address}/api/schema/?{query_params}"
 
-        response = self.client._get(url=url)
-        response.raise_for_status()
-
-        data: MutableMapping[str, Any] = response.json()
-
-        nodes: MutableMapping[str, MainSchemaTypes] = {}
-        for node_schema in data.get("nodes", []):
-            node = NodeSchema(**node_schema)
-            nodes[node.kind] = node
-
-        for generic_schema in data.get("generics", []):
-            generic = GenericSchema(**generic_schema)
-            nodes[generic.kind] = generic
-
-        for profile_schema in data.get("profiles", []):
-            profile = ProfileSchema(**profile_schema)
-            nodes[profile.kind] = profile
+        response = self.client._get(url=url, headers=self._get_fetch_headers(url=url))
 
-        return nodes
+        return self._process_fetch_response(url=url, response=response)
 
     def load(self, schemas: List[dict], branch: Optional[str] = None) -> SchemaLoadResponse:
         branch = branch or self.client.default_branch
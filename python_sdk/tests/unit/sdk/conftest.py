@@ -65,6 +65,7 @@ def replace_async_return_annotation():
             "InfrahubNode": "InfrahubNodeSync",
             "List[InfrahubNode]": "List[InfrahubNodeSync]",
             "Optional[InfrahubNode]": "Optional[InfrahubNodeSync]",
+            "AsyncIterator[List[InfrahubNode]]": "Iterator[List[InfrahubNodeSync]]",
         }
         return replacements.get(annotation) or annotation
 
@@ -95,6 +96,7 @@ def replace_sync_return_annotation() -> str:
             "InfrahubNodeSync": "InfrahubNode",
             "List[InfrahubNodeSync]": "List[InfrahubNode]",
             "Optional[InfrahubNodeSync]": "Optional[InfrahubNode]",
+            "Iterator[List[InfrahubNodeSync]]": "AsyncIterator[List[InfrahubNode]]",
         }
         return replacements.get(annotation) or annotation
 
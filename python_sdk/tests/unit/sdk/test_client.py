@@ -3,7 +3,7 @@ import inspect
 import pytest
 from pytest_httpx import HTTPXMock
 
-from infrahub_sdk import InfrahubClient, InfrahubClientSync
+from infrahub_sdk import Config, InfrahubClient, InfrahubClientSync
 from infrahub_sdk.exceptions import FilterNotFoundError, NodeNotFoundError
 from infrahub_sdk.node import InfrahubNode, InfrahubNodeSync
 
@@ -114,6 +114,31 @@ async def test_method_all_multiple_pages(
     assert len(repos) == 5
 
 
+async def test_method_all_concurrent_pages(clients, mock_query_repository_page1_2, mock_query_repository_page2_2):  # pylint: disable=unused-argument
+    clients.standard.config.pagination_concurrency = 2
+    repos = await clients.standard.all(kind="CoreRepository")
+
+    assert [repo.id for repo in repos] == [
+        "9486cfce-87db-479d-ad73-07d80ba96a0f",
+        "bfae43e8-5ebb-456c-a946-bf64e930710a",
+        "cccccccc-5ebb-456c-a946-bf64e930710a",
+        "dddddddd-87db-479d-ad73-07d80ba96a0f",
+        "eeeeeeee-5ebb-456c-a946-bf64e930710a",
+    ]
+
+
+@pytest.mark.parametrize("client_type", client_types)
+async def test_method_filters_iter(clients, mock_query_repository_page1_2, mock_query_repository_page2_2, client_type):  # pylint: disable=unused-argument
+    if client_type == "standard":
+        pages = [page async for page in clients.standard.filters_iter(kind="CoreRepository", populate_store=True)]
+        assert len(clients.standard.store._store["CoreRepository"]) == 5
+    else:
+        pages = list(clients.sync.filters_iter(kind="CoreRepository", populate_store=True))
+        assert len(clients.sync.store._store["CoreRepository"]) == 5
+
+    assert [len(page) for page in pages] == [3, 2]
+
+
 @pytest.mark.parametrize("client_type", client_types)
 async def test_method_all_single_page(clients, mock_query_repository_page1_1, client_type):  # pylint: disable=unused-argument
     if client_type == "standard":
@@ -436,3 +461,37 @@ async def test_clone(clients, client_type):
         clone = clients.sync.clone()
         assert clone.config == clients.sync.config
         assert isinstance(clone, InfrahubClientSync)
+
+
+async def test_http_client_reused(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(method="POST", json={"data": {"BuiltinTag": {"edges": []}}})
+    httpx_mock.add_response(method="POST", json={"data": {"BuiltinTag": {"edges": []}}})
+
+    async with InfrahubClient(config=Config(address="http://mock", max_connections=5)) as client:
+        http_client = client._get_http_client()
+        await client.execute_graphql(query="query { BuiltinTag { edges { node { id } } } }")
+        clone = client.clone()
+        await clone.execute_graphql(query="query { BuiltinTag { edges { node { id } } } }")
+        assert client._get_http_client() is http_client
+        assert clone._get_http_client() is http_client
+
+        # Closing a clone doesn't close the connections of the original client
+        await clone.close()
+        assert not http_client.is_closed
+
+    assert http_client.is_closed
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_http_client_reused_sync(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(method="POST", json={"data": {"BuiltinTag": {"edges": []}}})
+    httpx_mock.add_response(method="POST", json={"data": {"BuiltinTag": {"edges": []}}})
+
+    with InfrahubClientSync(config=Config(address="http://mock")) as client:
+        http_client = client._get_http_client()
+        client.execute_graphql(query="query { BuiltinTag { edges { node { id } } } }")
+        client.execute_graphql(query="query { BuiltinTag { edges { node { id } } } }")
+        assert client._get_http_client() is http_client
+        assert client.clone()._get_http_client() is http_client
+
+    assert http_client.is_closed
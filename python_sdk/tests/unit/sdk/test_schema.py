@@ -1,6 +1,8 @@
 import inspect
 
 import pytest
+import ujson
+from pytest_httpx import HTTPXMock
 
 from infrahub_sdk import Config, InfrahubClient, InfrahubClientSync, ValidationError
 from infrahub_sdk.exceptions import SchemaNotFoundError
@@ -14,6 +16,7 @@ from infrahub_sdk.schema import (
     InfrahubSchemaSync,
     NodeSchema,
 )
+from infrahub_sdk.utils import get_fixtures_dir
 
 async_schema_methods = [method for method in dir(InfrahubSchema) if not method.startswith("_")]
 sync_schema_methods = [method for method in dir(InfrahubSchemaSync) if not method.startswith("_")]
@@ -56,6 +59,38 @@ async def test_fetch_schema(mock_schema_query_01, client_type):  # pylint: disab
     assert isinstance(nodes["BuiltinTag"], NodeSchema)
 
 
+@pytest.mark.parametrize("client_type", client_types)
+async def test_fetch_schema_not_modified(httpx_mock: HTTPXMock, client_type):
+    response_text = (get_fixtures_dir() / "schema_01.json").read_text(encoding="UTF-8")
+    httpx_mock.add_response(
+        method="GET",
+        url="http://mock/api/schema/?branch=main",
+        match_headers={"If-None-Match": '"hash01"'},
+        status_code=304,
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url="http://mock/api/schema/?branch=main",
+        json=ujson.loads(response_text),
+        headers={"ETag": '"hash01"'},
+    )
+
+    if client_type == "standard":
+        client = await InfrahubClient.init(config=Config(address="http://mock", insert_tracker=True))
+        nodes = await client.schema.fetch(branch="main")
+        cached_nodes = await client.schema.fetch(branch="main")
+    else:
+        client = InfrahubClientSync.init(config=Config(address="http://mock", insert_tracker=True))
+        nodes = client.schema.fetch(branch="main")
+        cached_nodes = client.schema.fetch(branch="main")
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert "If-None-Match" not in httpx_mock.get_requests()[0].headers
+    assert httpx_mock.get_requests()[1].headers["If-None-Match"] == '"hash01"'
+    assert cached_nodes == nodes
+    assert cached_nodes["BuiltinTag"] is nodes["BuiltinTag"]
+
+
 @pytest.mark.parametrize("client_type", client_types)
 async def test_schema_data_validation(rfile_schema, client_type):
     if client_type == "standard":
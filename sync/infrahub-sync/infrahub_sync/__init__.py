@@ -44,6 +44,15 @@ class SyncInstance(SyncConfig):
 
 
 class DiffSyncMixin:
+    # Adapters supporting a changed-since filter only load the objects of a model modified after the time
+    # defined for this model in `changed_since` and update the objects already present in the store with them.
+    # The models without a time are fully loaded.
+    supports_changed_since: bool = False
+    changed_since: Optional[Dict[str, str]] = None
+
+    def get_changed_since(self, model_name: str) -> Optional[str]:
+        return (self.changed_since or {}).get(model_name)
+
     def load(self):
         """Load all the models, one by one based on the order defined in top_level."""
         for item in self.top_level:
@@ -1,9 +1,12 @@
+import asyncio
 import copy
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Coroutine, Dict, List, Mapping, Optional, TypeVar, Union
 
 from infrahub_sdk import (
     Config,
+    InfrahubClient,
     InfrahubClientSync,
+    InfrahubNode,
     InfrahubNodeSync,
     NodeSchema,
     NodeStoreSync,
@@ -20,8 +23,10 @@ try:
 except ImportError:
     from diffsync import DiffSync as DiffSyncAdapter  # type: ignore[no-redef]
 
+T = TypeVar("T")
 
-def update_node(node: InfrahubNodeSync, attrs: dict):
+
+def update_node(node: Union[InfrahubNode, InfrahubNodeSync], attrs: dict):
     for attr_name, attr_value in attrs.items():
         if attr_name in node._schema.attribute_names:
             attr = getattr(node, attr_name)
@@ -55,16 +60,31 @@ class InfrahubAdapter(DiffSyncMixin, DiffSyncAdapter):
         super().__init__(*args, **kwargs)
         self.target = target
         self.config = config
-        if branch:
-            sdk_config = Config(timeout=60, default_branch=branch)
-        else:
-            sdk_config = Config(timeout=60)
 
         if not isinstance(adapter.settings, dict) or "url" not in adapter.settings:
             raise ValueError("url must be specified!")
 
+        sdk_config_params: Dict[str, Any] = {
+            "timeout": 60,
+            "max_concurrent_execution": adapter.settings.get("max_concurrent_execution", 5),
+        }
+        if branch:
+            sdk_config_params["default_branch"] = branch
+        sdk_config = Config(**sdk_config_params)
+
         self.client = InfrahubClientSync(address=adapter.settings["url"], config=sdk_config)
 
+        # In async mode, the models are loaded concurrently and the nodes to create or update are accumulated per kind
+        # and saved together in batches, the async client shares the store of the sync client.
+        self.async_mode = bool(adapter.settings.get("async_mode", False))
+        self.async_client: Optional[InfrahubClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Dict[str, Dict[str, InfrahubNode]] = {}
+        if self.async_mode:
+            self._loop = asyncio.new_event_loop()
+            self.async_client = InfrahubClient(address=adapter.settings["url"], config=sdk_config)
+            self.async_client.store = self.client.store  # type: ignore[assignment]
+
         # We need to identify with an account until we have some auth in place
         remote_account = config.source.name
         try:
@@ -72,8 +92,41 @@ class InfrahubAdapter(DiffSyncMixin, DiffSyncAdapter):
         except NodeNotFoundError:
             self.account = None
 
+    def _run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        return self._loop.run_until_complete(coroutine)
+
+    def load(self):
+        if not self.async_mode:
+            return super().load()
+
+        nodes_per_kind = self._run(
+            self._fetch_models(kinds=[item for item in self.top_level if not hasattr(self, f"load_{item}")])
+        )
+        for item in self.top_level:
+            print(f"Loading {item}")
+            if hasattr(self, f"load_{item}"):
+                method = getattr(self, f"load_{item}")
+                method()
+            else:
+                self._add_nodes(model_name=item, model=getattr(self, item), nodes=nodes_per_kind[item])
+
+        return None
+
+    async def _fetch_models(self, kinds: List[str]) -> Dict[str, List[InfrahubNode]]:
+        async def fetch(kind: str):
+            return kind, await self.async_client.all(kind=kind, populate_store=True)
+
+        batch = await self.async_client.create_batch()
+        for kind in kinds:
+            batch.add(task=fetch, kind=kind)
+
+        return {kind: nodes async for _, (kind, nodes) in batch.execute()}
+
     def model_loader(self, model_name: str, model):
         nodes = self.client.all(kind=model.__name__, populate_store=True)
+        self._add_nodes(model_name=model_name, model=model, nodes=nodes)
+
+    def _add_nodes(self, model_name: str, model, nodes: List[Union[InfrahubNode, InfrahubNodeSync]]):
         print(f"{self.type}: Loading {len(nodes)} {model_name}")
         for node in nodes:
             data = self.infrahub_node_to_diffsync(node)
@@ -81,6 +134,51 @@ class InfrahubAdapter(DiffSyncMixin, DiffSyncAdapter):
             self.client.store.set(key=item.get_unique_id(), node=node)
             self.add(item)
 
+    def add_pending(self, unique_id: str, node: InfrahubNode) -> None:
+        """Register a node to save during the next flush, the nodes are grouped by kind in the order they are added."""
+        self._pending.setdefault(node._schema.kind, {})[unique_id] = node
+
+    def flush_pending(self) -> None:
+        """Save all the pending nodes.
+
+        The kinds are saved one after the other in the order they have been added, which follows the order of the sync,
+        and the nodes of the same kind are saved concurrently.
+        All the nodes of a kind are saved even if some of them fail, the failures are then reported together
+        and the kinds that haven't been saved yet are left aside.
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self._run(self._save_nodes(pending=pending))
+
+    async def _save_nodes(self, pending: Dict[str, Dict[str, InfrahubNode]]) -> None:
+        for kind, nodes in pending.items():
+            print(f"{self.type}: Saving {len(nodes)} {kind}")
+            unique_ids = {id(node): unique_id for unique_id, node in nodes.items()}
+            batch = await self.async_client.create_batch(return_exceptions=True)
+            for node in nodes.values():
+                batch.add(task=node.save, node=node, allow_upsert=True)
+
+            failures = []
+            async for node, result in batch.execute():
+                if isinstance(result, Exception):
+                    failures.append(f"{kind} {unique_ids[id(node)]}: {result}")
+
+            if failures:
+                raise ValueError(f"Unable to save {len(failures)} {kind}:\n" + "\n".join(failures))
+
+    def sync_complete(self, *args, **kwargs):
+        self.flush_pending()
+        return super().sync_complete(*args, **kwargs)
+
+    def close(self) -> None:
+        """Close the async client and its event loop, the nodes still pending are not saved."""
+        if self._loop is None or self._loop.is_closed():
+            return
+        self._pending = {}
+        self._run(self.async_client.close())
+        self._loop.close()
+
     def infrahub_node_to_diffsync(self, node: InfrahubNodeSync) -> dict:
         """Convert an InfrahubNode into a dict that will be used to create a DiffSyncModel."""
         data: Dict[str, Any] = {"local_id": str(node.id)}
@@ -127,6 +225,20 @@ class InfrahubAdapter(DiffSyncMixin, DiffSyncAdapter):
         return data
 
 
+def has_unsaved_peers(attrs: Mapping[Any, Any], store: NodeStoreSync, schema: NodeSchema) -> bool:
+    """Indicate if one of the peers referenced in attrs is still waiting to be saved and doesn't have an id yet."""
+    for rel in schema.relationships:
+        value = attrs.get(rel.name)
+        if value is None:
+            continue
+        keys = list(value) if rel.cardinality == "many" else [value]
+        for key in keys:
+            peer = store.get(key=key, kind=rel.peer, raise_when_missing=False)
+            if peer is not None and not peer.id:
+                return True
+    return False
+
+
 def diffsync_to_infrahub(ids: Mapping[Any, Any], attrs: Mapping[Any, Any], store: NodeStoreSync, schema: NodeSchema):
     data = copy.deepcopy(dict(ids))
     data.update(dict(attrs))
@@ -165,6 +277,8 @@ class InfrahubModel(DiffSyncModelMixin, DiffSyncModel):
             raise ValueError("Either 'diffsync' or 'adapter' must be provided.")
 
         schema = context.client.schema.get(kind=cls.__name__)
+        if context.async_mode and has_unsaved_peers(attrs={**ids, **attrs}, store=context.client.store, schema=schema):
+            context.flush_pending()
         data = diffsync_to_infrahub(ids=ids, attrs=attrs, schema=schema, store=context.client.store)
         unique_id = cls(**ids, **attrs).get_unique_id()
         source_id = None
@@ -173,30 +287,46 @@ class InfrahubModel(DiffSyncModelMixin, DiffSyncModel):
         create_data = context.client.schema.generate_payload_create(
             schema=schema, data=data, source=source_id, is_protected=True
         )
-        node = context.client.create(kind=cls.__name__, data=create_data)
-        node.save(allow_upsert=True)
+        if context.async_mode:
+            node = InfrahubNode(
+                client=context.async_client,
+                schema=schema,
+                branch=context.async_client.default_branch,
+                data=create_data,
+            )
+            context.add_pending(unique_id=unique_id, node=node)
+        else:
+            node = context.client.create(kind=cls.__name__, data=create_data)
+            node.save(allow_upsert=True)
         context.client.store.set(key=unique_id, node=node)
 
-        if diffsync:
+        # An adapter without any element yet is falsy, the first node created in an empty target must be accepted
+        if diffsync is not None:
             return super().create(diffsync, ids=ids, attrs=attrs)
-        if adapter:
-            return super().create(adapter, ids=ids, attrs=attrs)
-        if not (diffsync or adapter):
-            raise ValueError("Either 'diffsync' or 'adapter' must be provided.")
-
-        return None
+        return super().create(adapter, ids=ids, attrs=attrs)
 
     def update(self, attrs):
-        node = None
-
         if hasattr(self, "diffsync"):
-            node = self.diffsync.client.get(id=self.local_id, kind=self.__class__.__name__)
+            context = self.diffsync
         elif hasattr(self, "adapter"):
-            node = self.adapter.client.get(id=self.local_id, kind=self.__class__.__name__)
+            context = self.adapter
         else:
             raise ValueError("Either 'diffsync' or 'adapter' must be provided.")
 
-        node = update_node(node=node, attrs=attrs)
-        node.save(allow_upsert=True)
+        if context.async_mode:
+            unique_id = self.get_unique_id()
+            node = context.client.store.get(key=unique_id, kind=self.__class__.__name__, raise_when_missing=False)
+            if node is None:
+                node = context._run(context.async_client.get(id=self.local_id, kind=self.__class__.__name__))
+                context.client.store.set(key=unique_id, node=node)
+            schema = context.client.schema.get(kind=self.__class__.__name__)
+            if has_unsaved_peers(attrs=attrs, store=context.client.store, schema=schema):
+                context.flush_pending()
+            node = update_node(node=node, attrs=attrs)
+            context.add_pending(unique_id=unique_id, node=node)
+        else:
+            node = context.client.get(id=self.local_id, kind=self.__class__.__name__)
+            node = update_node(node=node, attrs=attrs)
+            node.save(allow_upsert=True)
 
         return super().update(attrs)
@@ -39,6 +39,7 @@ def get_value(obj, name: str):
 
 class NautobotAdapter(DiffSyncMixin, DiffSync):
     type = "Nautobot"
+    supports_changed_since = True
 
     def __init__(self, *args, target: str, adapter: SyncAdapter, config: SyncConfig, **kwargs):
         super().__init__(*args, **kwargs)
@@ -67,8 +68,10 @@ class NautobotAdapter(DiffSyncMixin, DiffSync):
             nautobot_app = getattr(self.client, app_name)
             nautobot_model = getattr(nautobot_app, resource_name)
 
-            count = nautobot_model.count()
-            objs = nautobot_model.filter([])
+            changed_since = self.get_changed_since(model_name=model_name)
+            filters = {"last_updated__gte": changed_since} if changed_since else {}
+            count = nautobot_model.count(**filters)
+            objs = nautobot_model.filter([], **filters)
             if count != len(objs):
                 raise ValueError(
                     f"Nautobot didn't return the expected number of objects. Got {len(objs)} instead of {count}"
@@ -77,7 +80,10 @@ class NautobotAdapter(DiffSyncMixin, DiffSync):
             for obj in objs:
                 data = self.nautobot_obj_to_diffsync(obj=obj, mapping=element, model=model)
                 item = model(**data)
-                self.add(item)
+                if changed_since:
+                    self.update_or_add_model_instance(item)
+                else:
+                    self.add(item)
 
     def nautobot_obj_to_diffsync(self, obj: NautobotRecord, mapping: SchemaMappingModel, model: NautobotModel) -> dict:  # pylint: disable=too-many-branches
         data: Dict[str, Any] = {"local_id": str(obj.id)}
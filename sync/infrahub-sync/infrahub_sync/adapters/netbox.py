@@ -38,6 +38,7 @@ def get_value(obj, name: str):
 
 class NetboxAdapter(DiffSyncMixin, DiffSync):
     type = "Netbox"
+    supports_changed_since = True
 
     def __init__(self, *args, target: str, adapter: SyncAdapter, config: SyncConfig, **kwargs):
         super().__init__(*args, **kwargs)
@@ -66,12 +67,19 @@ class NetboxAdapter(DiffSyncMixin, DiffSync):
             netbox_app = getattr(self.client, app_name)
             netbox_model = getattr(netbox_app, resource_name)
 
-            objs = netbox_model.all()
+            changed_since = self.get_changed_since(model_name=model_name)
+            if changed_since:
+                objs = list(netbox_model.filter(last_updated__gte=changed_since))
+            else:
+                objs = netbox_model.all()
             print(f"{self.type}: Loading {len(objs)} {resource_name}")
             for obj in objs:
                 data = self.netbox_obj_to_diffsync(obj=obj, mapping=element, model=model)
                 item = model(**data)
-                self.add(item)
+                if changed_since:
+                    self.update_or_add_model_instance(item)
+                else:
+                    self.add(item)
 
     def netbox_obj_to_diffsync(self, obj: NetboxRecord, mapping: SchemaMappingModel, model: NetboxModel) -> dict:  # pylint: disable=too-many-branches
         data: Dict[str, Any] = {"local_id": str(obj.id)}
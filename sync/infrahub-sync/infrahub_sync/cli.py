@@ -34,6 +34,9 @@ def diff_cmd(
     directory: str = typer.Option(None, help="Base directory to search for sync configurations"),
     branch: str = typer.Option(default=None, help="Branch to use for the diff."),
     show_progress: bool = typer.Option(default=True, help="Show a progress bar during diff"),
+    incremental: bool = typer.Option(
+        default=False, help="Only compare the objects changed since the last incremental sync"
+    ),
 ):
     """Calculate and print the differences between the source and the destination systems for a given project."""
     if sum([bool(name), bool(config_file)]) != 1:
@@ -43,11 +46,16 @@ def diff_cmd(
     if not sync_instance:
         print_error_and_abort("Failed to load sync instance.")
 
-    ptd = get_potenda_from_instance(sync_instance=sync_instance, branch=branch, show_progress=show_progress)
-    ptd.source_load()
-    ptd.destination_load()
+    ptd = get_potenda_from_instance(
+        sync_instance=sync_instance, branch=branch, show_progress=show_progress, incremental=incremental
+    )
+    try:
+        ptd.source_load()
+        ptd.destination_load()
 
-    mydiff = ptd.diff()
+        mydiff = ptd.diff()
+    finally:
+        ptd.close()
 
     print(mydiff.str())
 
@@ -62,6 +70,10 @@ def sync_cmd(
         default=True, help="Print the differences between the source and the destination before syncing"
     ),
     show_progress: bool = typer.Option(default=True, help="Show a progress bar during syncing"),
+    incremental: bool = typer.Option(
+        default=False,
+        help="Only sync the objects changed since the last incremental sync and resume from the last synced model",
+    ),
 ):
     """Synchronize the data between source and the destination systems for a given project or configuration file."""
     if sum([bool(name), bool(config_file)]) != 1:
@@ -71,21 +83,27 @@ def sync_cmd(
     if not sync_instance:
         print_error_and_abort("Failed to load sync instance.")
 
-    ptd = get_potenda_from_instance(sync_instance=sync_instance, branch=branch, show_progress=show_progress)
-    ptd.source_load()
-    ptd.destination_load()
-
-    mydiff = ptd.diff()
-
-    if mydiff.has_diffs():
-        if diff:
-            print(mydiff.str())
-        start_synctime = timer()
-        ptd.sync(diff=mydiff)
-        end_synctime = timer()
-        console.print(f"Sync: Completed in {end_synctime - start_synctime} sec")
-    else:
-        console.print("No diffence found. Nothing to sync")
+    ptd = get_potenda_from_instance(
+        sync_instance=sync_instance, branch=branch, show_progress=show_progress, incremental=incremental
+    )
+    try:
+        ptd.source_load()
+        ptd.destination_load()
+
+        mydiff = ptd.diff()
+
+        if mydiff.has_diffs():
+            if diff:
+                print(mydiff.str())
+            start_synctime = timer()
+            ptd.sync(diff=mydiff)
+            end_synctime = timer()
+            console.print(f"Sync: Completed in {end_synctime - start_synctime} sec")
+        else:
+            console.print("No diffence found. Nothing to sync")
+            ptd.save_snapshot()
+    finally:
+        ptd.close()
 
 
 @app.command(name="generate")
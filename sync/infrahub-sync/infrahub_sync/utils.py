@@ -11,6 +11,7 @@ from diffsync.store.redis import RedisStore
 from infrahub_sync import SyncAdapter, SyncConfig, SyncInstance
 from infrahub_sync.generator import render_template
 from potenda import Potenda
+from potenda.snapshot import SNAPSHOT_FILENAME, SyncSnapshot
 
 
 def render_adapter(
@@ -104,7 +105,10 @@ def get_instance(
 
 
 def get_potenda_from_instance(
-    sync_instance: SyncInstance, branch: Optional[str] = None, show_progress: Optional[bool] = True
+    sync_instance: SyncInstance,
+    branch: Optional[str] = None,
+    show_progress: Optional[bool] = True,
+    incremental: bool = False,
 ) -> Potenda:
     source = import_adapter(sync_instance=sync_instance, adapter=sync_instance.source)
     destination = import_adapter(sync_instance=sync_instance, adapter=sync_instance.destination)
@@ -153,12 +157,17 @@ def get_potenda_from_instance(
             internal_storage_engine=destination_store,
         )
 
+    snapshot = None
+    if incremental:
+        snapshot = SyncSnapshot.load(path=Path(sync_instance.directory) / SNAPSHOT_FILENAME)
+
     ptd = Potenda(
         destination=dst,
         source=src,
         config=sync_instance,
         top_level=sync_instance.order,
         show_progress=show_progress,
+        snapshot=snapshot,
     )
 
     return ptd
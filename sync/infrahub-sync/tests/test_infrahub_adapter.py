@@ -0,0 +1,162 @@
+import asyncio
+from typing import Any, List, Optional
+
+import pytest
+from infrahub_sdk import Config, InfrahubClient, InfrahubClientSync, InfrahubNode, NodeSchema
+
+from infrahub_sync.adapters.infrahub import InfrahubAdapter, InfrahubModel
+
+LOCATION_SCHEMA = NodeSchema(
+    name="Location",
+    namespace="Sync",
+    attributes=[{"name": "name", "kind": "Text", "unique": True}],
+)
+DEVICE_SCHEMA = NodeSchema(
+    name="Device",
+    namespace="Sync",
+    attributes=[
+        {"name": "name", "kind": "Text", "unique": True},
+        {"name": "description", "kind": "Text", "optional": True},
+    ],
+    relationships=[{"name": "location", "peer": "SyncLocation", "cardinality": "one", "optional": True}],
+)
+
+
+class SyncLocation(InfrahubModel):
+    _modelname = "SyncLocation"
+    _identifiers = ("name",)
+    _attributes = ()
+    name: str
+    local_id: Optional[str] = None
+    local_data: Optional[Any] = None
+
+
+class SyncDevice(InfrahubModel):
+    _modelname = "SyncDevice"
+    _identifiers = ("name",)
+    _attributes = ("description", "location")
+    name: str
+    description: Optional[str] = None
+    location: Optional[str] = None
+    local_id: Optional[str] = None
+    local_data: Optional[Any] = None
+
+
+@pytest.fixture
+def saved(monkeypatch) -> List[str]:
+    """Replace the save of the async nodes, the nodes are recorded and get an id once saved."""
+    saved_nodes: List[str] = []
+
+    async def save(self: InfrahubNode, allow_upsert: bool = False) -> None:
+        await asyncio.sleep(0)
+        if self.name.value.startswith("fail"):
+            raise ValueError(f"{self.name.value} is invalid")
+        self.id = f"{self._schema.kind}-{self.name.value}"
+        saved_nodes.append(f"{self._schema.kind} {self.name.value}")
+
+    monkeypatch.setattr(InfrahubNode, "save", save)
+    return saved_nodes
+
+
+class OfflineInfrahubAdapter(InfrahubAdapter):
+    """Infrahub adapter in async mode which doesn't connect to the server to find its account."""
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        super(InfrahubAdapter, self).__init__()
+        sdk_config = Config(timeout=60, max_concurrent_execution=5)
+        self.async_mode = True
+        self.account = None
+        self._pending = {}
+        self._loop = asyncio.new_event_loop()
+        self.client = InfrahubClientSync(address="http://mock", config=sdk_config)
+        self.client.schema.cache["main"] = {schema.kind: schema for schema in (LOCATION_SCHEMA, DEVICE_SCHEMA)}
+        self.async_client = InfrahubClient(address="http://mock", config=sdk_config)
+        self.async_client.store = self.client.store
+
+
+@pytest.fixture
+def adapter():
+    adapter = OfflineInfrahubAdapter()
+    yield adapter
+    adapter.close()
+
+
+def test_flush_pending_order_across_kinds(adapter: InfrahubAdapter, saved: List[str]):
+    SyncLocation.create(adapter=adapter, ids={"name": "paris"}, attrs={})
+    SyncDevice.create(adapter=adapter, ids={"name": "router1"}, attrs={})
+    SyncLocation.create(adapter=adapter, ids={"name": "london"}, attrs={})
+    SyncDevice.create(adapter=adapter, ids={"name": "router2"}, attrs={})
+    assert not saved
+
+    adapter.flush_pending()
+
+    # The kinds are saved in the order they have been added first, the nodes of a kind are saved together
+    assert sorted(saved[:2]) == ["SyncLocation london", "SyncLocation paris"]
+    assert sorted(saved[2:]) == ["SyncDevice router1", "SyncDevice router2"]
+    assert not adapter._pending
+
+
+def test_create_flush_unsaved_peer(adapter: InfrahubAdapter, saved: List[str]):
+    SyncLocation.create(adapter=adapter, ids={"name": "paris"}, attrs={})
+    SyncDevice.create(adapter=adapter, ids={"name": "router0"}, attrs={})
+    assert not saved
+
+    # The location doesn't have an id yet, the pending nodes are saved before the device can reference it
+    SyncDevice.create(adapter=adapter, ids={"name": "router1"}, attrs={"location": "paris"})
+    assert saved == ["SyncLocation paris", "SyncDevice router0"]
+
+    device = adapter.client.store.get(key="router1", kind="SyncDevice")
+    assert device.location.id == "SyncLocation-paris"
+
+    # The peer has been saved already, the device is only added to the pending nodes
+    SyncDevice.create(adapter=adapter, ids={"name": "router2"}, attrs={"location": "paris"})
+    assert saved == ["SyncLocation paris", "SyncDevice router0"]
+    adapter.flush_pending()
+    assert sorted(saved[2:]) == ["SyncDevice router1", "SyncDevice router2"]
+
+
+def test_flush_pending_report_all_failures(adapter: InfrahubAdapter, saved: List[str]):
+    SyncDevice.create(adapter=adapter, ids={"name": "fail1"}, attrs={})
+    SyncDevice.create(adapter=adapter, ids={"name": "router1"}, attrs={})
+    SyncDevice.create(adapter=adapter, ids={"name": "fail2"}, attrs={})
+    SyncLocation.create(adapter=adapter, ids={"name": "paris"}, attrs={})
+
+    with pytest.raises(ValueError) as exc:
+        adapter.flush_pending()
+
+    # All the nodes of the kind are saved before the failures are reported, the next kinds are left aside
+    message = str(exc.value)
+    assert message.startswith("Unable to save 2 SyncDevice:")
+    assert "SyncDevice fail1: fail1 is invalid" in message
+    assert "SyncDevice fail2: fail2 is invalid" in message
+    assert saved == ["SyncDevice router1"]
+    assert not adapter._pending
+
+
+def test_update_node_missing_from_store(adapter: InfrahubAdapter, saved: List[str], monkeypatch):
+    node = InfrahubNode(
+        client=adapter.async_client,
+        schema=DEVICE_SCHEMA,
+        branch="main",
+        data={"id": "SyncDevice-router1", "name": {"value": "router1"}, "description": {"value": "old"}},
+    )
+    fetched = []
+
+    async def get(id: str, kind: str, **kwargs):  # pylint: disable=redefined-builtin
+        fetched.append((id, kind))
+        return node
+
+    monkeypatch.setattr(adapter.async_client, "get", get)
+
+    device = SyncDevice(name="router1", description="old", local_id="SyncDevice-router1")
+    device.adapter = adapter
+    device.update(attrs={"description": "new"})
+
+    # The node isn't in the store, it's fetched once and then kept in the store
+    assert fetched == [("SyncDevice-router1", "SyncDevice")]
+    assert adapter.client.store.get(key="router1", kind="SyncDevice") is node
+    assert node.description.value == "new"
+    assert device.description == "new"
+
+    adapter.flush_pending()
+    assert saved == ["SyncDevice router1"]
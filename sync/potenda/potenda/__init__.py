@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
 from tqdm import tqdm
 
@@ -7,6 +8,7 @@ from diffsync.diff import Diff
 from diffsync.enum import DiffSyncFlags
 from diffsync.logging import enable_console_logging
 from infrahub_sync import SyncInstance
+from potenda.snapshot import SnapshotEntry, SyncSnapshot, get_model_data, get_model_hash
 
 
 class Potenda:
@@ -18,6 +20,7 @@ class Potenda:
         top_level: List[str],
         partition=None,
         show_progress: Optional[bool] = False,
+        snapshot: Optional[SyncSnapshot] = None,
     ):
         self.top_level = top_level
 
@@ -35,6 +38,13 @@ class Potenda:
         enable_console_logging(verbosity=1)
         self.flags = DiffSyncFlags.SKIP_UNMATCHED_DST
 
+        # When a snapshot of the last sync is provided, the run is incremental:
+        # the source is loaded with a changed-since filter if the adapter supports it,
+        # only the objects that changed since the snapshot are diffed and the snapshot is updated after each model.
+        self.snapshot = snapshot
+        self.started_at: Optional[str] = None
+        self.source_entries: Dict[str, Dict[str, SnapshotEntry]] = {}
+
     def _print_callback(self, stage: str, elements_processed: int, total_models: int):
         """Callback for DiffSync using tqdm"""
         if self.show_progress:
@@ -49,8 +59,20 @@ class Potenda:
                 self.progress_bar = None
 
     def source_load(self):
+        self.started_at = datetime.now(timezone.utc).isoformat()
         try:
-            print(f"Load: Importing data from {self.source}")
+            changed_since = {}
+            if self.snapshot and getattr(self.source, "supports_changed_since", False):
+                for model_name in self.top_level:
+                    model_changed_since = self.snapshot.get_changed_since(model_name=model_name)
+                    if model_changed_since:
+                        changed_since[model_name] = model_changed_since
+            if changed_since:
+                print(f"Load: Importing data changed since {self.snapshot.synced_at} from {self.source}")
+                self.restore_snapshot(model_names=list(changed_since))
+                self.source.changed_since = changed_since
+            else:
+                print(f"Load: Importing data from {self.source}")
             self.source.load()
         except Exception as exc:
             raise ValueError(f"An error occurred while loading {self.source}: {str(exc)}") from exc
@@ -69,12 +91,85 @@ class Potenda:
         except Exception as exc:
             raise ValueError(f"An error occurred while loading the sync: {str(exc)}") from exc
 
+    def restore_snapshot(self, model_names: List[str]):
+        """Add the objects of the snapshot to the source, the objects that changed since are updated while loading the source.
+
+        Only the models loaded with a changed-since filter are restored, the other models are fully loaded from the source.
+        """
+        for model_name in model_names:
+            model = getattr(self.source, model_name)
+            for _, data in self.snapshot.get_entries(model_name).values():
+                self.source.add(model(**data))
+
+    def skip_unchanged(self):
+        """Remove from the source the objects identical to the snapshot, the destination objects without a match are ignored.
+
+        The objects of the models with children are always kept, their children are only compared through them.
+        """
+        nbr_unchanged = 0
+        for model_name in self.top_level:
+            entries: Dict[str, SnapshotEntry] = {}
+            unchanged = []
+            for obj in self.source.get_all(model_name):
+                unique_id = obj.get_unique_id()
+                model_hash = get_model_hash(obj)
+                entries[unique_id] = (model_hash, get_model_data(obj))
+                if not self.snapshot.is_changed(model_name=model_name, unique_id=unique_id, model_hash=model_hash):
+                    unchanged.append(obj)
+            self.source_entries[model_name] = entries
+
+            if getattr(self.source, model_name)._children:
+                continue
+            for obj in unchanged:
+                self.source.remove(obj)
+            nbr_unchanged += len(unchanged)
+
+        print(f"Diff: Skipping {nbr_unchanged} objects unchanged since the last sync")
+
     def diff(self) -> Diff:
         print(f"Diff: Comparing data from {self.source} to {self.destination}")
+        if self.snapshot and not self.source_entries:
+            self.skip_unchanged()
         self.progress_bar = None
         return self.destination.diff_from(self.source, flags=self.flags, callback=self._print_callback)
 
     def sync(self, diff: Optional[Diff] = None):
         print(f"Sync: Importing data from {self.source} to {self.destination} based on Diff")
         self.progress_bar = None
-        return self.destination.sync_from(self.source, diff=diff, flags=self.flags, callback=self._print_callback)
+        if not self.snapshot:
+            return self.destination.sync_from(self.source, diff=diff, flags=self.flags, callback=self._print_callback)
+
+        if diff is None:
+            diff = self.diff()
+            self.progress_bar = None
+
+        # Sync the models one by one and record each of them in the snapshot once it's synced
+        # to be able to resume from the last synced model if the sync fails.
+        for model_name in self.top_level:
+            model_diff = Diff()
+            for element in diff.children.get(model_name, {}).values():
+                model_diff.add(element)
+            if model_diff.has_diffs():
+                self.destination.sync_from(
+                    self.source, diff=model_diff, flags=self.flags, callback=self._print_callback
+                )
+            self.snapshot.set_model(model_name=model_name, entries=self.source_entries.get(model_name, {}))
+            self.snapshot.save()
+
+        self.save_snapshot()
+        return diff
+
+    def close(self):
+        """Release the resources held by the adapters, like the clients of the Infrahub adapter in async mode."""
+        for adapter in (self.source, self.destination):
+            if hasattr(adapter, "close"):
+                adapter.close()
+
+    def save_snapshot(self):
+        """Record the state of the source as the state of the last complete sync."""
+        if not self.snapshot:
+            return
+        for model_name, entries in self.source_entries.items():
+            self.snapshot.set_model(model_name=model_name, entries=entries)
+        self.snapshot.complete(started_at=self.started_at, model_names=self.top_level)
+        self.snapshot.save()
@@ -0,0 +1,109 @@
+import gzip
+import hashlib
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from diffsync import DiffSyncModel
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILENAME = ".potenda_snapshot.json.gz"
+# Seconds subtracted from the time of the last sync before using it as a changed-since filter,
+# it covers the clock skew between the sync and the source and the objects committed while the last run was starting.
+SNAPSHOT_SAFETY_MARGIN = 300
+
+SnapshotEntry = Tuple[str, Dict[str, Any]]
+
+
+def get_model_data(obj: DiffSyncModel) -> Dict[str, Any]:
+    data = {**obj.get_identifiers(), **obj.get_attrs()}
+    local_id = getattr(obj, "local_id", None)
+    if local_id is not None:
+        data["local_id"] = local_id
+    return data
+
+
+def get_model_hash(obj: DiffSyncModel) -> str:
+    """Return the hash of the content of a model, the local id of the object in the source is not part of the content."""
+    content = json.dumps({**obj.get_identifiers(), **obj.get_attrs()}, sort_keys=True, default=str)
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
+
+class SyncSnapshot:
+    """State of the source at the time of the last sync, stored as a gzip compressed JSON file.
+
+    For each model, the snapshot keeps the hash and the data of each object indexed by its unique id.
+    The models are recorded as soon as they have been synced so the snapshot is also the checkpoint of a run,
+    a run that failed halfway will only find differences for the models that haven't been synced.
+    `synced_at` is the time at which the last complete run started, it's only updated once all the models have been synced.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        synced_at: Optional[str] = None,
+        models: Optional[Dict[str, Dict[str, SnapshotEntry]]] = None,
+    ):
+        self.path = Path(path)
+        self.synced_at = synced_at
+        self.models = models or {}
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SyncSnapshot":
+        """Load the snapshot from the disk, an empty snapshot is returned if the file doesn't exist or can't be used."""
+        path = Path(path)
+        if not path.is_file():
+            return cls(path=path)
+
+        try:
+            with gzip.open(path, "rt", encoding="UTF-8") as file:
+                content = json.load(file)
+        except (OSError, ValueError):
+            return cls(path=path)
+
+        if content.get("version") != SNAPSHOT_VERSION:
+            return cls(path=path)
+
+        models = {
+            model_name: {unique_id: (entry[0], entry[1]) for unique_id, entry in entries.items()}
+            for model_name, entries in content.get("models", {}).items()
+        }
+        return cls(path=path, synced_at=content.get("synced_at"), models=models)
+
+    def save(self) -> None:
+        """Write the snapshot to a temporary file first and move it in place, a failure can't leave a truncated file behind."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        content = {"version": SNAPSHOT_VERSION, "synced_at": self.synced_at, "models": self.models}
+
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="UTF-8") as file:
+            json.dump(content, file, separators=(",", ":"), default=str)
+        tmp_path.replace(self.path)
+
+    def is_changed(self, model_name: str, unique_id: str, model_hash: str) -> bool:
+        entry = self.models.get(model_name, {}).get(unique_id)
+        return entry is None or entry[0] != model_hash
+
+    def get_changed_since(self, model_name: str) -> Optional[str]:
+        """Return the time after which the objects of a model must be loaded from the source.
+
+        None is returned if all the objects must be loaded, when no run has completed yet
+        or when the model has never been synced.
+        """
+        if not self.synced_at or model_name not in self.models:
+            return None
+        synced_at = datetime.fromisoformat(self.synced_at)
+        return (synced_at - timedelta(seconds=SNAPSHOT_SAFETY_MARGIN)).isoformat()
+
+    def get_entries(self, model_name: str) -> Dict[str, SnapshotEntry]:
+        return self.models.get(model_name, {})
+
+    def set_model(self, model_name: str, entries: Dict[str, SnapshotEntry]) -> None:
+        self.models[model_name] = entries
+
+    def complete(self, started_at: str, model_names: Iterable[str]) -> None:
+        """Mark the run started at `started_at` as complete, the models that are no longer synced are dropped."""
+        model_names = set(model_names)
+        self.models = {name: entries for name, entries in self.models.items() if name in model_names}
+        self.synced_at = started_at
@@ -0,0 +1,157 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from diffsync import Adapter, DiffSyncModel
+from infrahub_sync import DiffSyncMixin, SyncAdapter, SyncInstance
+from potenda import Potenda
+from potenda.snapshot import SNAPSHOT_SAFETY_MARGIN, SyncSnapshot
+
+SOURCE: Dict[str, Dict[str, Tuple[str, str]]] = {}
+CREATED: List[Tuple[str, str]] = []
+FAILING: List[str] = []
+
+
+class Tag(DiffSyncModel):
+    _modelname = "Tag"
+    _identifiers = ("name",)
+    _attributes = ("description",)
+
+    name: str
+    description: Optional[str] = None
+    local_id: Optional[str] = None
+
+    @classmethod
+    def create(cls, adapter, ids, attrs):
+        if cls._modelname in FAILING:
+            raise ValueError(f"Unable to create {ids['name']}")
+        CREATED.append((cls._modelname, ids["name"]))
+        return super().create(adapter, ids, attrs)
+
+
+class Site(Tag):
+    _modelname = "Site"
+
+
+class SourceAdapter(DiffSyncMixin, Adapter):
+    Tag = Tag
+    Site = Site
+    supports_changed_since = True
+
+    def __init__(self, *args, changed: Optional[List[str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.changed = changed or []
+
+    def model_loader(self, model_name, model):
+        changed_since = self.get_changed_since(model_name=model_name)
+        for local_id, (name, description) in SOURCE.get(model_name, {}).items():
+            if changed_since and local_id not in self.changed:
+                continue
+            item = model(name=name, description=description, local_id=local_id)
+            if changed_since:
+                self.update_or_add_model_instance(item)
+            else:
+                self.add(item)
+
+
+class DestinationAdapter(DiffSyncMixin, Adapter):
+    Tag = Tag
+    Site = Site
+
+    def model_loader(self, model_name, model):
+        for created_model, name in CREATED:
+            if created_model == model_name:
+                self.add(model(name=name, description=SOURCE[model_name][name][1]))
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    SOURCE.clear()
+    SOURCE.update({"Tag": {"t1": ("t1", "red"), "t2": ("t2", "blue")}, "Site": {"s1": ("s1", "paris")}})
+    CREATED.clear()
+    FAILING.clear()
+
+
+def run_sync(path, top_level: List[str], changed: Optional[List[str]] = None) -> Potenda:
+    config = SyncInstance(
+        name="test", source=SyncAdapter(name="source"), destination=SyncAdapter(name="destination"), directory="."
+    )
+    ptd = Potenda(
+        source=SourceAdapter(changed=changed),
+        destination=DestinationAdapter(),
+        config=config,
+        top_level=top_level,
+        snapshot=SyncSnapshot.load(path),
+    )
+    ptd.source_load()
+    ptd.destination_load()
+    mydiff = ptd.diff()
+    if mydiff.has_diffs():
+        ptd.sync(diff=mydiff)
+    else:
+        ptd.save_snapshot()
+    return ptd
+
+
+def test_snapshot_save_load(tmp_path):
+    path = tmp_path / "snapshot.json.gz"
+    snapshot = SyncSnapshot(path=path)
+    snapshot.set_model(model_name="Tag", entries={"t1": ("abcd", {"name": "t1", "local_id": "1"})})
+    snapshot.set_model(model_name="Site", entries={})
+    snapshot.complete(started_at="2024-05-01T10:00:00+00:00", model_names=["Tag"])
+    snapshot.save()
+
+    loaded = SyncSnapshot.load(path)
+    assert loaded.synced_at == "2024-05-01T10:00:00+00:00"
+    assert loaded.models == {"Tag": {"t1": ("abcd", {"name": "t1", "local_id": "1"})}}
+    assert not loaded.is_changed(model_name="Tag", unique_id="t1", model_hash="abcd")
+    assert loaded.is_changed(model_name="Tag", unique_id="t1", model_hash="efgh")
+
+    changed_since = datetime.fromisoformat(loaded.get_changed_since(model_name="Tag"))
+    assert (datetime.fromisoformat(loaded.synced_at) - changed_since).total_seconds() == SNAPSHOT_SAFETY_MARGIN
+    assert loaded.get_changed_since(model_name="Site") is None
+
+    path.write_bytes(b"not a snapshot")
+    assert SyncSnapshot.load(path).models == {}
+
+
+def test_incremental_sync(tmp_path):
+    path = tmp_path / "snapshot.json.gz"
+    run_sync(path=path, top_level=["Tag", "Site"])
+    assert CREATED == [("Tag", "t1"), ("Tag", "t2"), ("Site", "s1")]
+
+    SOURCE["Tag"]["t3"] = ("t3", "green")
+    ptd = run_sync(path=path, top_level=["Tag", "Site"], changed=["t3"])
+    assert set(ptd.source.changed_since) == {"Tag", "Site"}
+    assert CREATED[3:] == [("Tag", "t3")]
+    assert set(SyncSnapshot.load(path).models["Tag"]) == {"t1", "t2", "t3"}
+
+
+def test_incremental_sync_resume_after_failure(tmp_path):
+    path = tmp_path / "snapshot.json.gz"
+    FAILING.append("Site")
+    with pytest.raises(ValueError):
+        run_sync(path=path, top_level=["Tag", "Site"])
+
+    # The models synced before the failure are recorded but the run isn't complete
+    snapshot = SyncSnapshot.load(path)
+    assert snapshot.synced_at is None
+    assert list(snapshot.models) == ["Tag"]
+
+    FAILING.clear()
+    run_sync(path=path, top_level=["Tag", "Site"])
+    assert CREATED == [("Tag", "t1"), ("Tag", "t2"), ("Site", "s1")]
+    assert SyncSnapshot.load(path).synced_at is not None
+
+
+def test_incremental_sync_new_model(tmp_path):
+    path = tmp_path / "snapshot.json.gz"
+    run_sync(path=path, top_level=["Tag"])
+    assert CREATED == [("Tag", "t1"), ("Tag", "t2")]
+
+    # The model added to the sync isn't in the snapshot yet, all its objects are loaded
+    ptd = run_sync(path=path, top_level=["Tag", "Site"], changed=[])
+    assert list(ptd.source.changed_since) == ["Tag"]
+    assert CREATED[2:] == [("Site", "s1")]
+    assert set(SyncSnapshot.load(path).models) == {"Tag", "Site"}